@@ -0,0 +1,81 @@
+"""
+Per-call overhead of the async detector methods: inline vs. executor dispatch.
+
+Compares each cheap check when it is handed to the shared thread pool (the
+previous behaviour) with the same check run inline on the event loop.
+
+Usage:
+    uv run python benchmarks/bench_async_overhead.py [--calls 20000]
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from deconvolute import CanaryDetector, SignatureDetector
+
+
+async def _measure(label: str, calls: int, fn: Callable[[], Awaitable[object]]) -> None:
+    start = time.perf_counter()
+    for _ in range(calls):
+        await fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<44} {elapsed / calls * 1e6:8.1f} us/call")
+
+
+async def run(calls: int) -> None:
+    canary = CanaryDetector()
+    _, token = canary.inject("System prompt")
+    response = f"A short model response. {token}"
+
+    # The pre-change canary: expensive, so every call hops to the executor.
+    offloaded_canary = CanaryDetector()
+    offloaded_canary.cost = "expensive"
+
+    short = "Summarize the attached quarterly report in three bullet points."
+    inline_sig = SignatureDetector()
+    offloaded_sig = SignatureDetector(inline_threshold=0)
+
+    print(f"{calls} sequential awaits per case\n")
+    await _measure(
+        "CanaryDetector.a_check (executor)",
+        calls,
+        lambda: offloaded_canary.a_check(response, token=token),
+    )
+    await _measure(
+        "CanaryDetector.a_check (inline)",
+        calls,
+        lambda: canary.a_check(response, token=token),
+    )
+    await _measure(
+        "CanaryDetector.a_clean (executor)",
+        calls,
+        lambda: offloaded_canary.a_clean(response, token),
+    )
+    await _measure(
+        "CanaryDetector.a_clean (inline)",
+        calls,
+        lambda: canary.a_clean(response, token),
+    )
+    await _measure(
+        f"SignatureDetector.a_check {len(short)} chars (executor)",
+        calls,
+        lambda: offloaded_sig.a_check(short),
+    )
+    await _measure(
+        f"SignatureDetector.a_check {len(short)} chars (inline)",
+        calls,
+        lambda: inline_sig.a_check(short),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls))
+
+
+if __name__ == "__main__":
+    main()
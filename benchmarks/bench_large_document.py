@@ -0,0 +1,53 @@
+"""
+Single-pass vs. chunked parallel scanning of one large document.
+
+Usage:
+    uv run python benchmarks/bench_large_document.py [--mb 200] [--workers 4]
+"""
+
+import argparse
+import time
+
+from corpus import BENIGN_SENTENCES, HOSTILE_SENTENCES
+
+from deconvolute import SignatureDetector
+
+
+def _measure(label: str, detector: SignatureDetector, document: bytes) -> None:
+    detector.check(document[:1_000_000])  # warm up threads and caches
+    start = time.perf_counter()
+    result = detector.check(document)
+    elapsed = time.perf_counter() - start
+    megabytes = len(document) / 1_000_000
+    print(
+        f"{label:<32} {elapsed:7.3f}s  {megabytes / elapsed:8.1f} MB/s  "
+        f"matches={result.metadata.get('matches', [])}"
+    )
+    detector.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    text = " ".join(BENIGN_SENTENCES).encode()
+    document = text * (args.mb * 1_000_000 // len(text))
+    # One threat near the end, so a single pass has to read everything.
+    document += HOSTILE_SENTENCES[0].encode()
+
+    print(f"{len(document) / 1_000_000:.0f} MB document, bundled rules\n")
+    _measure("single pass", SignatureDetector(), document)
+    for chunk_mb in (8, 32):
+        _measure(
+            f"split {chunk_mb} MB x {args.workers} workers",
+            SignatureDetector(
+                split_size=chunk_mb * 1_000_000, split_workers=args.workers
+            ),
+            document,
+        )
+
+
+if __name__ == "__main__":
+    main()
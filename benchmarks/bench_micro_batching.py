@@ -0,0 +1,59 @@
+"""
+Concurrent a_scan() calls with and without a MicroBatcher.
+
+Simulates a service handling many small requests at once: each request awaits
+one scan, and all requests run concurrently on one event loop.
+
+Usage:
+    uv run python benchmarks/bench_micro_batching.py [--requests 5000]
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from corpus import make_corpus
+
+from deconvolute import LanguageDetector, MicroBatcher, Pipeline, SignatureDetector
+from deconvolute.detectors.base import BaseDetector, DetectionResult
+
+
+async def _measure(
+    label: str, docs: list[str], scan: Callable[[str], Awaitable[DetectionResult]]
+) -> None:
+    start = time.perf_counter()
+    await asyncio.gather(*(scan(doc) for doc in docs))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:8.3f}s  {len(docs) / elapsed:10.0f} req/s")
+
+
+async def run(docs: list[str]) -> None:
+    suites: dict[str, list[BaseDetector]] = {
+        # inline_threshold=0 so every a_check goes through the executor.
+        "signature": [SignatureDetector(inline_threshold=0)],
+        "signature+language": [
+            SignatureDetector(inline_threshold=0),
+            LanguageDetector(allowed_languages=["en"], languages_to_load=["en", "de"]),
+        ],
+    }
+    for name, detectors in suites.items():
+        pipeline = Pipeline(detectors)
+        batcher = MicroBatcher(pipeline)
+        await _measure(f"{name}: Pipeline.a_scan", docs, pipeline.a_scan)
+        await _measure(f"{name}: MicroBatcher.scan", docs, batcher.scan)
+        print(f"  mean batch size {batcher.stats().mean_batch_size:.1f}\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5_000)
+    args = parser.parse_args()
+
+    docs = make_corpus(args.requests, doc_sentences=1, hostile_every=50)
+    print(f"{len(docs)} concurrent single-sentence requests\n")
+    asyncio.run(run(docs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Scaling of ProcessPoolEngine with the number of worker processes.
+
+Compares the in-process scan_many() against the engine at increasing worker
+counts. Worker startup (rule compilation) is excluded by warming each pool up
+before timing. Run on a multi-core machine to see the scaling.
+
+Usage:
+    uv run python benchmarks/bench_process_pool.py [--docs 50000] [--workers 1 2 4 8]
+"""
+
+import argparse
+import time
+
+from corpus import make_corpus
+
+from deconvolute import ProcessPoolEngine, SignatureDetector, scan_many
+from deconvolute.detectors.base import BaseDetector
+
+
+def _report(label: str, docs: list[str], elapsed: float, baseline: float) -> None:
+    rate = len(docs) / elapsed
+    print(
+        f"{label:<28} {elapsed:8.3f}s  {rate:10.0f} docs/s  x{baseline / elapsed:5.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=50_000)
+    parser.add_argument("--sentences", type=int, default=20)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    docs = make_corpus(args.docs, doc_sentences=args.sentences, hostile_every=50)
+    detectors: list[BaseDetector] = [SignatureDetector()]
+
+    print(f"Scanning {len(docs)} documents with the bundled signature rules\n")
+
+    start = time.perf_counter()
+    scan_many(docs, detectors=detectors, concurrency=1)
+    baseline = time.perf_counter() - start
+    _report("scan_many (in-process)", docs, baseline, baseline)
+
+    for workers in args.workers:
+        with ProcessPoolEngine(detectors, max_workers=workers) as engine:
+            # Start every worker and compile its rules before timing.
+            engine.scan_many(docs[: workers * engine.chunk_size])
+
+            start = time.perf_counter()
+            engine.scan_many(docs)
+            _report(
+                f"ProcessPoolEngine({workers} workers)",
+                docs,
+                time.perf_counter() - start,
+                baseline,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Throughput of scan_many() / a_scan_many() against per-document scan() loops.
+
+Usage:
+    uv run python benchmarks/bench_scan_many.py [--docs 20000] [--sentences 8]
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Callable
+from functools import partial
+
+from corpus import make_corpus
+
+from deconvolute import (
+    SignatureDetector,
+    a_scan,
+    a_scan_many,
+    scan,
+    scan_many,
+)
+from deconvolute.detectors.base import BaseDetector
+
+
+def _measure(label: str, docs: list[str], fn: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed:8.3f}s  {len(docs) / elapsed:10.0f} docs/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=20_000)
+    parser.add_argument("--sentences", type=int, default=8)
+    args = parser.parse_args()
+
+    docs = make_corpus(args.docs, doc_sentences=args.sentences, hostile_every=50)
+    detectors: list[BaseDetector] = [SignatureDetector()]
+
+    print(f"Scanning {len(docs)} documents with the bundled signature rules\n")
+
+    def loop() -> None:
+        for doc in docs:
+            scan(doc, detectors=detectors)
+
+    async def a_loop() -> None:
+        for doc in docs:
+            await a_scan(doc, detectors=detectors)
+
+    _measure("scan() loop", docs, loop)
+    for concurrency in (1, 2, 4, 8):
+        _measure(
+            f"scan_many(concurrency={concurrency})",
+            docs,
+            partial(scan_many, docs, detectors=detectors, concurrency=concurrency),
+        )
+
+    print()
+    _measure("a_scan() loop", docs, lambda: asyncio.run(a_loop()))
+    for concurrency in (1, 4):
+        _measure(
+            f"a_scan_many(concurrency={concurrency})",
+            docs,
+            lambda c=concurrency: asyncio.run(  # type: ignore[misc]
+                a_scan_many(docs, detectors=detectors, concurrency=c)
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
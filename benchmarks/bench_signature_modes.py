@@ -0,0 +1,81 @@
+"""
+SignatureDetector 'full' vs. 'verdict' mode on clean and hostile corpora.
+
+'verdict' aborts matching at the first matching rule, so the gap grows with
+the number of rules a hostile document trips.
+
+Usage:
+    uv run python benchmarks/bench_signature_modes.py [--docs 20000] [--rules 0]
+
+With --rules N, a synthetic set of N rules is scanned instead of the bundled
+one, each keyed on a word of the hostile phrases.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from corpus import BENIGN_SENTENCES, HOSTILE_SENTENCES, make_corpus
+
+from deconvolute import SignatureDetector
+
+
+def _measure(label: str, detector: SignatureDetector, docs: list[str]) -> None:
+    start = time.perf_counter()
+    flagged = sum(detector.check(doc).threat_detected for doc in docs)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed / len(docs) * 1e6:8.1f} us/doc  ({flagged} flagged)")
+
+
+def _synthetic_rules(directory: Path, count: int) -> Path:
+    # Only words that occur nowhere in the benign sentences, so clean
+    # documents stay clean.
+    benign = " ".join(BENIGN_SENTENCES).lower()
+    words = sorted(
+        {w.strip(".,").lower() for s in HOSTILE_SENTENCES for w in s.split()}
+    )
+    words = [w for w in words if w not in benign]
+    rules = [
+        f"rule synthetic_{i} : generated\n"
+        f'{{ meta: score = "0.5" strings: $s = "{words[i % len(words)]}" nocase '
+        f"condition: $s }}"
+        for i in range(count)
+    ]
+    path = directory / "synthetic.yar"
+    path.write_text("\n".join(rules))
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=20_000)
+    parser.add_argument("--rules", type=int, default=0)
+    args = parser.parse_args()
+
+    corpora = {
+        "clean": make_corpus(args.docs),
+        "hostile": make_corpus(args.docs, hostile_every=1),
+        # Every known phrase, repeated: trips as many rules as possible.
+        "hostile (dense)": [
+            f"[{i}] " + " ".join(HOSTILE_SENTENCES * 4) for i in range(args.docs)
+        ],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rules_path = _synthetic_rules(Path(tmp), args.rules) if args.rules else None
+        detectors = {
+            mode: SignatureDetector(rules_path=rules_path, mode=mode)
+            for mode in ("full", "verdict")
+        }
+
+        rule_set = f"{args.rules} synthetic rules" if args.rules else "bundled rules"
+        print(f"{args.docs} documents per corpus, {rule_set}\n")
+        for name, docs in corpora.items():
+            for mode, detector in detectors.items():
+                _measure(f"{name} / {mode}", detector, docs)
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,29 @@
-from .core.orchestrator import a_scan, guard, scan
-from .detectors.base import DetectionResult
+from .core.batching import MicroBatcher
+from .core.cache import CachedDetector, ResultCache
+from .core.conversation import ConversationScanner
+from .core.limiter import ConcurrencyLimiter
+from .core.models import BatchResult, DetectorReport, ScanReport
+from .core.orchestrator import (
+    a_scan,
+    a_scan_file,
+    a_scan_many,
+    a_scan_report,
+    a_scan_stream,
+    guard,
+    scan,
+    scan_file,
+    scan_many,
+    scan_report,
+    scan_stream,
+)
+from .core.pipeline import Pipeline
+from .core.process import ProcessPoolEngine
+from .core.scheduler import AdaptiveScheduler
+from .detectors.base import DetectionResult, DetectorSpec
 from .detectors.content import LanguageDetector, LanguageResult, SignatureDetector
 from .detectors.integrity import CanaryDetector, CanaryResult
 from .errors import DeconvoluteError, ThreatDetectedError
+from .utils.executor import DetectorExecutor
 
 __version__ = "0.1.0a9"
 
@@ -10,6 +31,27 @@ __all__ = [
     "guard",
     "scan",
     "a_scan",
+    "scan_many",
+    "a_scan_many",
+    "scan_stream",
+    "a_scan_stream",
+    "scan_file",
+    "a_scan_file",
+    "scan_report",
+    "a_scan_report",
+    "Pipeline",
+    "MicroBatcher",
+    "ConversationScanner",
+    "ConcurrencyLimiter",
+    "BatchResult",
+    "ScanReport",
+    "DetectorReport",
+    "AdaptiveScheduler",
+    "ResultCache",
+    "CachedDetector",
+    "ProcessPoolEngine",
+    "DetectorSpec",
+    "DetectorExecutor",
     "CanaryDetector",
     "CanaryResult",
     "DetectionResult",
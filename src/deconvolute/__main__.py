@@ -0,0 +1,5 @@
+import sys
+
+from deconvolute.cli import main
+
+sys.exit(main())
@@ -0,0 +1,389 @@
+"""
+Command line interface.
+
+    deconvolute scan docs/ "exports/**/*.txt" --workers 8 > results.jsonl
+    find kb -name '*.md' | deconvolute scan - --rules rules/
+    deconvolute profile-rules samples/ --rules rules/ --top 20
+    deconvolute optimize-rules rules/ optimized/ --samples samples/
+
+Each scanned file is written as one JSON line. Throughput statistics are
+printed to stderr at the end. The exit status is 0 if no threat was found, 1 if
+any file was flagged, and 2 if files could not be scanned (or on usage errors).
+
+`profile-rules` prints the rules that are most expensive on a sample corpus
+and the strings YARA flags as slow. `optimize-rules` writes a compacted copy of
+a rule set and compares it with the original.
+"""
+
+import argparse
+import fnmatch
+import glob
+import json
+import math
+import os
+import sys
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, TextIO
+
+from deconvolute import __version__
+from deconvolute.core.models import FileReport
+from deconvolute.core.process import ProcessPoolEngine, scan_one_file
+from deconvolute.core.timeouts import TimeoutPolicy, resolve_timeout
+from deconvolute.detectors.base import DetectorSpec
+from deconvolute.detectors.content.language.engine import LanguageDetector
+from deconvolute.detectors.content.signature.engine import SignatureDetector
+from deconvolute.detectors.content.signature.optimizer import optimize_rules
+from deconvolute.errors import DeconvoluteError
+
+EXIT_CLEAN = 0
+EXIT_THREATS = 1
+EXIT_ERRORS = 2
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point of the `deconvolute` console script."""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return int(args.handler(args))
+    except DeconvoluteError as e:
+        print(f"deconvolute: error: {e}", file=sys.stderr)
+        return EXIT_ERRORS
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="deconvolute", description="Deconvolute security scanner."
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {__version__}"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scan = commands.add_parser(
+        "scan",
+        help="Scan files and write one JSON line per file.",
+        description=(
+            "Scans files across a pool of worker processes and streams the "
+            "results as JSONL."
+        ),
+    )
+    scan.add_argument(
+        "inputs",
+        nargs="+",
+        metavar="PATH",
+        help=(
+            "Files, directories (walked recursively) or glob patterns. "
+            "'-' reads newline-separated paths from stdin."
+        ),
+    )
+    scan.add_argument(
+        "--include",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Only scan files in directories whose name matches (repeatable).",
+    )
+    scan.add_argument(
+        "--rules", help="YARA rule file or directory (default: bundled rules)."
+    )
+    scan.add_argument(
+        "--languages",
+        help="Comma-separated ISO 639-1 codes. Adds a LanguageDetector policy.",
+    )
+    scan.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: CPU count). 0 scans in-process.",
+    )
+    scan.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Time budget per file in seconds (default: DECONVOLUTE_TIMEOUT_SEC).",
+    )
+    scan.add_argument(
+        "--on-timeout",
+        choices=["fail_closed", "fail_open"],
+        default="fail_closed",
+        help="Verdict for files that exceed the budget.",
+    )
+    scan.add_argument("--encoding", default="utf-8", help="Text encoding of files.")
+    scan.add_argument(
+        "-o", "--output", help="Write JSONL here instead of stdout.", metavar="FILE"
+    )
+    scan.add_argument(
+        "-q", "--quiet", action="store_true", help="Do not print statistics."
+    )
+    scan.set_defaults(handler=_run_scan)
+
+    profile = commands.add_parser(
+        "profile-rules",
+        help="Rank signature rules by their cost on a sample corpus.",
+        description=(
+            "Scans a sample corpus with each rule on its own and reports the "
+            "most expensive rules and the strings with weak atoms."
+        ),
+    )
+    profile.add_argument(
+        "inputs",
+        nargs="+",
+        metavar="PATH",
+        help="Sample files, directories or glob patterns ('-' reads stdin).",
+    )
+    profile.add_argument(
+        "--include",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Only read files in directories whose name matches (repeatable).",
+    )
+    profile.add_argument(
+        "--rules", help="YARA rule file or directory (default: bundled rules)."
+    )
+    profile.add_argument(
+        "--top", type=int, default=10, help="Rules to list (default: 10)."
+    )
+    profile.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timing runs per rule, the fastest counts (default: 3).",
+    )
+    profile.add_argument(
+        "--json", action="store_true", help="Print the full report as JSON."
+    )
+    profile.set_defaults(handler=_run_profile)
+
+    optimize = commands.add_parser(
+        "optimize-rules",
+        help="Write a compacted copy of a signature rule set.",
+        description=(
+            "Drops UTF-16 string variants, merges rules of the same category "
+            "and removes duplicate strings, then compares both rule sets."
+        ),
+    )
+    optimize.add_argument("rules", help="YARA rule file or directory.")
+    optimize.add_argument("output", help="Directory for the optimized rule files.")
+    optimize.add_argument(
+        "--samples",
+        nargs="+",
+        default=None,
+        metavar="PATH",
+        help="Sample files, directories or globs to time and compare both sets.",
+    )
+    optimize.add_argument(
+        "--keep-wide", action="store_true", help="Keep 'wide' string variants."
+    )
+    optimize.add_argument(
+        "--no-merge", action="store_true", help="Keep every rule separate."
+    )
+    optimize.set_defaults(handler=_run_optimize)
+    return parser
+
+
+def _run_scan(args: argparse.Namespace) -> int:
+    if args.workers < 0:
+        raise DeconvoluteError(f"--workers must be >= 0, got {args.workers}.")
+
+    specs = _detector_specs(args.rules, args.languages)
+    timeout = resolve_timeout(args.timeout)
+    paths = iter_paths(args.inputs, args.include, sys.stdin)
+    stats = _ScanStats()
+
+    output: TextIO = sys.stdout
+    if args.output:
+        output = open(args.output, "w", encoding="utf-8")
+    try:
+        for report in _scan_paths(
+            specs, paths, args.workers, args.encoding, timeout, args.on_timeout
+        ):
+            output.write(json.dumps(report_to_json(report)) + "\n")
+            output.flush()
+            stats.add(report)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if not args.quiet:
+        stats.print(sys.stderr)
+
+    if stats.threats:
+        return EXIT_THREATS
+    return EXIT_ERRORS if stats.errors else EXIT_CLEAN
+
+
+def _run_profile(args: argparse.Namespace) -> int:
+    if args.repeat < 1:
+        raise DeconvoluteError(f"--repeat must be >= 1, got {args.repeat}.")
+
+    documents = _read_samples(args.inputs, args.include)
+    detector = SignatureDetector(rules_path=args.rules)
+    report = detector.profile(documents, repeat=args.repeat)
+    if args.json:
+        print(report.model_dump_json(indent=2))
+    else:
+        print(report.format(top=args.top))
+    return EXIT_CLEAN
+
+
+def _run_optimize(args: argparse.Namespace) -> int:
+    documents = None
+    if args.samples is not None:
+        documents = _read_samples(args.samples, [])
+
+    report = optimize_rules(
+        args.rules,
+        args.output,
+        documents=documents,
+        drop_wide=not args.keep_wide,
+        merge=not args.no_merge,
+    )
+    print(report.format())
+    return EXIT_CLEAN
+
+
+def _read_samples(inputs: Sequence[str], include: Sequence[str]) -> list[bytes]:
+    documents = []
+    for path in iter_paths(inputs, include, sys.stdin):
+        try:
+            with open(path, "rb") as f:
+                documents.append(f.read())
+        except OSError as e:
+            raise DeconvoluteError(f"Cannot read {path}: {e}") from e
+    return documents
+
+
+def _scan_paths(
+    specs: list[DetectorSpec],
+    paths: Iterable[str],
+    workers: int,
+    encoding: str,
+    timeout: float | None,
+    on_timeout: TimeoutPolicy,
+) -> Iterator[FileReport]:
+    """Scans in-process for workers=0, otherwise in a process pool."""
+    # The pool resolves None to the default budget, so pass "unbounded" as inf.
+    budget = timeout if timeout is not None else math.inf
+
+    if workers == 0:
+        detectors = [spec.build() for spec in specs]
+        for path in paths:
+            yield scan_one_file(detectors, path, encoding, timeout, on_timeout)
+        return
+
+    with ProcessPoolEngine(specs, max_workers=workers) as engine:
+        yield from engine.scan_files(paths, encoding, budget, on_timeout)
+
+
+def _detector_specs(rules: str | None, languages: str | None) -> list[DetectorSpec]:
+    specs = [DetectorSpec.of(SignatureDetector, rules_path=rules)]
+    if languages:
+        codes = [code.strip() for code in languages.split(",") if code.strip()]
+        specs.append(DetectorSpec.of(LanguageDetector, allowed_languages=codes))
+    return specs
+
+
+def iter_paths(
+    inputs: Sequence[str], include: Sequence[str], stdin: TextIO
+) -> Iterator[str]:
+    """
+    Expands command line inputs into file paths, lazily and without duplicates.
+
+    Args:
+        inputs: Files, directories, glob patterns, or '-' for paths on stdin.
+        include: fnmatch patterns applied to file names found in directories.
+            Explicitly named files are always included.
+        stdin: Where '-' reads paths from.
+
+    Yields:
+        str: File paths. Named paths that do not exist are passed through, so
+        they are reported as errors rather than silently skipped.
+    """
+    seen: set[str] = set()
+
+    def emit(path: str) -> Iterator[str]:
+        if path not in seen:
+            seen.add(path)
+            yield path
+
+    for item in inputs:
+        if item == "-":
+            for line in stdin:
+                if line.strip():
+                    yield from emit(line.rstrip("\n"))
+        elif os.path.isdir(item):
+            for path in _walk(item, include):
+                yield from emit(path)
+        elif _GLOB_CHARS.intersection(item):
+            for match in sorted(glob.iglob(item, recursive=True)):
+                if os.path.isdir(match):
+                    for path in _walk(match, include):
+                        yield from emit(path)
+                elif os.path.isfile(match):
+                    yield from emit(match)
+        else:
+            yield from emit(item)
+
+
+def _walk(directory: str, include: Sequence[str]) -> Iterator[str]:
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if not include or any(fnmatch.fnmatch(name, p) for p in include):
+                yield os.path.join(root, name)
+
+
+def report_to_json(report: FileReport) -> dict[str, Any]:
+    """Flattens a FileReport into the JSONL record written by `scan`."""
+    record: dict[str, Any] = {
+        "path": report.path,
+        "size_bytes": report.size_bytes,
+        "threat_detected": report.threat_detected,
+    }
+    if report.result is not None:
+        record["component"] = report.result.component
+        record["metadata"] = report.result.model_dump(mode="json")["metadata"]
+    record["detector_ms"] = {k: round(v, 3) for k, v in report.detector_ms.items()}
+    record["error"] = report.error
+    return record
+
+
+class _ScanStats:
+    """Running totals for the summary printed after a scan."""
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.files = 0
+        self.bytes = 0
+        self.threats = 0
+        self.errors = 0
+        self.detector_ms: dict[str, float] = {}
+
+    def add(self, report: FileReport) -> None:
+        self.files += 1
+        self.bytes += report.size_bytes
+        self.threats += report.threat_detected
+        self.errors += report.error is not None
+        for name, ms in report.detector_ms.items():
+            self.detector_ms[name] = self.detector_ms.get(name, 0.0) + ms
+
+    def print(self, stream: TextIO) -> None:
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        megabytes = self.bytes / 1_000_000
+        print(
+            f"Scanned {self.files} files ({megabytes:.1f} MB) in {elapsed:.2f}s: "
+            f"{self.files / elapsed:.1f} files/s, {megabytes / elapsed:.1f} MB/s",
+            file=stream,
+        )
+        print(f"Threats: {self.threats}  Errors: {self.errors}", file=stream)
+        for name, ms in sorted(self.detector_ms.items()):
+            print(f"  {name:<24} {ms / 1000:8.2f}s total", file=stream)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,25 @@
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, Protocol
 
-from deconvolute.detectors.base import BaseDetector
+from deconvolute.core.limiter import ConcurrencyLimiter
+from deconvolute.core.timeouts import TimeoutPolicy, resolve_timeout, validate_policy
+from deconvolute.detectors.base import BaseDetector, DetectionResult
+
+# Request keyword naming the conversation for input scanning. It is removed
+# before the request is forwarded.
+SESSION_ID_KWARG = "deconvolute_session_id"
+
+
+class MessageScanner(Protocol):
+    """Scans the messages of a request before it is sent (`ConversationScanner`)."""
+
+    def scan(
+        self, messages: Sequence[Any], session_id: str | None = None
+    ) -> DetectionResult: ...
+
+    async def a_scan(
+        self, messages: Sequence[Any], session_id: str | None = None
+    ) -> DetectionResult: ...
 
 
 class BaseProxy:
@@ -19,6 +38,13 @@ class BaseProxy:
             Used to modify the input prompt (e.g. Canary).
         _scanners (list[BaseDetector]): Detectors that implement 'check'.
             Used to scan the output response (e.g. Language, Canary).
+        _timeout (float | None): Time budget in seconds for validating one
+            response, or None if unbounded.
+        _on_timeout (TimeoutPolicy): What to do when the budget runs out.
+        _limiter (ConcurrencyLimiter | None): Bounds concurrent validations
+            (async proxies only).
+        _conversations (MessageScanner | None): Scans the request messages
+            before they are sent.
     """
 
     def __init__(
@@ -26,6 +52,10 @@ class BaseProxy:
         client: Any,
         detectors: list[BaseDetector],
         api_key: str | None = None,
+        timeout: float | None = None,
+        on_timeout: TimeoutPolicy = "fail_closed",
+        limiter: ConcurrencyLimiter | None = None,
+        conversations: MessageScanner | None = None,
     ):
         """
         Initializes the proxy infrastructure.
@@ -35,6 +65,13 @@ class BaseProxy:
             detectors: A strict list of detectors. The factory (guard) is responsible
                 for resolving defaults before calling this.
             api_key: Optional Deconvolute API key.
+            timeout: Time budget in seconds for output validation. If None, the
+                global default applies (see `resolve_timeout()`).
+            on_timeout: 'fail_closed' blocks the response when the budget runs
+                out, 'fail_open' lets it through.
+            limiter: Optional ConcurrencyLimiter for output validation.
+            conversations: Optional ConversationScanner for the request
+                messages.
         """
         # Enforce Abstract Nature
         if type(self) is BaseProxy:
@@ -45,6 +82,11 @@ class BaseProxy:
         self._client = client
         self.api_key = api_key
         self._detectors = detectors
+        self._timeout = resolve_timeout(timeout)
+        validate_policy(on_timeout)
+        self._on_timeout: TimeoutPolicy = on_timeout
+        self._limiter = limiter
+        self._conversations = conversations
 
         # Capability-Based Sorting
 
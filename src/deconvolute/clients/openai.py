@@ -1,8 +1,18 @@
+from functools import cached_property
+from types import TracebackType
 from typing import Any, Protocol, cast
 
-from deconvolute.clients.base import BaseProxy
-from deconvolute.detectors.base import BaseDetector
-from deconvolute.errors import DeconvoluteError, ThreatDetectedError
+from deconvolute.clients.base import SESSION_ID_KWARG, BaseProxy, MessageScanner
+from deconvolute.core.limiter import ConcurrencyLimiter
+from deconvolute.core.timeouts import (
+    TimeoutPolicy,
+    deadline_kwargs,
+    timeout_result,
+    wait_within,
+)
+from deconvolute.detectors.base import BaseDetector, DetectionResult
+from deconvolute.errors import DeconvoluteError, ScanTimeoutError, ThreatDetectedError
+from deconvolute.utils.deadline import Deadline
 from deconvolute.utils.logger import get_logger
 
 logger = get_logger()
@@ -25,7 +35,7 @@ class OpenAIProxy(BaseProxy):
     ensuring full compatibility with the original SDK.
     """
 
-    @property
+    @cached_property
     def chat(self) -> "ChatProxy":
         """
         Access the intercepted 'chat' namespace.
@@ -34,7 +44,29 @@ class OpenAIProxy(BaseProxy):
             ChatProxy: A wrapper around the original `client.chat` object that
                 enables interception of completion creation calls.
         """
-        return ChatProxy(self._client.chat, self._injectors, self._scanners)
+        return ChatProxy(
+            self._client.chat,
+            self._injectors,
+            self._scanners,
+            self._timeout,
+            self._on_timeout,
+            self._conversations,
+        )
+
+    def close(self) -> None:
+        """Closes the underlying OpenAI client (its HTTP connection pool)."""
+        self._client.close()
+
+    def __enter__(self) -> "OpenAIProxy":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
 
 
 class AsyncOpenAIProxy(BaseProxy):
@@ -45,7 +77,7 @@ class AsyncOpenAIProxy(BaseProxy):
     asyncio event loops. It intercepts `await client.chat.completions.create`.
     """
 
-    @property
+    @cached_property
     def chat(self) -> "AsyncChatProxy":
         """
         Access the intercepted async 'chat' namespace.
@@ -53,7 +85,30 @@ class AsyncOpenAIProxy(BaseProxy):
         Returns:
             AsyncChatProxy: A wrapper around the original `client.chat` object.
         """
-        return AsyncChatProxy(self._client.chat, self._injectors, self._scanners)
+        return AsyncChatProxy(
+            self._client.chat,
+            self._injectors,
+            self._scanners,
+            self._timeout,
+            self._on_timeout,
+            self._limiter,
+            self._conversations,
+        )
+
+    async def close(self) -> None:
+        """Closes the underlying AsyncOpenAI client (its HTTP connection pool)."""
+        await self._client.close()
+
+    async def __aenter__(self) -> "AsyncOpenAIProxy":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
 
 
 class ChatProxy:
@@ -69,16 +124,22 @@ class ChatProxy:
         chat_module: Any,
         injectors: list[BaseDetector],
         scanners: list[BaseDetector],
+        timeout: float | None = None,
+        on_timeout: TimeoutPolicy = "fail_closed",
+        conversations: MessageScanner | None = None,
     ):
         self._chat_module = chat_module
         self._injectors = injectors
         self._scanners = scanners
+        self._timeout = timeout
+        self._on_timeout = on_timeout
+        self._conversations = conversations
 
     def __getattr__(self, name: str) -> Any:
         # Pass through other chat methods (e.g. format)
         return getattr(self._chat_module, name)
 
-    @property
+    @cached_property
     def completions(self) -> "CompletionsProxy":
         """
         Access the intercepted 'completions' namespace.
@@ -87,7 +148,12 @@ class ChatProxy:
             CompletionsProxy: The core interceptor that wraps the `create` method.
         """
         return CompletionsProxy(
-            self._chat_module.completions, self._injectors, self._scanners
+            self._chat_module.completions,
+            self._injectors,
+            self._scanners,
+            self._timeout,
+            self._on_timeout,
+            self._conversations,
         )
 
 
@@ -106,10 +172,16 @@ class CompletionsProxy:
         completions_module: Any,
         injectors: list[BaseDetector],
         scanners: list[BaseDetector],
+        timeout: float | None = None,
+        on_timeout: TimeoutPolicy = "fail_closed",
+        conversations: MessageScanner | None = None,
     ):
         self._module = completions_module
         self._injectors = injectors
         self._scanners = scanners
+        self._timeout = timeout
+        self._on_timeout = on_timeout
+        self._conversations = conversations
 
     def create(self, *args: Any, **kwargs: Any) -> Any:
         """
@@ -130,12 +202,19 @@ class CompletionsProxy:
 
         Raises:
             ThreatDetectedError: If a detector (e.g. Language, Canary) identifies a
-                threat in any of the generated choices.
+                threat in any of the generated choices, or the conversation
+                scanner flags a request message.
             DeconvoluteError: If integrity checks are enabled but the request
                 configuration is invalid (e.g. missing a 'system' message).
         """
 
-        # 1. Input (Inject)
+        # 1. Input (Scan)
+        # Messages verified on earlier turns of the session are skipped.
+        session_id = kwargs.pop(SESSION_ID_KWARG, None)
+        if self._conversations is not None and "messages" in kwargs:
+            _check_input(self._conversations.scan(kwargs["messages"], session_id))
+
+        # 2. Input (Inject)
         # layer_states holds the secrets (tokens) generated by injectors
         # to be verified later by the scanners.
         layer_states: dict[BaseDetector, Any] = {}
@@ -143,7 +222,7 @@ class CompletionsProxy:
         if self._injectors and "messages" in kwargs:
             self._apply_input_modifiers(kwargs["messages"], layer_states)
 
-        # 2. Execution (Call)
+        # 3. Execution (Call)
         # Pass-through: If streaming is enabled, we skip output validation
         # because we cannot easily block and scan a generator yet.
         if kwargs.get("stream"):
@@ -155,7 +234,7 @@ class CompletionsProxy:
         # Standard blocking call
         response = self._module.create(*args, **kwargs)
 
-        # 3. Output (Check & Clean)
+        # 4. Output (Check & Clean)
         if self._scanners:
             self._apply_output_validators(response, layer_states)
 
@@ -203,7 +282,14 @@ class CompletionsProxy:
         If a threat is found in any choice, the entire response is blocked.
         If the response is safe, it cleans artifacts (like Canary tokens) from
         all choices in-place.
+
+        All choices share one time budget. When it runs out, the timeout policy
+        decides: 'fail_closed' blocks the response, 'fail_open' skips the
+        remaining checks but still cleans every choice.
         """
+        deadline = Deadline(self._timeout)
+        timed_out = False
+
         # Iterate over every generated choice (usually 1, but could be n > 1)
         for choice in response.choices:
             message_obj = choice.message
@@ -213,13 +299,24 @@ class CompletionsProxy:
             if not content:
                 continue
 
-            for detector in self._scanners:
+            for position, detector in enumerate(self._scanners):
                 token = layer_states.get(detector)
 
-                # If any choice fails, the entire batch is compromised.
-                result = detector.check(content, token=token)
-
-                if result.threat_detected:
+                if timed_out:
+                    result = None
+                else:
+                    # If any choice fails, the entire batch is compromised.
+                    try:
+                        result = detector.check(
+                            content, token=token, **deadline_kwargs(deadline)
+                        )
+                    except ScanTimeoutError:
+                        result = _validation_timed_out(
+                            self._scanners, position, deadline, self._on_timeout
+                        )
+                        timed_out = True
+
+                if result is not None and result.threat_detected:
                     # We define the component as "Choice X -> Detector Y" for clarity
                     raise ThreatDetectedError(
                         (
@@ -247,21 +344,35 @@ class AsyncChatProxy:
         chat_module: Any,
         injectors: list[BaseDetector],
         scanners: list[BaseDetector],
+        timeout: float | None = None,
+        on_timeout: TimeoutPolicy = "fail_closed",
+        limiter: ConcurrencyLimiter | None = None,
+        conversations: MessageScanner | None = None,
     ):
         self._chat_module = chat_module
         self._injectors = injectors
         self._scanners = scanners
+        self._timeout = timeout
+        self._on_timeout = on_timeout
+        self._limiter = limiter
+        self._conversations = conversations
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._chat_module, name)
 
-    @property
+    @cached_property
     def completions(self) -> "AsyncCompletionsProxy":
         """
         Access the intercepted async 'completions' namespace.
         """
         return AsyncCompletionsProxy(
-            self._chat_module.completions, self._injectors, self._scanners
+            self._chat_module.completions,
+            self._injectors,
+            self._scanners,
+            self._timeout,
+            self._on_timeout,
+            self._limiter,
+            self._conversations,
         )
 
 
@@ -278,10 +389,18 @@ class AsyncCompletionsProxy:
         completions_module: Any,
         injectors: list[BaseDetector],
         scanners: list[BaseDetector],
+        timeout: float | None = None,
+        on_timeout: TimeoutPolicy = "fail_closed",
+        limiter: ConcurrencyLimiter | None = None,
+        conversations: MessageScanner | None = None,
     ):
         self._module = completions_module
         self._injectors = injectors
         self._scanners = scanners
+        self._timeout = timeout
+        self._on_timeout = on_timeout
+        self._limiter = limiter
+        self._conversations = conversations
 
     async def create(self, *args: Any, **kwargs: Any) -> Any:
         """
@@ -295,9 +414,15 @@ class AsyncCompletionsProxy:
             ChatCompletion: The sanitized OpenAI response object.
 
         Raises:
-            ThreatDetectedError: If a threat is detected in the response.
+            ThreatDetectedError: If a threat is detected in the response or in
+                the request messages.
             DeconvoluteError: If the request configuration is invalid.
         """
+        session_id = kwargs.pop(SESSION_ID_KWARG, None)
+        if self._conversations is not None and "messages" in kwargs:
+            result = await self._conversations.a_scan(kwargs["messages"], session_id)
+            _check_input(result)
+
         layer_states: dict[BaseDetector, Any] = {}
 
         if self._injectors and "messages" in kwargs:
@@ -338,7 +463,46 @@ class AsyncCompletionsProxy:
     async def _apply_output_validators(
         self, response: Any, layer_states: dict[BaseDetector, str]
     ) -> None:
-        """Async version of output validator."""
+        """
+        Async version of output validator. Late checks are cancelled.
+
+        With a limiter, validation first waits for a slot. A response that is
+        shed, or whose budget runs out in the queue, gets the same treatment as
+        a timeout: blocked under a fail-closed policy, otherwise returned
+        unchecked but cleaned.
+        """
+        deadline = Deadline(self._timeout)
+        if self._limiter is None:
+            await self._validate(response, layer_states, deadline, None)
+            return
+
+        verdict = await self._limiter.admit(self._scanners, deadline, self._on_timeout)
+        if verdict is not None:
+            await self._validate(response, layer_states, deadline, verdict)
+            return
+        try:
+            await self._validate(response, layer_states, deadline, None)
+        finally:
+            self._limiter.release()
+
+    async def _validate(
+        self,
+        response: Any,
+        layer_states: dict[BaseDetector, str],
+        deadline: Deadline,
+        verdict: DetectionResult | None,
+    ) -> None:
+        """
+        Runs the scanners on every choice. A `verdict` given up front (from the
+        limiter) replaces the checks.
+        """
+        if verdict is not None and verdict.threat_detected:
+            raise ThreatDetectedError(
+                f"Output validation not run: {verdict.metadata['reason']}",
+                result=verdict,
+            )
+        timed_out = verdict is not None
+
         # Iterate over every generated choice (usually 1, but could be n > 1)
         for choice in response.choices:
             message_obj = choice.message
@@ -348,13 +512,26 @@ class AsyncCompletionsProxy:
             if not content:
                 continue
 
-            for detector in self._scanners:
+            for position, detector in enumerate(self._scanners):
                 token = layer_states.get(detector)
 
-                # If any choice fails, the entire batch is compromised.
-                result = await detector.a_check(content, token=token)
-
-                if result.threat_detected:
+                if timed_out:
+                    result = None
+                else:
+                    # If any choice fails, the entire batch is compromised.
+                    try:
+                        kwargs = deadline_kwargs(deadline)
+                        result = await wait_within(
+                            detector.a_check(content, token=token, **kwargs),
+                            kwargs.get("timeout"),
+                        )
+                    except ScanTimeoutError:
+                        result = _validation_timed_out(
+                            self._scanners, position, deadline, self._on_timeout
+                        )
+                        timed_out = True
+
+                if result is not None and result.threat_detected:
                     # We define the component as "Choice X -> Detector Y" for clarity
                     raise ThreatDetectedError(
                         (
@@ -370,3 +547,31 @@ class AsyncCompletionsProxy:
 
             # Mutate the choice in place
             message_obj.content = content
+
+
+def _validation_timed_out(
+    scanners: list[BaseDetector],
+    position: int,
+    deadline: Deadline,
+    on_timeout: TimeoutPolicy,
+) -> DetectionResult:
+    """Applies the timeout policy when output validation runs out of time."""
+    logger.warning(
+        f"Deconvolute: Output validation exceeded its {deadline.timeout}s budget "
+        f"at {type(scanners[position]).__name__} ({on_timeout})."
+    )
+    return timeout_result(
+        on_timeout, deadline.timeout, scanners[:position], scanners[position:]
+    )
+
+
+def _check_input(result: DetectionResult) -> None:
+    """Blocks a request whose messages were flagged before it is sent."""
+    if result.threat_detected:
+        raise ThreatDetectedError(
+            (
+                "Threat detected in message index "
+                f"{result.metadata.get('message_index')} by {result.component}"
+            ),
+            result=result,
+        )
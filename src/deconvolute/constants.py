@@ -3,9 +3,52 @@ META_LATENCY = "latency_ms"
 META_CONFIDENCE = "confidence_score"
 META_MODEL = "model_version"
 
-# Default timeouts (if needed later)
+# Deadlines (scan, a_scan, scan_many, guard)
+# Default time budget for one scan, in seconds. Overridden by the
+# DECONVOLUTE_TIMEOUT_SEC environment variable ('inf' disables it).
 DEFAULT_TIMEOUT_SEC = 5.0
 
+# Batch scanning (scan_many / a_scan_many)
+# Number of documents handed to a detector in one dispatch.
+DEFAULT_BATCH_CHUNK_SIZE = 64
+# Number of chunks processed concurrently.
+DEFAULT_BATCH_CONCURRENCY = 4
+# Documents sent to a worker process at once (ProcessPoolEngine). Larger than
+# the in-process chunk size to amortize pickling and inter-process overhead.
+DEFAULT_PROCESS_CHUNK_SIZE = 256
+
+# Micro-batching (MicroBatcher)
+# Requests coalesced into one batch at most.
+DEFAULT_MICROBATCH_MAX_SIZE = 64
+# Longest time the first request of a batch waits for others, in seconds.
+DEFAULT_MICROBATCH_MAX_DELAY_SEC = 0.0005
+
+# Conversation scanning (ConversationScanner)
+# Sessions remembered at most. The least recently used session is dropped.
+DEFAULT_CONVERSATION_MAX_SESSIONS = 10_000
+# Verified message fingerprints remembered per session.
+DEFAULT_CONVERSATION_MAX_MESSAGES = 1_000
+# Seconds after its last scan that a session is forgotten.
+DEFAULT_CONVERSATION_IDLE_TTL_SEC = 1800.0
+
+# Async dispatch
+# Inputs up to this many characters are matched inline on the event loop by
+# SignatureDetector's async methods. Below it, the thread handoff costs more
+# than the YARA match itself.
+DEFAULT_SIGNATURE_INLINE_THRESHOLD = 4096
+
+# Signature rules
+# Seconds between polls of the rule sources by SignatureDetector.watch().
+DEFAULT_RULES_WATCH_INTERVAL_SEC = 2.0
+
+# Streaming scans (scan_stream / a_scan_stream)
+# Maximum number of characters scanned in one window.
+DEFAULT_STREAM_WINDOW_SIZE = 1024 * 1024
+# Characters repeated between consecutive windows. Must be at least as long as
+# the longest signature string, otherwise a match split across a window
+# boundary can be missed.
+DEFAULT_STREAM_OVERLAP = 4096
+
 
 # Canary Detector
 
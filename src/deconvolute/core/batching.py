@@ -0,0 +1,196 @@
+import asyncio
+from types import TracebackType
+
+from pydantic import BaseModel, ConfigDict
+
+from deconvolute.constants import (
+    DEFAULT_MICROBATCH_MAX_DELAY_SEC,
+    DEFAULT_MICROBATCH_MAX_SIZE,
+)
+from deconvolute.core.pipeline import Pipeline
+from deconvolute.detectors.base import DetectionResult
+from deconvolute.errors import ConfigurationError, DeconvoluteError
+from deconvolute.utils.logger import get_logger
+
+logger = get_logger()
+
+
+class BatcherStats(BaseModel):
+    """
+    Snapshot of a MicroBatcher's counters.
+
+    Attributes:
+        batches (int): Batches dispatched to the detectors.
+        documents (int): Documents scanned in those batches.
+        pending (int): Requests waiting for the next batch.
+    """
+
+    batches: int
+    documents: int
+    pending: int
+
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Average number of documents per batch (0.0 if none yet)."""
+        return self.documents / self.batches if self.batches else 0.0
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent async scans into batched detector calls.
+
+    Under high concurrency, every `a_scan()` pays its own executor submission
+    and future resolution per detector. A MicroBatcher collects the requests
+    that arrive within `max_delay` seconds (or until `max_batch_size` are
+    waiting) and runs them as one `a_check_batch()` call per detector, which
+    also lets detectors with native batch APIs (e.g. lingua's parallel
+    detection) serve the async path. Each caller still gets its own result.
+
+        batcher = MicroBatcher(Pipeline([SignatureDetector()]))
+
+        async def endpoint(text: str) -> bool:
+            return (await batcher.scan(text)).safe
+
+    Results keep the semantics of `scan()`. The pipeline's timeout applies to
+    each batch from the moment it is dispatched, so a request can wait up to
+    `max_delay` longer than the budget. A batcher belongs to one event loop.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline | None = None,
+        max_batch_size: int = DEFAULT_MICROBATCH_MAX_SIZE,
+        max_delay: float = DEFAULT_MICROBATCH_MAX_DELAY_SEC,
+    ):
+        """
+        Args:
+            pipeline: The pipeline whose detectors, cache, scheduler, executor
+                and timeout settings are used. If None, a default Pipeline is
+                created.
+            max_batch_size: Dispatch as soon as this many requests are waiting.
+            max_delay: Longest time in seconds the first request of a batch
+                waits for others to join.
+
+        Raises:
+            ConfigurationError: If the options are invalid.
+        """
+        if max_batch_size < 1:
+            raise ConfigurationError(
+                f"max_batch_size must be >= 1, got {max_batch_size}."
+            )
+        if max_delay < 0:
+            raise ConfigurationError(f"max_delay must be >= 0, got {max_delay}.")
+
+        self.pipeline = pipeline if pipeline is not None else Pipeline()
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+
+        self._pending: list[tuple[str, asyncio.Future[DetectionResult]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._batches = 0
+        self._documents = 0
+
+    async def scan(self, content: str) -> DetectionResult:
+        """
+        Scans one document as part of the next batch.
+
+        Args:
+            content: The text to analyze.
+
+        Returns:
+            DetectionResult: The same verdict `Pipeline.a_scan()` would return.
+
+        Raises:
+            DeconvoluteError: If the batcher is used from a second event loop
+                while requests of the first are still pending.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._pending or self._in_flight:
+                raise DeconvoluteError(
+                    "MicroBatcher is already in use by another event loop."
+                )
+            self._loop = loop
+
+        future: asyncio.Future[DetectionResult] = loop.create_future()
+        self._pending.append((content, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._dispatch)
+
+        return await future
+
+    async def flush(self) -> None:
+        """Dispatches the waiting requests now and waits for every batch."""
+        self._dispatch()
+        while self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    def stats(self) -> BatcherStats:
+        """Returns the batch counters."""
+        return BatcherStats(
+            batches=self._batches,
+            documents=self._documents,
+            pending=len(self._pending),
+        )
+
+    def _dispatch(self) -> None:
+        """Starts one batch task for the waiting requests."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        # Callers that were cancelled while waiting do not need a scan.
+        batch = [(c, f) for c, f in self._pending if not f.done()]
+        self._pending = []
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _run(
+        self, batch: list[tuple[str, asyncio.Future[DetectionResult]]]
+    ) -> None:
+        """Scans one batch and resolves each caller's future."""
+        self._batches += 1
+        self._documents += len(batch)
+
+        try:
+            results = await self.pipeline.a_scan_chunk(
+                [content for content, _ in batch]
+            )
+        except Exception as e:
+            logger.debug(f"Micro-batch of {len(batch)} documents failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
+    async def __aenter__(self) -> "MicroBatcher":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.flush()
+
+    def __repr__(self) -> str:
+        return (
+            f"MicroBatcher(max_batch_size={self.max_batch_size}, "
+            f"max_delay={self.max_delay}, pipeline={self.pipeline!r})"
+        )
@@ -0,0 +1,301 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any, cast
+
+from pydantic import BaseModel, ConfigDict
+
+from deconvolute.detectors.base import BaseDetector, DetectionResult
+from deconvolute.errors import ConfigurationError
+from deconvolute.utils.hashing import content_digest
+
+CacheKey = tuple[str, bytes, bytes]
+
+
+class CacheStats(BaseModel):
+    """
+    Snapshot of a ResultCache's counters.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to run the detector.
+        evictions (int): Entries dropped because the cache was full.
+        expirations (int): Entries dropped because their TTL elapsed.
+        size (int): Current number of entries.
+        max_size (int): Configured capacity.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    max_size: int
+
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 if none yet)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResultCache:
+    """
+    Bounded LRU cache of detection results, keyed by content.
+
+    Entries are keyed by a BLAKE2b digest of the content, the detector's
+    `fingerprint()` (e.g. rule file hashes or the language policy) and any
+    per-call keyword arguments. Detectors whose fingerprint is None, such as
+    `CanaryDetector` whose verdict depends on a per-request token, are never
+    cached and always run.
+
+    The cache is thread-safe and can be shared by any number of detectors,
+    `scan()` / `a_scan()` / `scan_many()` calls and `CachedDetector` wrappers.
+
+    Attributes:
+        max_size (int): Maximum number of entries before LRU eviction.
+        ttl (float | None): Seconds an entry stays valid. None means no expiry.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl: float | None = None):
+        """
+        Args:
+            max_size: Maximum number of cached results.
+            ttl: Optional time-to-live in seconds.
+
+        Raises:
+            ConfigurationError: If max_size or ttl are not positive.
+        """
+        if max_size < 1:
+            raise ConfigurationError(f"max_size must be >= 1, got {max_size}.")
+        if ttl is not None and ttl <= 0:
+            raise ConfigurationError(f"ttl must be > 0, got {ttl}.")
+
+        self.max_size = max_size
+        self.ttl = ttl
+
+        # key -> (expiry on the monotonic clock or None, result)
+        self._entries: OrderedDict[CacheKey, tuple[float | None, DetectionResult]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def check(
+        self, detector: BaseDetector, content: str, **kwargs: Any
+    ) -> DetectionResult:
+        """
+        Returns the cached verdict of `detector` for `content`, running the
+        detector on a miss.
+        """
+        key = self.key_for(detector, content, kwargs)
+        if key is None:
+            return detector.check(content, **kwargs)
+
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        result = detector.check(content, **kwargs)
+        self.put(key, result)
+        return result
+
+    async def a_check(
+        self, detector: BaseDetector, content: str, **kwargs: Any
+    ) -> DetectionResult:
+        """Async version of check."""
+        key = self.key_for(detector, content, kwargs)
+        if key is None:
+            return await detector.a_check(content, **kwargs)
+
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        result = await detector.a_check(content, **kwargs)
+        self.put(key, result)
+        return result
+
+    def check_batch(
+        self, detector: BaseDetector, contents: Sequence[str], **kwargs: Any
+    ) -> list[DetectionResult]:
+        """
+        Batch version of check. Only the misses are passed to the detector's
+        `check_batch()`.
+        """
+        keys = self._keys_for(detector, contents, kwargs)
+        if keys is None:
+            return detector.check_batch(contents, **kwargs)
+
+        results, missing = self._lookup_many(keys)
+        if missing:
+            fresh = detector.check_batch([contents[i] for i in missing], **kwargs)
+            self._store_many(keys, missing, fresh, results)
+        # Every slot is filled at this point.
+        return cast(list[DetectionResult], results)
+
+    async def a_check_batch(
+        self, detector: BaseDetector, contents: Sequence[str], **kwargs: Any
+    ) -> list[DetectionResult]:
+        """Async version of check_batch."""
+        keys = self._keys_for(detector, contents, kwargs)
+        if keys is None:
+            return await detector.a_check_batch(contents, **kwargs)
+
+        results, missing = self._lookup_many(keys)
+        if missing:
+            fresh = await detector.a_check_batch(
+                [contents[i] for i in missing], **kwargs
+            )
+            self._store_many(keys, missing, fresh, results)
+        # Every slot is filled at this point.
+        return cast(list[DetectionResult], results)
+
+    def key_for(
+        self, detector: BaseDetector, content: str, kwargs: dict[str, Any]
+    ) -> CacheKey | None:
+        """
+        Builds the cache key for one call, or None if it must not be cached.
+        """
+        fingerprint = detector.fingerprint()
+        if fingerprint is None:
+            return None
+        return (fingerprint, content_digest(content), _kwargs_key(kwargs))
+
+    def get(self, key: CacheKey) -> DetectionResult | None:
+        """Returns the cached result for `key`, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expiry, result = entry
+            if expiry is not None and expiry <= time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return result
+
+    def put(self, key: CacheKey, result: DetectionResult) -> None:
+        """Stores a result, evicting the least recently used entry if full."""
+        expiry = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expiry, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drops all entries. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Returns a snapshot of the hit/miss counters and current size."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                max_size=self.max_size,
+            )
+
+    def _keys_for(
+        self, detector: BaseDetector, contents: Sequence[str], kwargs: dict[str, Any]
+    ) -> list[CacheKey] | None:
+        fingerprint = detector.fingerprint()
+        if fingerprint is None:
+            return None
+        extra = _kwargs_key(kwargs)
+        return [(fingerprint, content_digest(c), extra) for c in contents]
+
+    def _lookup_many(
+        self, keys: list[CacheKey]
+    ) -> tuple[list[DetectionResult | None], list[int]]:
+        results = [self.get(key) for key in keys]
+        missing = [i for i, r in enumerate(results) if r is None]
+        return results, missing
+
+    def _store_many(
+        self,
+        keys: list[CacheKey],
+        missing: list[int],
+        fresh: list[DetectionResult],
+        results: list[DetectionResult | None],
+    ) -> None:
+        for index, result in zip(missing, fresh, strict=True):
+            self.put(keys[index], result)
+            results[index] = result
+
+
+class CachedDetector(BaseDetector):
+    """
+    Wraps any detector so repeated content is answered from a ResultCache.
+
+    All other attributes (e.g. `inject`, `clean`) are delegated to the wrapped
+    detector, so the wrapper can be used anywhere the original could.
+
+    Example:
+        detector = CachedDetector(SignatureDetector(), ResultCache(max_size=50_000))
+    """
+
+    def __init__(self, detector: BaseDetector, cache: ResultCache | None = None):
+        """
+        Args:
+            detector: The detector to wrap.
+            cache: The cache to use. If None, a private cache with default
+                settings is created.
+        """
+        self.detector = detector
+        self.cache = cache if cache is not None else ResultCache()
+        self.accepts_bytes = detector.accepts_bytes
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the wrapper itself.
+        return getattr(self.detector, name)
+
+    def fingerprint(self) -> str | None:
+        return self.detector.fingerprint()
+
+    def check(self, content: str, **kwargs: Any) -> DetectionResult:
+        return self.cache.check(self.detector, content, **kwargs)
+
+    async def a_check(self, content: str, **kwargs: Any) -> DetectionResult:
+        return await self.cache.a_check(self.detector, content, **kwargs)
+
+    def check_batch(
+        self, contents: Sequence[str], **kwargs: Any
+    ) -> list[DetectionResult]:
+        return self.cache.check_batch(self.detector, contents, **kwargs)
+
+    async def a_check_batch(
+        self, contents: Sequence[str], **kwargs: Any
+    ) -> list[DetectionResult]:
+        return await self.cache.a_check_batch(self.detector, contents, **kwargs)
+
+
+def _kwargs_key(kwargs: dict[str, Any]) -> bytes:
+    """
+    Digests per-call arguments (e.g. reference_text) into the cache key.
+
+    The `timeout` budget is left out: it bounds how long a check may take but
+    never changes a verdict that was reached.
+    """
+    items = sorted((k, v) for k, v in kwargs.items() if k != "timeout")
+    if not items:
+        return b""
+    return content_digest(repr(items))
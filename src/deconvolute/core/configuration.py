@@ -0,0 +1,112 @@
+import os
+from typing import TypeVar
+
+from deconvolute.clients.base import MessageScanner
+from deconvolute.core.limiter import ConcurrencyLimiter
+from deconvolute.core.timeouts import TimeoutPolicy
+from deconvolute.detectors.base import BaseDetector
+from deconvolute.errors import ConfigurationError, DeconvoluteError
+from deconvolute.utils.logger import get_logger
+
+logger = get_logger()
+
+# TypeVar ensures that the IDE sees the return type as the same as the input type.
+T = TypeVar("T")
+
+
+def wrap_client(
+    client: T,
+    detectors: list[BaseDetector],
+    api_key: str | None,
+    timeout: float | None,
+    on_timeout: TimeoutPolicy,
+    limiter: ConcurrencyLimiter | None = None,
+    conversations: MessageScanner | None = None,
+) -> T:
+    """Picks the proxy matching the client's type. See `guard()`."""
+    # Client Inspection
+    # We use string inspection to avoid importing libraries that might not be installed.
+    client_type = type(client).__name__
+    module_name = type(client).__module__
+
+    # Routing & Lazy Loading
+    # We only import the specific proxy implementation if we detect the client.
+
+    # OpenAI Support
+    if "openai" in module_name:
+        try:
+            from deconvolute.clients.openai import AsyncOpenAIProxy, OpenAIProxy
+
+            # Detect Async vs Sync based on class name convention
+            if "Async" in client_type:
+                logger.debug(
+                    f"Deconvolute: Wrapping Async OpenAI client ({client_type})"
+                )
+                return AsyncOpenAIProxy(  # type: ignore
+                    client,
+                    detectors,
+                    api_key,
+                    timeout,
+                    on_timeout,
+                    limiter,
+                    conversations,
+                )
+            else:
+                if limiter is not None:
+                    raise ConfigurationError(
+                        "A ConcurrencyLimiter can only guard async clients."
+                    )
+                logger.debug(
+                    f"Deconvolute: Wrapping Sync OpenAI client ({client_type})"
+                )
+                return OpenAIProxy(  # type: ignore
+                    client,
+                    detectors,
+                    api_key,
+                    timeout,
+                    on_timeout,
+                    conversations=conversations,
+                )
+
+        except ImportError as e:
+            # This handles the case where the object claims to be from 'openai'
+            # but the library cannot be imported (e.g. broken environment).
+            raise DeconvoluteError(
+                f"Detected OpenAI client, but failed to import 'openai' library. "
+                f"Ensure it is installed: {e}"
+            ) from e
+
+    # Fallback: If we don't recognize the client, we must fail secure.
+    raise DeconvoluteError(
+        f"Unsupported client type: '{client_type}' from module '{module_name}'. "
+        "Deconvolute currently supports: OpenAI, AsyncOpenAI."
+    )
+
+
+def resolve_api_key(api_key: str | None) -> str | None:
+    """Returns the explicit API key, falling back to DECONVOLUTE_API_KEY."""
+    return api_key or os.getenv("DECONVOLUTE_API_KEY")
+
+
+def resolve_configuration(
+    detectors: list[BaseDetector], api_key: str | None
+) -> list[BaseDetector]:
+    """
+    Internal helper to inject API keys into configured detectors.
+
+    Args:
+        detectors: The list of detectors (must not be None).
+        api_key: The user-provided API key (or None).
+
+    Returns:
+        The configured detectors with keys injected.
+    """
+    final_key = resolve_api_key(api_key)
+
+    # We only inject if the key is available and the detector is unconfigured.
+    if final_key:
+        for d in detectors:
+            if hasattr(d, "api_key") and getattr(d, "api_key", None) is None:
+                d.api_key = final_key
+
+    return detectors
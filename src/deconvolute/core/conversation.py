@@ -0,0 +1,353 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+from deconvolute.constants import (
+    DEFAULT_CONVERSATION_IDLE_TTL_SEC,
+    DEFAULT_CONVERSATION_MAX_MESSAGES,
+    DEFAULT_CONVERSATION_MAX_SESSIONS,
+)
+from deconvolute.core.pipeline import Pipeline
+from deconvolute.detectors.base import BaseDetector, DetectionResult
+from deconvolute.errors import ConfigurationError
+from deconvolute.utils.hashing import content_digest
+from deconvolute.utils.logger import get_logger
+
+logger = get_logger()
+
+# A chat message: an OpenAI-style dict or message object, or plain text.
+Message = str | Mapping[str, Any] | Any
+
+# (position in the request, role, text, fingerprint) of one message to scan.
+_Entry = tuple[int, str, str, bytes]
+
+# The detectors' fingerprints, which identify the rules messages were verified
+# against.
+_Rules = tuple[tuple[str, str | None], ...]
+
+
+class ConversationStats(BaseModel):
+    """
+    Snapshot of a ConversationScanner's counters.
+
+    Attributes:
+        sessions (int): Sessions currently remembered.
+        scanned (int): Messages passed to the detectors.
+        skipped (int): Messages skipped because they were already verified.
+        evictions (int): Sessions dropped because `max_sessions` was reached.
+        expirations (int): Sessions dropped after being idle for `idle_ttl`.
+    """
+
+    sessions: int
+    scanned: int
+    skipped: int
+    evictions: int
+    expirations: int
+
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def skip_rate(self) -> float:
+        """Fraction of messages that did not need a scan (0.0 if none yet)."""
+        total = self.scanned + self.skipped
+        return self.skipped / total if total else 0.0
+
+
+class _Session:
+    """Fingerprints of the verified messages of one conversation."""
+
+    __slots__ = ("verified", "rules", "last_used")
+
+    def __init__(self, rules: _Rules) -> None:
+        # LRU order: messages still part of the history are touched every turn.
+        self.verified: OrderedDict[bytes, None] = OrderedDict()
+        # What the messages in `verified` were verified against.
+        self.rules = rules
+        self.last_used = 0.0
+
+
+class ConversationScanner:
+    """
+    Scans multi-turn conversations, inspecting each message only once.
+
+    Every chat request carries the full history, so scanning all of it on every
+    turn makes the total cost grow quadratically with the conversation length.
+    A ConversationScanner remembers fingerprints of the messages it has
+    verified, per session, and only passes new or modified messages to the
+    detectors.
+
+        conversations = ConversationScanner(Pipeline([SignatureDetector()]))
+        result = conversations.scan(messages, session_id=chat_id)
+
+    It can also guard the input of an OpenAI client, see `guard()`.
+
+    Only clean verdicts are remembered: a flagged message, or one that could
+    not be fully scanned in time, is scanned again on the next turn. Verdicts
+    are tied to the detectors' fingerprints: once a detector's rules change
+    (e.g. after `SignatureDetector.reload()`), every message of a session is
+    scanned again on its next turn. Memory is
+    bounded by `max_messages` fingerprints per session and `max_sessions`
+    sessions. Sessions idle for `idle_ttl` seconds are forgotten.
+
+    The scanner is thread-safe and can be shared across requests.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline | None = None,
+        max_sessions: int = DEFAULT_CONVERSATION_MAX_SESSIONS,
+        max_messages: int = DEFAULT_CONVERSATION_MAX_MESSAGES,
+        idle_ttl: float | None = DEFAULT_CONVERSATION_IDLE_TTL_SEC,
+    ):
+        """
+        Args:
+            pipeline: The pipeline whose detectors, cache, scheduler, executor
+                and timeout settings are used. If None, a default Pipeline
+                (the scanning suite) is created.
+            max_sessions: Sessions remembered at most. When full, the least
+                recently used session is dropped.
+            max_messages: Verified messages remembered per session. Longer
+                conversations keep the most recently seen ones.
+            idle_ttl: Seconds after its last scan that a session is forgotten.
+                None keeps sessions until they are evicted.
+
+        Raises:
+            ConfigurationError: If the options are invalid.
+        """
+        if max_sessions < 1:
+            raise ConfigurationError(f"max_sessions must be >= 1, got {max_sessions}.")
+        if max_messages < 1:
+            raise ConfigurationError(f"max_messages must be >= 1, got {max_messages}.")
+        if idle_ttl is not None and idle_ttl <= 0:
+            raise ConfigurationError(f"idle_ttl must be > 0, got {idle_ttl}.")
+
+        self.pipeline = pipeline if pipeline is not None else Pipeline()
+        self.max_sessions = max_sessions
+        self.max_messages = max_messages
+        self.idle_ttl = idle_ttl
+
+        # session id -> session, least recently used first.
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+        self._lock = threading.Lock()
+        self._scanned = 0
+        self._skipped = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def scan(
+        self, messages: Sequence[Message], session_id: str | None = None
+    ) -> DetectionResult:
+        """
+        Scans the messages of a conversation that were not verified before.
+
+        Args:
+            messages: The full history, oldest first. OpenAI-style dicts or
+                message objects (text in 'content', as a string or a list of
+                text parts) or plain strings. Messages without text are skipped.
+            session_id: Identifies the conversation. If None, the session is
+                derived from the first non-system message, which is stable
+                across the turns of one conversation.
+
+        Returns:
+            DetectionResult: The result of the earliest flagged message, with
+            its position recorded in `metadata['message_index']`, or a clean
+            'Scanner' result. If a scan ran out of time under a 'fail_open'
+            policy, its timeout result is returned.
+        """
+        entries = _entries(messages)
+        if not entries:
+            return DetectionResult(threat_detected=False, component="Scanner")
+        key = session_id if session_id is not None else _derive_session(entries)
+
+        pipeline = self.pipeline
+        rules = _rules(pipeline.scanners)
+        pending = self._pending(key, entries, rules)
+        if not pending:
+            return DetectionResult(threat_detected=False, component="Scanner")
+
+        results = pipeline.scan_chunk([text for _, _, text, _ in pending])
+        return self._settle(key, pending, results, rules)
+
+    async def a_scan(
+        self, messages: Sequence[Message], session_id: str | None = None
+    ) -> DetectionResult:
+        """Async version of scan."""
+        entries = _entries(messages)
+        if not entries:
+            return DetectionResult(threat_detected=False, component="Scanner")
+        key = session_id if session_id is not None else _derive_session(entries)
+
+        pipeline = self.pipeline
+        rules = _rules(pipeline.scanners)
+        pending = self._pending(key, entries, rules)
+        if not pending:
+            return DetectionResult(threat_detected=False, component="Scanner")
+
+        results = await pipeline.a_scan_chunk([text for _, _, text, _ in pending])
+        return self._settle(key, pending, results, rules)
+
+    def forget(self, session_id: str) -> None:
+        """Drops a session, e.g. when its conversation is closed."""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def clear(self) -> None:
+        """Drops all sessions. Counters are kept."""
+        with self._lock:
+            self._sessions.clear()
+
+    def stats(self) -> ConversationStats:
+        """Returns a snapshot of the counters and the number of sessions."""
+        with self._lock:
+            return ConversationStats(
+                sessions=len(self._sessions),
+                scanned=self._scanned,
+                skipped=self._skipped,
+                evictions=self._evictions,
+                expirations=self._expirations,
+            )
+
+    def _pending(self, key: str, entries: list[_Entry], rules: _Rules) -> list[_Entry]:
+        """Returns the entries the session has not verified against `rules`."""
+        now = time.monotonic()
+
+        with self._lock:
+            self._expire(now)
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._sessions[key] = _Session(rules)
+                while len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+                    self._evictions += 1
+            else:
+                self._sessions.move_to_end(key)
+            session.last_used = now
+            if session.rules != rules:
+                session.verified.clear()
+                session.rules = rules
+
+            pending = []
+            for entry in entries:
+                fingerprint = entry[3]
+                if fingerprint in session.verified:
+                    session.verified.move_to_end(fingerprint)
+                else:
+                    pending.append(entry)
+
+            self._skipped += len(entries) - len(pending)
+            self._scanned += len(pending)
+        return pending
+
+    def _settle(
+        self,
+        key: str,
+        pending: list[_Entry],
+        results: list[DetectionResult],
+        rules: _Rules,
+    ) -> DetectionResult:
+        """Remembers the clean messages and picks the conversation's verdict."""
+        with self._lock:
+            # The session may have been evicted while it was being scanned, or
+            # moved on to newer rules.
+            session = self._sessions.get(key)
+            if session is not None and session.rules == rules:
+                for (_, _, _, fingerprint), result in zip(
+                    pending, results, strict=True
+                ):
+                    if not result.threat_detected and not _timed_out(result):
+                        session.verified[fingerprint] = None
+                        session.verified.move_to_end(fingerprint)
+                while len(session.verified) > self.max_messages:
+                    session.verified.popitem(last=False)
+
+        flagged = [
+            (e, r) for e, r in zip(pending, results, strict=True) if r.threat_detected
+        ]
+        if not flagged:
+            flagged = [
+                (e, r) for e, r in zip(pending, results, strict=True) if _timed_out(r)
+            ]
+        if not flagged:
+            return DetectionResult(threat_detected=False, component="Scanner")
+
+        (index, role, _, _), result = flagged[0]
+        if result.threat_detected:
+            logger.debug(
+                f"Deconvolute: Message {index} ({role}) of conversation flagged "
+                f"by {result.component}."
+            )
+        return result.model_copy(
+            update={"metadata": {**result.metadata, "message_index": index}}
+        )
+
+    def _expire(self, now: float) -> None:
+        """Drops idle sessions. Callers hold the lock."""
+        if self.idle_ttl is None:
+            return
+        cutoff = now - self.idle_ttl
+        while self._sessions:
+            key, session = next(iter(self._sessions.items()))
+            if session.last_used > cutoff:
+                break
+            del self._sessions[key]
+            self._expirations += 1
+
+    def __repr__(self) -> str:
+        return (
+            f"ConversationScanner(max_sessions={self.max_sessions}, "
+            f"max_messages={self.max_messages}, idle_ttl={self.idle_ttl}, "
+            f"pipeline={self.pipeline!r})"
+        )
+
+
+def _entries(messages: Sequence[Message]) -> list[_Entry]:
+    """Extracts and fingerprints the text of every message that has some."""
+    entries = []
+    for index, message in enumerate(messages):
+        role, text = _role_and_text(message)
+        if text:
+            entries.append((index, role, text, content_digest(text)))
+    return entries
+
+
+def _role_and_text(message: Message) -> tuple[str, str | None]:
+    if isinstance(message, str):
+        return "user", message
+    if isinstance(message, Mapping):
+        role, content = message.get("role"), message.get("content")
+    else:
+        role, content = (
+            getattr(message, "role", None),
+            getattr(message, "content", None),
+        )
+
+    if isinstance(content, list):
+        # Multi-part content: only text parts are scanned.
+        parts = [_part_text(part) for part in content]
+        content = "\n".join(p for p in parts if p)
+    return str(role or ""), content if isinstance(content, str) else None
+
+
+def _part_text(part: Any) -> str | None:
+    text = (
+        part.get("text") if isinstance(part, Mapping) else getattr(part, "text", None)
+    )
+    return text if isinstance(text, str) else None
+
+
+def _rules(scanners: Sequence[BaseDetector]) -> _Rules:
+    return tuple((type(d).__name__, d.fingerprint()) for d in scanners)
+
+
+def _derive_session(entries: list[_Entry]) -> str:
+    """Names a session after its first non-system message."""
+    first = next((e for e in entries if e[1] != "system"), entries[0])
+    return first[3].hex()
+
+
+def _timed_out(result: DetectionResult) -> bool:
+    return result.metadata.get("reason") == "timeout"
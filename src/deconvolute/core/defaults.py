@@ -1,3 +1,7 @@
+import threading
+from pathlib import Path
+from typing import Literal
+
 from deconvolute.detectors.base import BaseDetector
 from deconvolute.detectors.content.language.engine import LanguageDetector
 from deconvolute.detectors.content.signature.engine import SignatureDetector
@@ -6,6 +10,15 @@ from deconvolute.utils.logger import get_logger
 
 logger = get_logger()
 
+SuiteKind = Literal["guard", "scan"]
+
+# Process-wide registry of default suites.
+# Key: (kind, api_key, resolved rules path). Building a suite compiles signature
+# rules and loads language models, so we do it once per key and share the
+# detector instances across scan(), a_scan() and guard().
+_suite_registry: dict[tuple[str, str | None, str | None], list[BaseDetector]] = {}
+_suite_lock = threading.Lock()
+
 
 def get_guard_defaults() -> list[BaseDetector]:
     """
@@ -18,9 +31,72 @@ def get_guard_defaults() -> list[BaseDetector]:
     ]
 
 
-def get_scan_defaults() -> list[BaseDetector]:
+def get_scan_defaults(rules_path: str | Path | None = None) -> list[BaseDetector]:
     """
     Returns the standard suite of defenses for static content scanning.
     Optimized for deep inspection of prompts or documents.
+
+    Args:
+        rules_path: Optional path to custom signature rules. If None, the SDK's
+            bundled rules are used.
+    """
+    return [SignatureDetector(rules_path=rules_path)]
+
+
+def get_default_suite(
+    kind: SuiteKind,
+    api_key: str | None = None,
+    rules_path: str | Path | None = None,
+) -> list[BaseDetector]:
+    """
+    Returns the shared default suite for the given entry point.
+
+    Unlike `get_guard_defaults()` and `get_scan_defaults()`, which build fresh
+    detectors on every call, this function builds each suite once per process and
+    returns the same detector instances on subsequent calls. It is thread-safe:
+    concurrent callers asking for the same suite wait for a single build.
+
+    Args:
+        kind: 'scan' for content scanning or 'guard' for client wrapping.
+        api_key: The resolved Deconvolute API key. Suites configured with
+            different keys are kept apart.
+        rules_path: Optional custom signature rules (only relevant for 'scan').
+
+    Returns:
+        A new list containing the shared detector instances. Mutating the list
+        does not affect the registry.
+    """
+    resolved_path = None
+    if kind == "scan" and rules_path is not None:
+        resolved_path = str(Path(rules_path).resolve())
+
+    key = (kind, api_key, resolved_path)
+
+    suite = _suite_registry.get(key)
+    if suite is None:
+        with _suite_lock:
+            # Double-checked: another thread may have built it while we waited.
+            suite = _suite_registry.get(key)
+            if suite is None:
+                if kind == "guard":
+                    suite = get_guard_defaults()
+                else:
+                    suite = get_scan_defaults(rules_path=resolved_path)
+                _suite_registry[key] = suite
+                logger.debug(f"Built default '{kind}' suite ({len(suite)} detectors).")
+
+    return list(suite)
+
+
+def invalidate_default_suites() -> None:
+    """
+    Drops all cached default suites.
+
+    The next call to `scan()`, `a_scan()` or `guard()` without explicit detectors
+    rebuilds its suite from scratch. Call this after updating rule files on disk
+    or changing environment configuration. Proxies created earlier keep the
+    detectors they were built with.
     """
-    return [SignatureDetector()]
+    with _suite_lock:
+        _suite_registry.clear()
+    logger.debug("Invalidated default detector suites.")
@@ -0,0 +1,626 @@
+import asyncio
+import codecs
+import os
+import time
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from deconvolute.core.cache import ResultCache
+from deconvolute.core.limiter import ConcurrencyLimiter
+from deconvolute.core.models import BatchResult, DetectorReport, ScanReport
+from deconvolute.core.scheduler import AdaptiveScheduler
+from deconvolute.core.streaming import iter_file_text, iter_windows
+from deconvolute.core.timeouts import (
+    TimeoutPolicy,
+    deadline_kwargs,
+    timeout_result,
+    wait_within,
+)
+from deconvolute.detectors.base import BaseDetector, Content, DetectionResult, as_text
+from deconvolute.errors import ConfigurationError, ScanTimeoutError
+from deconvolute.utils.deadline import Deadline
+from deconvolute.utils.executor import current_executor
+from deconvolute.utils.hashing import content_digest
+from deconvolute.utils.iterables import Deduplicator, chunked
+from deconvolute.utils.logger import get_logger
+
+logger = get_logger()
+
+
+def scan_path(
+    scanners: list[BaseDetector],
+    path: str | os.PathLike[str],
+    encoding: str,
+    window_size: int,
+    overlap: int,
+    deadline: Deadline,
+    on_timeout: TimeoutPolicy,
+    timings: dict[str, float] | None = None,
+) -> DetectionResult:
+    """
+    Runs the scanners over a file with first-threat-wins semantics.
+
+    If `timings` is given, each detector's wall time in seconds is added to it
+    under the detector's class name.
+    """
+    native = codecs.lookup(encoding).name in ("utf-8", "ascii")
+
+    for position, detector in enumerate(scanners):
+        result: DetectionResult
+        start = time.perf_counter()
+        try:
+            if native and hasattr(detector, "check_file"):
+                result = detector.check_file(path, **deadline_kwargs(deadline))
+            else:
+                result = _check_file_windows(
+                    detector, path, encoding, window_size, overlap, deadline
+                )
+        except ScanTimeoutError:
+            return _scan_timed_out(
+                scanners[:position], scanners[position:], deadline, on_timeout
+            )
+        finally:
+            if timings is not None:
+                name = type(detector).__name__
+                timings[name] = timings.get(name, 0.0) + (time.perf_counter() - start)
+        if result.threat_detected:
+            return result
+
+    return DetectionResult(threat_detected=False, component="Scanner")
+
+
+def _check_file_windows(
+    detector: BaseDetector,
+    path: str | os.PathLike[str],
+    encoding: str,
+    window_size: int,
+    overlap: int,
+    deadline: Deadline,
+) -> DetectionResult:
+    """Runs a text detector over a file, one decoded window at a time."""
+    text = iter_file_text(path, encoding, window_size)
+    for offset, window in iter_windows(text, window_size, overlap):
+        result = detector.check(window, **deadline_kwargs(deadline))
+        if result.threat_detected:
+            return with_window_offset(result, offset)
+    return DetectionResult(threat_detected=False, component=type(detector).__name__)
+
+
+def scan_content(
+    scanners: list[BaseDetector],
+    content: Content,
+    scheduler: AdaptiveScheduler | None = None,
+    cache: ResultCache | None = None,
+    deadline: Deadline | None = None,
+    on_timeout: TimeoutPolicy = "fail_closed",
+) -> DetectionResult:
+    """Runs the scanners in order and returns the first threat, if any."""
+    if scheduler is not None:
+        scanners = scheduler.order(scanners)
+
+    for position, detector in enumerate(scanners):
+        start = time.perf_counter()
+        try:
+            result = _check(detector, content, cache, deadline)
+        except ScanTimeoutError:
+            return _scan_timed_out(
+                scanners[:position], scanners[position:], deadline, on_timeout
+            )
+        if scheduler is not None:
+            scheduler.record(
+                detector, time.perf_counter() - start, int(result.threat_detected)
+            )
+        if result.threat_detected:
+            return result
+
+    return DetectionResult(threat_detected=False, component="Scanner")
+
+
+async def a_scan_limited(
+    scanners: list[BaseDetector],
+    content: Content,
+    concurrent: bool,
+    scheduler: AdaptiveScheduler | None,
+    cache: ResultCache | None,
+    deadline: Deadline,
+    on_timeout: TimeoutPolicy,
+    limiter: ConcurrencyLimiter | None,
+) -> DetectionResult:
+    """Runs an async scan, holding a slot of the limiter if one is given."""
+    if limiter is not None:
+        verdict = await limiter.admit(scanners, deadline, on_timeout)
+        if verdict is not None:
+            return verdict
+
+    try:
+        if concurrent and len(scanners) > 1:
+            return await race_for_threat(scanners, content, cache, deadline, on_timeout)
+        return await a_scan_content(
+            scanners, content, scheduler, cache, deadline, on_timeout
+        )
+    finally:
+        if limiter is not None:
+            limiter.release()
+
+
+async def a_scan_content(
+    scanners: list[BaseDetector],
+    content: Content,
+    scheduler: AdaptiveScheduler | None = None,
+    cache: ResultCache | None = None,
+    deadline: Deadline | None = None,
+    on_timeout: TimeoutPolicy = "fail_closed",
+) -> DetectionResult:
+    """Async version of scan_content."""
+    if scheduler is not None:
+        scanners = scheduler.order(scanners)
+
+    for position, detector in enumerate(scanners):
+        start = time.perf_counter()
+        try:
+            result = await _a_check(detector, content, cache, deadline)
+        except ScanTimeoutError:
+            return _scan_timed_out(
+                scanners[:position], scanners[position:], deadline, on_timeout
+            )
+        if scheduler is not None:
+            scheduler.record(
+                detector, time.perf_counter() - start, int(result.threat_detected)
+            )
+        if result.threat_detected:
+            return result
+
+    return DetectionResult(threat_detected=False, component="Scanner")
+
+
+def _check(
+    detector: BaseDetector,
+    content: Content,
+    cache: ResultCache | None,
+    deadline: Deadline | None = None,
+) -> DetectionResult:
+    """
+    Runs one check, through the cache if one is configured.
+
+    Raises:
+        ScanTimeoutError: If the deadline passes before or during the check.
+    """
+    kwargs = deadline_kwargs(deadline)
+    data = _input_for(detector, content)
+    if cache is None:
+        return detector.check(data, **kwargs)
+    return cache.check(detector, data, **kwargs)
+
+
+async def _a_check(
+    detector: BaseDetector,
+    content: Content,
+    cache: ResultCache | None,
+    deadline: Deadline | None = None,
+) -> DetectionResult:
+    """Async version of _check. The check is cancelled when the deadline passes."""
+    kwargs = deadline_kwargs(deadline)
+    data = _input_for(detector, content)
+    if cache is None:
+        call = detector.a_check(data, **kwargs)
+    else:
+        call = cache.a_check(detector, data, **kwargs)
+    return await wait_within(call, kwargs.get("timeout"))
+
+
+def _input_for(detector: BaseDetector, content: Content) -> Any:
+    """
+    Returns the content as the detector takes it: bytes-like input is passed
+    as is to detectors that accept bytes and decoded for all others.
+    """
+    return content if detector.accepts_bytes else as_text(content)
+
+
+def _scan_timed_out(
+    completed: list[BaseDetector],
+    timed_out: list[BaseDetector],
+    deadline: Deadline | None,
+    on_timeout: TimeoutPolicy,
+) -> DetectionResult:
+    """Logs the timeout and applies the policy."""
+    timeout = deadline.timeout if deadline is not None else None
+    names = ", ".join(type(d).__name__ for d in timed_out)
+    logger.warning(
+        f"Deconvolute: Scan exceeded its {timeout}s budget before {names} "
+        f"finished ({on_timeout})."
+    )
+    return timeout_result(on_timeout, timeout, completed, timed_out)
+
+
+def report_content(
+    scanners: list[BaseDetector],
+    content: Content,
+    concurrent: bool = False,
+    scheduler: AdaptiveScheduler | None = None,
+    cache: ResultCache | None = None,
+) -> ScanReport:
+    """Runs every scanner on the content and collects a ScanReport."""
+    start = time.perf_counter()
+
+    if concurrent and len(scanners) > 1:
+        executor = current_executor()
+        first, *rest = scanners
+        futures = [executor.submit(_timed_check, d, content, cache) for d in rest]
+        # The calling thread takes the first check, and any check no worker has
+        # started yet, so a saturated executor cannot leave it waiting.
+        reports = [_timed_check(first, content, cache)]
+        for detector, future in zip(rest, futures, strict=True):
+            if future.cancel():
+                reports.append(_timed_check(detector, content, cache))
+            else:
+                reports.append(future.result())
+    else:
+        reports = [_timed_check(d, content, cache) for d in scanners]
+
+    _record_reports(scheduler, scanners, reports)
+    return ScanReport(detectors=reports, latency_ms=_elapsed_ms(start))
+
+
+async def a_report_content(
+    scanners: list[BaseDetector],
+    content: Content,
+    scheduler: AdaptiveScheduler | None = None,
+    cache: ResultCache | None = None,
+) -> ScanReport:
+    """Async version of report_content. All scanners run concurrently."""
+    start = time.perf_counter()
+
+    tasks = [asyncio.create_task(_a_timed_check(d, content, cache)) for d in scanners]
+    try:
+        reports = list(await asyncio.gather(*tasks))
+    finally:
+        pending = [t for t in tasks if not t.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    _record_reports(scheduler, scanners, reports)
+    return ScanReport(detectors=reports, latency_ms=_elapsed_ms(start))
+
+
+def _timed_check(
+    detector: BaseDetector, content: Content, cache: ResultCache | None
+) -> DetectorReport:
+    """Runs one check and records how long it took."""
+    start = time.perf_counter()
+    result = _check(detector, content, cache)
+    return DetectorReport(
+        component=type(detector).__name__,
+        result=result,
+        latency_ms=_elapsed_ms(start),
+    )
+
+
+async def _a_timed_check(
+    detector: BaseDetector, content: Content, cache: ResultCache | None
+) -> DetectorReport:
+    """Async version of _timed_check."""
+    start = time.perf_counter()
+    result = await _a_check(detector, content, cache)
+    return DetectorReport(
+        component=type(detector).__name__,
+        result=result,
+        latency_ms=_elapsed_ms(start),
+    )
+
+
+def _record_reports(
+    scheduler: AdaptiveScheduler | None,
+    scanners: list[BaseDetector],
+    reports: list[DetectorReport],
+) -> None:
+    """Feeds a report's per-detector timings and verdicts into the scheduler."""
+    if scheduler is None:
+        return
+    for detector, report in zip(scanners, reports, strict=True):
+        scheduler.record(
+            detector, report.latency_ms / 1000.0, int(report.result.threat_detected)
+        )
+
+
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000.0
+
+
+def with_window_offset(result: DetectionResult, offset: int) -> DetectionResult:
+    """Returns a copy of the result that records where its window started."""
+    return result.model_copy(
+        update={"metadata": {**result.metadata, "window_offset": offset}}
+    )
+
+
+async def race_for_threat(
+    scanners: list[BaseDetector],
+    content: Content,
+    cache: ResultCache | None = None,
+    deadline: Deadline | None = None,
+    on_timeout: TimeoutPolicy = "fail_closed",
+) -> DetectionResult:
+    """
+    Runs all scanners concurrently and returns the first threat found.
+
+    Checks still in flight when a threat arrives, or when the deadline passes,
+    are cancelled. Detectors that offload to a thread pool keep running in their
+    worker thread, but their results are discarded.
+    """
+    tasks = [
+        asyncio.create_task(_a_check(d, content, cache, deadline)) for d in scanners
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                result = await next_done
+            except ScanTimeoutError:
+                finished = [
+                    t.done() and not t.cancelled() and t.exception() is None
+                    for t in tasks
+                ]
+                return _scan_timed_out(
+                    [d for d, ok in zip(scanners, finished, strict=True) if ok],
+                    [d for d, ok in zip(scanners, finished, strict=True) if not ok],
+                    deadline,
+                    on_timeout,
+                )
+            if result.threat_detected:
+                return result
+    finally:
+        pending = [t for t in tasks if not t.done()]
+        for task in pending:
+            task.cancel()
+        # Let cancellations settle so no task outlives the call.
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    return DetectionResult(threat_detected=False, component="Scanner")
+
+
+def scan_batch(
+    scanners: list[BaseDetector],
+    contents: Iterable[Content],
+    concurrency: int,
+    chunk_size: int,
+    scheduler: AdaptiveScheduler | None,
+    cache: ResultCache | None,
+    timeout: float | None,
+    on_timeout: TimeoutPolicy,
+) -> BatchResult:
+    """Runs resolved scanners over a batch. See `scan_many()`."""
+    results: list[DetectionResult] = []
+    options = (scheduler, cache, timeout, on_timeout)
+    dedup = batch_deduplicator(2 * concurrency * chunk_size)
+    chunks = chunked(dedup.unique(contents), chunk_size)
+
+    if concurrency == 1:
+        for chunk in chunks:
+            results.extend(scan_chunk(scanners, chunk, *options))
+        return batch_result(dedup, results)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        in_flight: deque[Future[list[DetectionResult]]] = deque()
+
+        for chunk in chunks:
+            in_flight.append(pool.submit(scan_chunk, scanners, chunk, *options))
+            # Bound memory: drain the oldest chunk once the window is full.
+            if len(in_flight) >= 2 * concurrency:
+                results.extend(in_flight.popleft().result())
+
+        while in_flight:
+            results.extend(in_flight.popleft().result())
+
+    return batch_result(dedup, results)
+
+
+def _document_key(content: Content) -> tuple[bool, int, int] | None:
+    """
+    The cheap key batch scans pre-filter repeated documents by.
+
+    Args:
+        content: A document of the batch.
+
+    Returns:
+        tuple[bool, int, int] | None: Whether the document is text, its length
+        and its hash. None for mutable buffers, which may change before they
+        are scanned and so are never deduplicated.
+    """
+    if isinstance(content, bytearray) or (
+        isinstance(content, memoryview) and not content.readonly
+    ):
+        return None
+    try:
+        return isinstance(content, str), len(content), hash(content)
+    except (TypeError, ValueError):
+        # Memoryviews of other formats than bytes cannot be hashed.
+        return None
+
+
+def _document_digest(content: Content) -> tuple[bool, bytes]:
+    """Verifies a repeat of a document that is no longer held."""
+    return isinstance(content, str), content_digest(content)
+
+
+def batch_deduplicator(window: int) -> Deduplicator[Any]:
+    """Recognizes repeated documents of a batch, see `scan_many()`."""
+    return Deduplicator(key=_document_key, digest=_document_digest, window=window)
+
+
+def batch_result(
+    dedup: Deduplicator[Any], results: list[DetectionResult]
+) -> BatchResult:
+    """Fans the results of unique documents back out to every input position."""
+    if dedup.duplicates:
+        logger.debug(
+            f"Deconvolute: Skipped {dedup.duplicates} duplicate documents in batch."
+        )
+    return BatchResult(results=dedup.expand(results), duplicates=dedup.duplicates)
+
+
+async def a_scan_batch(
+    scanners: list[BaseDetector],
+    contents: Iterable[Content],
+    concurrency: int,
+    chunk_size: int,
+    scheduler: AdaptiveScheduler | None,
+    cache: ResultCache | None,
+    timeout: float | None,
+    on_timeout: TimeoutPolicy,
+) -> BatchResult:
+    """Async version of scan_batch."""
+    results: list[DetectionResult] = []
+    in_flight: deque[asyncio.Task[list[DetectionResult]]] = deque()
+    dedup = batch_deduplicator(2 * concurrency * chunk_size)
+
+    try:
+        for chunk in chunked(dedup.unique(contents), chunk_size):
+            in_flight.append(
+                asyncio.create_task(
+                    a_scan_chunk(scanners, chunk, scheduler, cache, timeout, on_timeout)
+                )
+            )
+            if len(in_flight) >= concurrency:
+                results.extend(await in_flight.popleft())
+
+        while in_flight:
+            results.extend(await in_flight.popleft())
+    finally:
+        # If a detector raised, do not leave orphaned tasks behind.
+        for task in in_flight:
+            task.cancel()
+
+    return batch_result(dedup, results)
+
+
+def validate_batch_options(concurrency: int, chunk_size: int) -> None:
+    if concurrency < 1:
+        raise ConfigurationError(f"concurrency must be >= 1, got {concurrency}.")
+    if chunk_size < 1:
+        raise ConfigurationError(f"chunk_size must be >= 1, got {chunk_size}.")
+
+
+def scan_chunk(
+    scanners: list[BaseDetector],
+    chunk: list[Content],
+    scheduler: AdaptiveScheduler | None = None,
+    cache: ResultCache | None = None,
+    timeout: float | None = None,
+    on_timeout: TimeoutPolicy = "fail_closed",
+) -> list[DetectionResult]:
+    """
+    Runs one chunk through the scanners with first-threat-wins semantics.
+
+    Each detector only sees the documents that are still clean after the
+    previous detectors. If the chunk's deadline passes, the documents not yet
+    cleared by every detector get the timeout policy's verdict.
+    """
+    results: list[DetectionResult | None] = [None] * len(chunk)
+    pending = list(range(len(chunk)))
+    deadline = Deadline(timeout)
+
+    if scheduler is not None:
+        scanners = scheduler.order(scanners)
+
+    for position, detector in enumerate(scanners):
+        if not pending:
+            break
+        start = time.perf_counter()
+        documents = [_input_for(detector, chunk[i]) for i in pending]
+        try:
+            kwargs = deadline_kwargs(deadline)
+            if cache is None:
+                batch = detector.check_batch(documents, **kwargs)
+            else:
+                batch = cache.check_batch(detector, documents, **kwargs)
+        except ScanTimeoutError:
+            verdict = _scan_timed_out(
+                scanners[:position], scanners[position:], deadline, on_timeout
+            )
+            for index in pending:
+                results[index] = verdict
+            break
+        _record_batch(scheduler, detector, start, batch)
+        pending = _collect_threats(pending, batch, results)
+
+    return _finalize_chunk(results)
+
+
+async def a_scan_chunk(
+    scanners: list[BaseDetector],
+    chunk: list[Content],
+    scheduler: AdaptiveScheduler | None = None,
+    cache: ResultCache | None = None,
+    timeout: float | None = None,
+    on_timeout: TimeoutPolicy = "fail_closed",
+) -> list[DetectionResult]:
+    """Async version of scan_chunk."""
+    results: list[DetectionResult | None] = [None] * len(chunk)
+    pending = list(range(len(chunk)))
+    deadline = Deadline(timeout)
+
+    if scheduler is not None:
+        scanners = scheduler.order(scanners)
+
+    for position, detector in enumerate(scanners):
+        if not pending:
+            break
+        start = time.perf_counter()
+        documents = [_input_for(detector, chunk[i]) for i in pending]
+        try:
+            kwargs = deadline_kwargs(deadline)
+            if cache is None:
+                call = detector.a_check_batch(documents, **kwargs)
+            else:
+                call = cache.a_check_batch(detector, documents, **kwargs)
+            batch = await wait_within(call, kwargs.get("timeout"))
+        except ScanTimeoutError:
+            verdict = _scan_timed_out(
+                scanners[:position], scanners[position:], deadline, on_timeout
+            )
+            for index in pending:
+                results[index] = verdict
+            break
+        _record_batch(scheduler, detector, start, batch)
+        pending = _collect_threats(pending, batch, results)
+
+    return _finalize_chunk(results)
+
+
+def _record_batch(
+    scheduler: AdaptiveScheduler | None,
+    detector: BaseDetector,
+    start: float,
+    batch: list[DetectionResult],
+) -> None:
+    """Feeds a batch call's timing and verdicts into the scheduler, if any."""
+    if scheduler is not None:
+        scheduler.record(
+            detector,
+            time.perf_counter() - start,
+            threats=sum(r.threat_detected for r in batch),
+            documents=len(batch),
+        )
+
+
+def _collect_threats(
+    pending: list[int],
+    batch: list[DetectionResult],
+    results: list[DetectionResult | None],
+) -> list[int]:
+    """Records threats into `results` and returns the indices still clean."""
+    still_pending = []
+    for index, result in zip(pending, batch, strict=True):
+        if result.threat_detected:
+            results[index] = result
+        else:
+            still_pending.append(index)
+    return still_pending
+
+
+def _finalize_chunk(results: list[DetectionResult | None]) -> list[DetectionResult]:
+    """Fills the remaining slots with a clean result shared across the chunk."""
+    clean = DetectionResult(threat_detected=False, component="Scanner")
+    return [r if r is not None else clean for r in results]
@@ -0,0 +1,230 @@
+import asyncio
+import time
+from collections import deque
+from typing import Literal, get_args
+
+from pydantic import BaseModel, ConfigDict
+
+from deconvolute.core.timeouts import TimeoutPolicy, timeout_result, wait_within
+from deconvolute.detectors.base import BaseDetector, DetectionResult
+from deconvolute.errors import ConfigurationError, ScanTimeoutError
+from deconvolute.utils.deadline import Deadline
+from deconvolute.utils.logger import get_logger
+
+logger = get_logger()
+
+# What happens to a scan that finds every slot busy and the queue full.
+# 'wait' never sheds: the queue is bounded by each scan's time budget instead.
+# 'fail_open' and 'fail_closed' return a verdict immediately without scanning.
+OverloadPolicy = Literal["wait", "fail_open", "fail_closed"]
+
+
+class LimiterStats(BaseModel):
+    """
+    Snapshot of a ConcurrencyLimiter's load.
+
+    Attributes:
+        max_concurrency (int): Scans allowed to run at once.
+        max_queue (int | None): Scans allowed to wait, or None if unbounded.
+        active (int): Scans currently running.
+        queued (int): Scans waiting for a slot (queue depth).
+        admitted (int): Scans that got a slot.
+        shed (int): Scans rejected because the queue was full.
+        timed_out (int): Scans whose budget ran out while they were queued.
+        mean_wait_ms (float): Average time admitted scans spent queued.
+        max_wait_ms (float): Longest time an admitted scan spent queued.
+    """
+
+    max_concurrency: int
+    max_queue: int | None
+    active: int
+    queued: int
+    admitted: int
+    shed: int
+    timed_out: int
+    mean_wait_ms: float
+    max_wait_ms: float
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ConcurrencyLimiter:
+    """
+    Bounds the number of async scans running at once and queues the rest.
+
+    Without a limit, a traffic spike submits every check to the detector
+    executors at once, and latency grows for every caller. A limiter admits at
+    most `max_concurrency` scans; later scans wait in FIFO order.
+
+        limiter = ConcurrencyLimiter(max_concurrency=32, max_queue=256,
+                                     on_overload="fail_closed")
+        result = await a_scan(text, limiter=limiter)
+
+    Time spent in the queue counts against the scan's timeout. A scan whose
+    budget runs out before it gets a slot returns the timeout policy's verdict.
+    A limiter belongs to one event loop.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue: int | None = None,
+        on_overload: OverloadPolicy = "wait",
+    ):
+        """
+        Args:
+            max_concurrency: Number of scans that may run at once.
+            max_queue: Number of scans that may wait for a slot before new ones
+                are shed. Only used by the shedding policies, where None means 0
+                (shed as soon as every slot is busy).
+            on_overload: 'wait' queues every scan, bounded by its timeout.
+                'fail_open' lets shed content through, 'fail_closed' flags it.
+
+        Raises:
+            ConfigurationError: If the options are invalid.
+        """
+        if max_concurrency < 1:
+            raise ConfigurationError(
+                f"max_concurrency must be >= 1, got {max_concurrency}."
+            )
+        if on_overload not in get_args(OverloadPolicy):
+            raise ConfigurationError(
+                f"on_overload must be one of {get_args(OverloadPolicy)}, "
+                f"got '{on_overload}'."
+            )
+        if max_queue is not None:
+            if on_overload == "wait":
+                raise ConfigurationError(
+                    "max_queue requires a shedding policy ('fail_open' or "
+                    "'fail_closed'). With 'wait', the timeout bounds the queue."
+                )
+            if max_queue < 0:
+                raise ConfigurationError(f"max_queue must be >= 0, got {max_queue}.")
+
+        self.max_concurrency = max_concurrency
+        self.on_overload: OverloadPolicy = on_overload
+        self.max_queue = None if on_overload == "wait" else (max_queue or 0)
+
+        self._active = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._admitted = 0
+        self._shed = 0
+        self._timed_out = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def admit(
+        self,
+        scanners: list[BaseDetector],
+        deadline: Deadline | None = None,
+        on_timeout: TimeoutPolicy = "fail_closed",
+    ) -> DetectionResult | None:
+        """
+        Waits for a slot.
+
+        Args:
+            scanners: The detectors the scan would run, named in timeout
+                verdicts.
+            deadline: The scan's deadline. Queue time counts against it.
+            on_timeout: Policy for a deadline that passes in the queue.
+
+        Returns:
+            DetectionResult | None: None once the scan holds a slot, which the
+            caller must give back with `release()`. Otherwise the verdict for a
+            scan that was shed or ran out of time in the queue.
+        """
+        if self._active < self.max_concurrency and not self._waiters:
+            self._active += 1
+            self._admitted += 1
+            return None
+
+        if self.max_queue is not None and len(self._waiters) >= self.max_queue:
+            self._shed += 1
+            logger.debug(
+                f"Deconvolute: Scan shed, {self._active} running and "
+                f"{len(self._waiters)} queued ({self.on_overload})."
+            )
+            return self._shed_result()
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        start = time.perf_counter()
+        try:
+            await wait_within(
+                waiter, deadline.remaining() if deadline is not None else None
+            )
+        except ScanTimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot arrived together with the timeout.
+                self.release()
+            self._timed_out += 1
+            timeout = deadline.timeout if deadline is not None else None
+            logger.warning(
+                f"Deconvolute: Scan exceeded its {timeout}s budget while queued "
+                f"for a slot ({on_timeout})."
+            )
+            return timeout_result(on_timeout, timeout, [], scanners)
+        except BaseException:
+            # Cancelled by the caller. If the slot was already handed over,
+            # pass it on; otherwise leave the queue.
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                self._remove(waiter)
+
+        waited = time.perf_counter() - start
+        self._admitted += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+        return None
+
+    def release(self) -> None:
+        """Gives a slot back, handing it directly to the next waiting scan."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    def stats(self) -> LimiterStats:
+        """Returns the current load and the queue wait times."""
+        return LimiterStats(
+            max_concurrency=self.max_concurrency,
+            max_queue=self.max_queue,
+            active=self._active,
+            queued=len(self._waiters),
+            admitted=self._admitted,
+            shed=self._shed,
+            timed_out=self._timed_out,
+            mean_wait_ms=(
+                self._total_wait / self._admitted * 1000 if self._admitted else 0.0
+            ),
+            max_wait_ms=self._max_wait * 1000,
+        )
+
+    def _shed_result(self) -> DetectionResult:
+        return DetectionResult(
+            threat_detected=self.on_overload == "fail_closed",
+            component="Scanner",
+            metadata={
+                "reason": "overload",
+                "on_overload": self.on_overload,
+                "active": self._active,
+                "queued": len(self._waiters),
+            },
+        )
+
+    def _remove(self, waiter: asyncio.Future[None]) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def __repr__(self) -> str:
+        return (
+            f"ConcurrencyLimiter(max_concurrency={self.max_concurrency}, "
+            f"max_queue={self.max_queue}, on_overload='{self.on_overload}')"
+        )
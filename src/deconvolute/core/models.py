@@ -0,0 +1,124 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from deconvolute.detectors.base import DetectionResult
+
+
+class BatchResult(BaseModel):
+    """
+    Aggregated output of a batch scan (`scan_many()` / `a_scan_many()`).
+
+    Attributes:
+        results (list[DetectionResult]): One result per input document, in input
+            order. Each entry follows the semantics of `scan()`: the result of the
+            first detector that found a threat, or a clean 'Scanner' result.
+        duplicates (int): Documents that repeated an earlier document of the
+            batch exactly and reuse its result instead of being scanned again.
+    """
+
+    results: list[DetectionResult] = Field(
+        default_factory=list, description="Per-document results in input order."
+    )
+    duplicates: int = Field(
+        default=0, description="Scans saved by reusing results of exact repeats."
+    )
+
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def threat_detected(self) -> bool:
+        """True if any document in the batch was flagged."""
+        return any(r.threat_detected for r in self.results)
+
+    @property
+    def threats(self) -> list[tuple[int, DetectionResult]]:
+        """Returns (input index, result) pairs for every flagged document."""
+        return [(i, r) for i, r in enumerate(self.results) if r.threat_detected]
+
+
+class DetectorReport(BaseModel):
+    """
+    One detector's contribution to a `ScanReport`.
+
+    Attributes:
+        component (str): The detector's class name.
+        result (DetectionResult): The detector's full result.
+        latency_ms (float): Wall time of the detector's check in milliseconds.
+    """
+
+    component: str
+    result: DetectionResult
+    latency_ms: float = Field(..., ge=0.0)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ScanReport(BaseModel):
+    """
+    Output of a full-report scan (`scan_report()` / `a_scan_report()`).
+
+    Unlike `scan()`, which stops at the first threat, a report runs every
+    detector and keeps all of their results.
+
+    Attributes:
+        detectors (list[DetectorReport]): One entry per detector, in the order
+            the detectors were given.
+        latency_ms (float): Wall time of the whole scan in milliseconds. With
+            concurrent execution this is less than the sum of the detector
+            latencies.
+    """
+
+    detectors: list[DetectorReport] = Field(
+        default_factory=list, description="Per-detector results in input order."
+    )
+    latency_ms: float = Field(default=0.0, ge=0.0)
+
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def threat_detected(self) -> bool:
+        """The combined verdict: True if any detector found a threat."""
+        return any(d.result.threat_detected for d in self.detectors)
+
+    @property
+    def threats(self) -> list[DetectionResult]:
+        """Returns the results of every detector that found a threat."""
+        return [d.result for d in self.detectors if d.result.threat_detected]
+
+    @property
+    def verdict(self) -> DetectionResult:
+        """
+        Returns the result `scan()` would have returned for the same detectors:
+        the first threat in detector order, or a clean 'Scanner' result.
+        """
+        for report in self.detectors:
+            if report.result.threat_detected:
+                return report.result
+        return DetectionResult(threat_detected=False, component="Scanner")
+
+
+class FileReport(BaseModel):
+    """
+    Outcome of scanning one file (`ProcessPoolEngine.scan_files()`).
+
+    Attributes:
+        path (str): The scanned file.
+        size_bytes (int): The file size.
+        result (DetectionResult | None): The verdict with `scan_file()`
+            semantics, or None if the file could not be scanned.
+        error (str | None): Why the file could not be scanned, if it could not.
+        detector_ms (dict[str, float]): Wall time per detector class in
+            milliseconds. Detectors after the first threat do not run.
+    """
+
+    path: str
+    size_bytes: int = Field(default=0, ge=0)
+    result: DetectionResult | None = None
+    error: str | None = None
+    detector_ms: dict[str, float] = Field(default_factory=dict)
+
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def threat_detected(self) -> bool:
+        """True if the file was scanned and flagged."""
+        return self.result is not None and self.result.threat_detected
@@ -1,19 +1,56 @@
+import asyncio
 import os
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from functools import partial
 from typing import TypeVar
 
-from deconvolute.core.defaults import get_guard_defaults, get_scan_defaults
-from deconvolute.detectors.base import BaseDetector, DetectionResult
-from deconvolute.errors import DeconvoluteError
-from deconvolute.utils.logger import get_logger
-
-logger = get_logger()
+from deconvolute.clients.base import MessageScanner
+from deconvolute.constants import (
+    DEFAULT_BATCH_CHUNK_SIZE,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_STREAM_OVERLAP,
+    DEFAULT_STREAM_WINDOW_SIZE,
+)
+from deconvolute.core.cache import ResultCache
+from deconvolute.core.configuration import (
+    resolve_api_key,
+    resolve_configuration,
+    wrap_client,
+)
+from deconvolute.core.defaults import get_default_suite
+from deconvolute.core.execution import (
+    a_report_content,
+    a_scan_batch,
+    a_scan_content,
+    a_scan_limited,
+    report_content,
+    scan_batch,
+    scan_content,
+    scan_path,
+    validate_batch_options,
+    with_window_offset,
+)
+from deconvolute.core.limiter import ConcurrencyLimiter
+from deconvolute.core.models import BatchResult, ScanReport
+from deconvolute.core.scheduler import AdaptiveScheduler
+from deconvolute.core.streaming import aiter_windows, iter_windows, validate_window
+from deconvolute.core.timeouts import TimeoutPolicy, resolve_timeout, validate_policy
+from deconvolute.detectors.base import BaseDetector, Content, DetectionResult
+from deconvolute.utils.deadline import Deadline
+from deconvolute.utils.executor import current_executor
 
 # TypeVar ensures that the IDE sees the return type as the same as the input type.
 T = TypeVar("T")
 
 
 def guard(
-    client: T, detectors: list[BaseDetector] | None = None, api_key: str | None = None
+    client: T,
+    detectors: list[BaseDetector] | None = None,
+    api_key: str | None = None,
+    timeout: float | None = None,
+    on_timeout: TimeoutPolicy = "fail_closed",
+    limiter: ConcurrencyLimiter | None = None,
+    conversations: MessageScanner | None = None,
 ) -> T:
     """
     Wraps an LLM client with Deconvolute security defenses.
@@ -30,6 +67,19 @@ def guard(
             If a list is provided, only those detectors are used (Strict Mode).
         api_key: The Deconvolute API key. If provided, it is injected into any
             detector that requires it but is missing configuration.
+        timeout: Time budget in seconds for validating each response. If None,
+            uses DECONVOLUTE_TIMEOUT_SEC or `DEFAULT_TIMEOUT_SEC`. Pass
+            `math.inf` to disable it.
+        on_timeout: 'fail_closed' (default) raises ThreatDetectedError when the
+            budget runs out, 'fail_open' logs a warning and returns the response.
+        limiter: Optional ConcurrencyLimiter bounding how many responses are
+            validated at once. Async clients only. A response shed under
+            'fail_closed' raises ThreatDetectedError; under 'fail_open' it is
+            returned unchecked (but still cleaned of canary tokens).
+        conversations: Optional ConversationScanner. The request messages are
+            scanned before they are sent, skipping those verified on earlier
+            turns, and a flagged request raises ThreatDetectedError. Pass
+            `deconvolute_session_id=...` to `create()` to name the conversation.
 
     Returns:
         A Proxy object that mimics the interface of the original client but
@@ -38,58 +88,29 @@ def guard(
     Raises:
         DeconvoluteError: If the client type is unsupported or if the required
             client library is not installed in the environment.
+        ConfigurationError: If the timeout options are invalid, or a limiter is
+            passed for a synchronous client.
     """
-    # Load Defaults if needed
+    # Load Defaults if needed (shared across calls, see core.defaults)
     if detectors is None:
-        detectors = get_guard_defaults()
+        detectors = get_default_suite("guard", api_key=resolve_api_key(api_key))
 
     # Inject API Keys
-    detectors = _resolve_configuration(detectors, api_key)
-
-    # Client Inspection
-    # We use string inspection to avoid importing libraries that might not be installed.
-    client_type = type(client).__name__
-    module_name = type(client).__module__
-
-    # Routing & Lazy Loading
-    # We only import the specific proxy implementation if we detect the client.
-
-    # OpenAI Support
-    if "openai" in module_name:
-        try:
-            from deconvolute.clients.openai import AsyncOpenAIProxy, OpenAIProxy
-
-            # Detect Async vs Sync based on class name convention
-            if "Async" in client_type:
-                logger.debug(
-                    f"Deconvolute: Wrapping Async OpenAI client ({client_type})"
-                )
-                return AsyncOpenAIProxy(client, detectors, api_key)  # type: ignore
-            else:
-                logger.debug(
-                    f"Deconvolute: Wrapping Sync OpenAI client ({client_type})"
-                )
-                return OpenAIProxy(client, detectors, api_key)  # type: ignore
-
-        except ImportError as e:
-            # This handles the case where the object claims to be from 'openai'
-            # but the library cannot be imported (e.g. broken environment).
-            raise DeconvoluteError(
-                f"Detected OpenAI client, but failed to import 'openai' library. "
-                f"Ensure it is installed: {e}"
-            ) from e
-
-    # Fallback: If we don't recognize the client, we must fail secure.
-    raise DeconvoluteError(
-        f"Unsupported client type: '{client_type}' from module '{module_name}'. "
-        "Deconvolute currently supports: OpenAI, AsyncOpenAI."
+    detectors = resolve_configuration(detectors, api_key)
+
+    return wrap_client(
+        client, detectors, api_key, timeout, on_timeout, limiter, conversations
     )
 
 
 def scan(
-    content: str,
+    content: Content,
     detectors: list[BaseDetector] | None = None,
     api_key: str | None = None,
+    scheduler: AdaptiveScheduler | None = None,
+    cache: ResultCache | None = None,
+    timeout: float | None = None,
+    on_timeout: TimeoutPolicy = "fail_closed",
 ) -> DetectionResult:
     """
     Synchronously scans a string for threats using the configured detectors.
@@ -100,77 +121,439 @@ def scan(
 
     Args:
         content: The text string to analyze.
-        detectors: Optional list of detectors. If None, uses Standard Suite.
+        detectors: Optional list of detectors. If None, uses the Standard Suite,
+            which is built once per process and reused across calls.
         api_key: Optional Deconvolute API key.
+        scheduler: Optional AdaptiveScheduler. If provided, detectors run in the
+            order it has learned minimizes time-to-verdict, and each check feeds
+            its latency and verdict back into it.
+        cache: Optional ResultCache. Detectors that support caching answer
+            repeated content from the cache instead of scanning it again.
+        timeout: Time budget in seconds for the whole scan. If None, uses
+            DECONVOLUTE_TIMEOUT_SEC or `DEFAULT_TIMEOUT_SEC`. Pass `math.inf` to
+            disable it. Detectors with a native timeout (SignatureDetector) are
+            interrupted; others are checked against the deadline between
+            detectors.
+        on_timeout: What to return when the budget runs out: 'fail_closed'
+            (default) flags the content, 'fail_open' reports it clean. Either
+            way the result has `metadata['reason'] == 'timeout'` and lists the
+            detectors that did and did not finish.
 
     Returns:
         DetectionResult: The result of the first detector that found a threat,
         or a clean result if all passed.
+
+    Raises:
+        ConfigurationError: If the timeout options are invalid.
     """
-    # Load Defaults if needed
+    deadline = Deadline(resolve_timeout(timeout))
+    validate_policy(on_timeout)
+
+    # Load Defaults if needed (shared across calls, see core.defaults)
     if detectors is None:
-        detectors = get_scan_defaults()
+        detectors = get_default_suite("scan", api_key=resolve_api_key(api_key))
 
     # Resolve config
-    detectors = _resolve_configuration(detectors, api_key)
+    detectors = resolve_configuration(detectors, api_key)
 
     # Filter for scanners (detectors with check())
     scanners = [d for d in detectors if hasattr(d, "check")]
 
-    for detector in scanners:
-        result = detector.check(content)
-        if result.threat_detected:
-            return result
-
-    return DetectionResult(threat_detected=False, component="Scanner")
+    return scan_content(scanners, content, scheduler, cache, deadline, on_timeout)
 
 
 async def a_scan(
-    content: str,
+    content: Content,
     detectors: list[BaseDetector] | None = None,
     api_key: str | None = None,
+    concurrent: bool = False,
+    scheduler: AdaptiveScheduler | None = None,
+    cache: ResultCache | None = None,
+    timeout: float | None = None,
+    on_timeout: TimeoutPolicy = "fail_closed",
+    limiter: ConcurrencyLimiter | None = None,
 ) -> DetectionResult:
     """
     Asynchronously scans a string for threats.
 
     See `scan()` for full documentation. This method is non-blocking and ideal
     for high-throughput async pipelines (FastAPI, LangChain).
+
+    Args:
+        content: The text string to analyze.
+        detectors: Optional list of detectors. If None, uses the Standard Suite.
+        api_key: Optional Deconvolute API key.
+        concurrent: If True, all detectors run at the same time. The first threat
+            to arrive is returned and the remaining checks are cancelled, so
+            latency is bounded by the slowest clean detector instead of the sum
+            of all detectors. If several detectors would flag the content, which
+            one is reported depends on timing.
+        scheduler: Optional AdaptiveScheduler for sequential execution. Ignored
+            when `concurrent` is True, since all detectors start at once.
+        cache: Optional ResultCache, see `scan()`.
+        timeout: Time budget in seconds, see `scan()`. Checks still running when
+            it passes are cancelled.
+        on_timeout: 'fail_closed' or 'fail_open', see `scan()`.
+        limiter: Optional ConcurrencyLimiter shared by concurrent calls. The
+            scan waits for a slot first (counted against `timeout`), or returns
+            the limiter's overload verdict if it is shed.
     """
+    deadline = Deadline(resolve_timeout(timeout))
+    validate_policy(on_timeout)
+
     # Load Defaults if needed
     if detectors is None:
-        detectors = get_scan_defaults()
+        detectors = get_default_suite("scan", api_key=resolve_api_key(api_key))
 
-    detectors = _resolve_configuration(detectors, api_key)
+    detectors = resolve_configuration(detectors, api_key)
     scanners = [d for d in detectors if hasattr(d, "check")]
 
-    for detector in scanners:
-        result = await detector.a_check(content)
+    return await a_scan_limited(
+        scanners, content, concurrent, scheduler, cache, deadline, on_timeout, limiter
+    )
+
+
+def scan_report(
+    content: Content,
+    detectors: list[BaseDetector] | None = None,
+    api_key: str | None = None,
+    concurrent: bool = False,
+    scheduler: AdaptiveScheduler | None = None,
+    cache: ResultCache | None = None,
+) -> ScanReport:
+    """
+    Runs every detector on the content and returns all of their results.
+
+    `scan()` stops at the first threat, which is what a request path wants. Audit
+    tooling usually wants the opposite: every detector's verdict, the combined
+    verdict and what each detector cost. A report provides that in one pass.
+
+    Args:
+        content: The text string to analyze.
+        detectors: Optional list of detectors. If None, uses the Standard Suite.
+        api_key: Optional Deconvolute API key.
+        concurrent: If True, detectors run in parallel on the detector
+            executor (see `executor_scope()`). This helps for detectors that
+            release the GIL (signature matching, language detection).
+        scheduler: Optional AdaptiveScheduler. Reports see every detector on
+            every document, so they feed it unbiased observations. The order of
+            the report itself is not affected.
+        cache: Optional ResultCache, see `scan()`.
+
+    Returns:
+        ScanReport: One entry per detector in input order, with timings.
+        `report.verdict` is the result `scan()` would have returned.
+    """
+    scanners = _resolve_scanners(detectors, api_key)
+    return report_content(scanners, content, concurrent, scheduler, cache)
+
+
+async def a_scan_report(
+    content: Content,
+    detectors: list[BaseDetector] | None = None,
+    api_key: str | None = None,
+    scheduler: AdaptiveScheduler | None = None,
+    cache: ResultCache | None = None,
+) -> ScanReport:
+    """
+    Asynchronously runs every detector on the content.
+
+    See `scan_report()` for full documentation. All detectors run concurrently,
+    so the report takes about as long as the slowest detector. If a detector
+    raises, the remaining checks are cancelled and the error is propagated.
+    """
+    scanners = _resolve_scanners(detectors, api_key)
+    return await a_report_content(scanners, content, scheduler, cache)
+
+
+def scan_stream(
+    chunks: Iterable[str],
+    detectors: list[BaseDetector] | None = None,
+    api_key: str | None = None,
+    window_size: int = DEFAULT_STREAM_WINDOW_SIZE,
+    overlap: int = DEFAULT_STREAM_OVERLAP,
+    timeout: float | None = None,
+    on_timeout: TimeoutPolicy = "fail_closed",
+) -> Iterator[DetectionResult]:
+    """
+    Scans a stream of text chunks without materializing the whole document.
+
+    Chunks are regrouped into windows of at most `window_size` characters.
+    Consecutive windows share `overlap` characters, so a signature split across
+    chunk or window boundaries is still seen whole as long as it is no longer
+    than `overlap`. Memory stays bounded by about one window, regardless of the
+    document size.
+
+    The generator yields one result per window and stops after the first threat,
+    so the caller can stop reading the source as soon as something matches.
+    Every result carries the window's character offset in
+    `metadata['window_offset']`.
+
+    Args:
+        chunks: The text stream (e.g. lines of a file or pages of an export).
+        detectors: Optional list of detectors. If None, uses the Standard Suite.
+        api_key: Optional Deconvolute API key.
+        window_size: Maximum number of characters scanned at once.
+        overlap: Number of characters repeated between consecutive windows.
+            Must be at least the length of the longest signature.
+        timeout: Time budget in seconds for each window, see `scan()`. The
+            budget is per window, since reading the stream may take any time.
+        on_timeout: 'fail_closed' or 'fail_open', see `scan()`. Under
+            'fail_closed' a window that runs out of time is flagged and ends
+            the stream; under 'fail_open' scanning continues with the next
+            window.
+
+    Yields:
+        DetectionResult: The verdict for each window, in stream order. The last
+        result is a threat if one was found.
+
+    Raises:
+        ConfigurationError: If the window or timeout options are invalid.
+    """
+    validate_window(window_size, overlap)
+    timeout = resolve_timeout(timeout)
+    validate_policy(on_timeout)
+    scanners = _resolve_scanners(detectors, api_key)
+
+    for offset, window in iter_windows(chunks, window_size, overlap):
+        result = scan_content(
+            scanners, window, deadline=Deadline(timeout), on_timeout=on_timeout
+        )
+        result = with_window_offset(result, offset)
+        yield result
         if result.threat_detected:
-            return result
+            return
 
-    return DetectionResult(threat_detected=False, component="Scanner")
 
+async def a_scan_stream(
+    chunks: Iterable[str] | AsyncIterable[str],
+    detectors: list[BaseDetector] | None = None,
+    api_key: str | None = None,
+    window_size: int = DEFAULT_STREAM_WINDOW_SIZE,
+    overlap: int = DEFAULT_STREAM_OVERLAP,
+    timeout: float | None = None,
+    on_timeout: TimeoutPolicy = "fail_closed",
+) -> AsyncIterator[DetectionResult]:
+    """
+    Asynchronously scans a stream of text chunks.
 
-def _resolve_configuration(
-    detectors: list[BaseDetector], api_key: str | None
-) -> list[BaseDetector]:
+    See `scan_stream()` for full documentation. Accepts both regular and async
+    iterables, e.g. an async file reader or an HTTP response body.
     """
-    Internal helper to inject API keys into configured detectors.
+    validate_window(window_size, overlap)
+    timeout = resolve_timeout(timeout)
+    validate_policy(on_timeout)
+    scanners = _resolve_scanners(detectors, api_key)
+
+    async for offset, window in aiter_windows(chunks, window_size, overlap):
+        result = await a_scan_content(
+            scanners, window, deadline=Deadline(timeout), on_timeout=on_timeout
+        )
+        result = with_window_offset(result, offset)
+        yield result
+        if result.threat_detected:
+            return
+
+
+def scan_file(
+    path: str | os.PathLike[str],
+    detectors: list[BaseDetector] | None = None,
+    api_key: str | None = None,
+    encoding: str = "utf-8",
+    window_size: int = DEFAULT_STREAM_WINDOW_SIZE,
+    overlap: int = DEFAULT_STREAM_OVERLAP,
+    timeout: float | None = None,
+    on_timeout: TimeoutPolicy = "fail_closed",
+) -> DetectionResult:
+    """
+    Scans a file on disk without reading it into one Python string.
+
+    Detectors with a native file API (`check_file()`, e.g. SignatureDetector)
+    get the path and let YARA memory-map the file. Other detectors see the file
+    through a memory map, decoded one window at a time as in `scan_stream()`,
+    and decoding stops at the first threat. Peak memory stays bounded by about
+    one window, regardless of the file size.
 
     Args:
-        detectors: The list of detectors (must not be None).
-        api_key: The user-provided API key (or None).
+        path: The file to scan.
+        detectors: Optional list of detectors. If None, uses the Standard Suite.
+        api_key: Optional Deconvolute API key.
+        encoding: The file's text encoding. Native file scanning is only used
+            for UTF-8 (and ASCII) files, since YARA matches raw bytes.
+        window_size: Maximum number of characters passed to a text detector at
+            once.
+        overlap: Number of characters repeated between consecutive windows,
+            see `scan_stream()`.
+        timeout: Time budget in seconds for the whole file, see `scan()`.
+        on_timeout: 'fail_closed' or 'fail_open', see `scan()`.
 
     Returns:
-        The configured detectors with keys injected.
+        DetectionResult: The first threat found, or a clean result. Threats
+        found in a window carry its character offset in
+        `metadata['window_offset']`.
+
+    Raises:
+        FileNotFoundError: If the path is not a file.
+        ConfigurationError: If the window or timeout options are invalid.
     """
-    final_key = api_key or os.getenv("DECONVOLUTE_API_KEY")
+    validate_window(window_size, overlap)
+    deadline = Deadline(resolve_timeout(timeout))
+    validate_policy(on_timeout)
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"No such file: {path}")
+
+    scanners = _resolve_scanners(detectors, api_key)
+    return scan_path(
+        scanners, path, encoding, window_size, overlap, deadline, on_timeout
+    )
+
+
+async def a_scan_file(
+    path: str | os.PathLike[str],
+    detectors: list[BaseDetector] | None = None,
+    api_key: str | None = None,
+    encoding: str = "utf-8",
+    window_size: int = DEFAULT_STREAM_WINDOW_SIZE,
+    overlap: int = DEFAULT_STREAM_OVERLAP,
+    timeout: float | None = None,
+    on_timeout: TimeoutPolicy = "fail_closed",
+) -> DetectionResult:
+    """
+    Asynchronously scans a file on disk.
 
-    # We only inject if the key is available and the detector is unconfigured.
-    if final_key:
-        for d in detectors:
-            if hasattr(d, "api_key") and getattr(d, "api_key", None) is None:
-                d.api_key = final_key
+    See `scan_file()` for full documentation. The scan runs on the detector
+    executor, so the event loop is not blocked by file I/O.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        current_executor(),
+        partial(
+            scan_file,
+            path,
+            detectors,
+            api_key,
+            encoding,
+            window_size,
+            overlap,
+            timeout,
+            on_timeout,
+        ),
+    )
+
+
+def scan_many(
+    contents: Iterable[Content],
+    detectors: list[BaseDetector] | None = None,
+    api_key: str | None = None,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+    scheduler: AdaptiveScheduler | None = None,
+    cache: ResultCache | None = None,
+    timeout: float | None = None,
+    on_timeout: TimeoutPolicy = "fail_closed",
+) -> BatchResult:
+    """
+    Synchronously scans many documents with a single configuration pass.
+
+    Configuration is resolved once for the whole batch. Documents are grouped into
+    chunks, and each chunk is handed to every detector via `check_batch()`.
+    Documents already flagged by an earlier detector are not passed to later ones,
+    so each document gets the same verdict it would get from `scan()`.
+
+    Exact duplicates within the batch are scanned once: every repeat gets the
+    result of its first occurrence, and `BatchResult.duplicates` reports how
+    many scans were saved. Repeats are found by length and `hash()`, which
+    Python caches on strings, and verified by equality against the recent
+    documents still held, or by a content digest for older ones. A batch
+    without duplicates computes no digests.
+
+    The input iterable is consumed lazily: at most `2 * concurrency` chunks are
+    waiting for results at any time, and as many unique documents are held
+    to verify repeats. Older documents are released; only a small key per
+    unique document and all results are kept until the batch completes.
+
+    Args:
+        contents: The documents to analyze. Any iterable (list, generator, ...).
+        detectors: Optional list of detectors. If None, uses the Standard Suite.
+        api_key: Optional Deconvolute API key.
+        concurrency: Number of chunks scanned in parallel worker threads.
+            Use 1 to scan on the calling thread.
+        chunk_size: Number of documents per chunk.
+        scheduler: Optional AdaptiveScheduler. Detector order is chosen per
+            chunk, and each chunk's timings and verdicts are fed back into it.
+        cache: Optional ResultCache. Only documents missing from the cache are
+            passed to the detectors.
+        timeout: Time budget in seconds for each chunk (not the whole batch).
+            If None, uses DECONVOLUTE_TIMEOUT_SEC or `DEFAULT_TIMEOUT_SEC`.
+        on_timeout: Verdict for the documents of a chunk that could not be
+            fully scanned in time, see `scan()`. Threats found before the
+            deadline are kept.
+
+    Returns:
+        BatchResult: One result per document, in input order.
+
+    Raises:
+        ConfigurationError: If `concurrency` or `chunk_size` is less than 1, or
+            the timeout options are invalid.
+    """
+    validate_batch_options(concurrency, chunk_size)
+    timeout = resolve_timeout(timeout)
+    validate_policy(on_timeout)
+
+    scanners = _resolve_scanners(detectors, api_key)
+    return scan_batch(
+        scanners,
+        contents,
+        concurrency,
+        chunk_size,
+        scheduler,
+        cache,
+        timeout,
+        on_timeout,
+    )
+
+
+async def a_scan_many(
+    contents: Iterable[Content],
+    detectors: list[BaseDetector] | None = None,
+    api_key: str | None = None,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+    scheduler: AdaptiveScheduler | None = None,
+    cache: ResultCache | None = None,
+    timeout: float | None = None,
+    on_timeout: TimeoutPolicy = "fail_closed",
+) -> BatchResult:
+    """
+    Asynchronously scans many documents with a single configuration pass.
+
+    See `scan_many()` for full documentation. Chunks are dispatched to each
+    detector's `a_check_batch()`, with at most `concurrency` chunks in flight.
+    Batch calls still running when a chunk's deadline passes are cancelled.
+    """
+    validate_batch_options(concurrency, chunk_size)
+    timeout = resolve_timeout(timeout)
+    validate_policy(on_timeout)
+
+    scanners = _resolve_scanners(detectors, api_key)
+    return await a_scan_batch(
+        scanners,
+        contents,
+        concurrency,
+        chunk_size,
+        scheduler,
+        cache,
+        timeout,
+        on_timeout,
+    )
+
+
+def _resolve_scanners(
+    detectors: list[BaseDetector] | None, api_key: str | None
+) -> list[BaseDetector]:
+    """Loads defaults, resolves configuration and filters for scanners."""
+    if detectors is None:
+        detectors = get_default_suite("scan", api_key=resolve_api_key(api_key))
 
-    return detectors
-    return detectors
+    detectors = resolve_configuration(detectors, api_key)
+    return [d for d in detectors if hasattr(d, "check")]
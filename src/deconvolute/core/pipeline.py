@@ -0,0 +1,281 @@
+import math
+from collections.abc import Iterable
+from types import TracebackType
+from typing import TypeVar
+
+from deconvolute.clients.base import MessageScanner
+from deconvolute.constants import DEFAULT_BATCH_CHUNK_SIZE, DEFAULT_BATCH_CONCURRENCY
+from deconvolute.core.cache import ResultCache
+from deconvolute.core.configuration import (
+    resolve_api_key,
+    resolve_configuration,
+    wrap_client,
+)
+from deconvolute.core.defaults import get_default_suite
+from deconvolute.core.execution import (
+    a_report_content,
+    a_scan_batch,
+    a_scan_chunk,
+    a_scan_limited,
+    report_content,
+    scan_batch,
+    scan_chunk,
+    scan_content,
+    validate_batch_options,
+)
+from deconvolute.core.limiter import ConcurrencyLimiter
+from deconvolute.core.models import BatchResult, ScanReport
+from deconvolute.core.scheduler import AdaptiveScheduler
+from deconvolute.core.timeouts import TimeoutPolicy, resolve_timeout, validate_policy
+from deconvolute.detectors.base import BaseDetector, Content, DetectionResult
+from deconvolute.utils.deadline import Deadline
+from deconvolute.utils.executor import DetectorExecutor, executor_scope
+
+T = TypeVar("T")
+
+
+class Pipeline:
+    """
+    A detector suite resolved once and reused for every call.
+
+    The module-level `scan()`, `a_scan()` and `scan_many()` resolve their
+    configuration on every call: API key lookup, capability filtering and the
+    timeout default from the environment. For hot paths, build a Pipeline once
+    and call its methods instead; they go straight to the detectors.
+
+        pipeline = Pipeline([SignatureDetector()], cache=ResultCache())
+        result = pipeline.scan(doc_chunk)
+
+    The resolved configuration is frozen at construction. Changes to the
+    environment (e.g. DECONVOLUTE_TIMEOUT_SEC) only affect new pipelines.
+
+    Attributes:
+        detectors (tuple[BaseDetector, ...]): All configured detectors.
+        scanners (tuple[BaseDetector, ...]): Detectors that implement `check()`,
+            in execution order.
+        injectors (tuple[BaseDetector, ...]): Detectors that implement
+            `inject()`, used when wrapping clients with `guard()`.
+        timeout (float | None): The resolved time budget, or None if unbounded.
+        on_timeout (TimeoutPolicy): The timeout policy.
+        executor (DetectorExecutor | None): Executor for the async methods of
+            detectors that do not have their own, or None for the shared one.
+        limiter (ConcurrencyLimiter | None): Bounds concurrent `a_scan()` calls
+            and validations of guarded async clients.
+    """
+
+    def __init__(
+        self,
+        detectors: list[BaseDetector] | None = None,
+        api_key: str | None = None,
+        scheduler: AdaptiveScheduler | None = None,
+        cache: ResultCache | None = None,
+        timeout: float | None = None,
+        on_timeout: TimeoutPolicy = "fail_closed",
+        executor: DetectorExecutor | None = None,
+        limiter: ConcurrencyLimiter | None = None,
+    ):
+        """
+        Args:
+            detectors: The detectors to run. If None, uses the shared Standard
+                Suite for scanning (see `scan()`).
+            api_key: Optional Deconvolute API key, injected into detectors that
+                need one.
+            scheduler: Optional AdaptiveScheduler used by sequential scans.
+            cache: Optional ResultCache used by every scan.
+            timeout: Time budget in seconds, see `scan()`. Resolved once here.
+            on_timeout: 'fail_closed' or 'fail_open', see `scan()`.
+            executor: Optional executor for this pipeline's async scans. The
+                detectors themselves are not modified, so a shared suite can
+                be used by pipelines with different executors.
+            limiter: Optional ConcurrencyLimiter, see `a_scan()`. A pipeline
+                with a limiter can only guard async clients.
+
+        Raises:
+            ConfigurationError: If the timeout options are invalid.
+        """
+        self.timeout = resolve_timeout(timeout)
+        validate_policy(on_timeout)
+        self.on_timeout: TimeoutPolicy = on_timeout
+
+        self.api_key = resolve_api_key(api_key)
+        if detectors is None:
+            detectors = get_default_suite("scan", api_key=self.api_key)
+        detectors = resolve_configuration(list(detectors), self.api_key)
+
+        self.detectors = tuple(detectors)
+        self.scanners = tuple(d for d in detectors if hasattr(d, "check"))
+        self.injectors = tuple(d for d in detectors if hasattr(d, "inject"))
+        self.scheduler = scheduler
+        self.cache = cache
+        self.executor = executor
+        self.limiter = limiter
+
+        # The helpers take lists; this one is never mutated.
+        self._scanners = list(self.scanners)
+
+    def scan(self, content: Content) -> DetectionResult:
+        """Scans one document. See `deconvolute.scan()`."""
+        return scan_content(
+            self._scanners,
+            content,
+            self.scheduler,
+            self.cache,
+            Deadline(self.timeout),
+            self.on_timeout,
+        )
+
+    async def a_scan(
+        self, content: Content, concurrent: bool = False
+    ) -> DetectionResult:
+        """Async version of scan. See `deconvolute.a_scan()` for `concurrent`."""
+        deadline = Deadline(self.timeout)
+        with executor_scope(self.executor):
+            return await a_scan_limited(
+                self._scanners,
+                content,
+                concurrent,
+                self.scheduler,
+                self.cache,
+                deadline,
+                self.on_timeout,
+                self.limiter,
+            )
+
+    def scan_many(
+        self,
+        contents: Iterable[Content],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+    ) -> BatchResult:
+        """Scans many documents. See `deconvolute.scan_many()`."""
+        validate_batch_options(concurrency, chunk_size)
+        return scan_batch(
+            self._scanners,
+            contents,
+            concurrency,
+            chunk_size,
+            self.scheduler,
+            self.cache,
+            self.timeout,
+            self.on_timeout,
+        )
+
+    async def a_scan_many(
+        self,
+        contents: Iterable[Content],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+    ) -> BatchResult:
+        """Async version of scan_many."""
+        validate_batch_options(concurrency, chunk_size)
+        with executor_scope(self.executor):
+            return await a_scan_batch(
+                self._scanners,
+                contents,
+                concurrency,
+                chunk_size,
+                self.scheduler,
+                self.cache,
+                self.timeout,
+                self.on_timeout,
+            )
+
+    def scan_chunk(self, contents: list[Content]) -> list[DetectionResult]:
+        """
+        Scans a few documents with one batch call per detector.
+
+        Unlike `scan_many()`, the documents are not deduplicated or split into
+        chunks, and share a single time budget. Used to scan the documents
+        collected by a MicroBatcher or the new messages of a conversation.
+
+        Args:
+            contents: The documents to scan.
+
+        Returns:
+            list[DetectionResult]: One result per document, in input order.
+        """
+        return scan_chunk(
+            self._scanners,
+            contents,
+            self.scheduler,
+            self.cache,
+            self.timeout,
+            self.on_timeout,
+        )
+
+    async def a_scan_chunk(self, contents: list[Content]) -> list[DetectionResult]:
+        """Async version of scan_chunk."""
+        with executor_scope(self.executor):
+            return await a_scan_chunk(
+                self._scanners,
+                contents,
+                self.scheduler,
+                self.cache,
+                self.timeout,
+                self.on_timeout,
+            )
+
+    def scan_report(self, content: Content, concurrent: bool = False) -> ScanReport:
+        """Runs every scanner on the content. See `deconvolute.scan_report()`."""
+        return report_content(
+            self._scanners, content, concurrent, self.scheduler, self.cache
+        )
+
+    async def a_scan_report(self, content: Content) -> ScanReport:
+        """Async version of scan_report."""
+        with executor_scope(self.executor):
+            return await a_report_content(
+                self._scanners, content, self.scheduler, self.cache
+            )
+
+    def guard(self, client: T, conversations: MessageScanner | None = None) -> T:
+        """
+        Wraps an LLM client with this pipeline's detectors and timeout policy.
+        See `deconvolute.guard()`.
+
+        Note that a pipeline built without explicit detectors holds the scanning
+        suite. For conversational defenses, build it from `get_guard_defaults()`.
+
+        Args:
+            client: The LLM client to wrap.
+            conversations: Optional ConversationScanner for the request
+                messages.
+        """
+        # The proxy resolves None to the global default, so pass "unbounded"
+        # explicitly.
+        timeout = self.timeout if self.timeout is not None else math.inf
+        return wrap_client(
+            client,
+            list(self.detectors),
+            self.api_key,
+            timeout,
+            self.on_timeout,
+            self.limiter,
+            conversations,
+        )
+
+    def close(self) -> None:
+        """
+        Closes the pipeline.
+
+        A pipeline does not create detectors: explicit ones belong to the
+        caller, who may share them with other pipelines, and the default suite
+        is shared by the whole process. Neither is closed here, and neither is
+        the executor. Close explicit detectors where they were created, e.g.
+        with `with SignatureDetector() as detector:`.
+        """
+
+    def __enter__(self) -> "Pipeline":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        names = [type(d).__name__ for d in self.detectors]
+        return f"Pipeline(detectors={names}, timeout={self.timeout})"
@@ -0,0 +1,287 @@
+import asyncio
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from types import TracebackType
+
+from deconvolute.constants import (
+    DEFAULT_PROCESS_CHUNK_SIZE,
+    DEFAULT_STREAM_OVERLAP,
+    DEFAULT_STREAM_WINDOW_SIZE,
+)
+from deconvolute.core.execution import batch_deduplicator, batch_result, scan_path
+from deconvolute.core.models import BatchResult, FileReport
+from deconvolute.core.orchestrator import scan_many
+from deconvolute.core.timeouts import TimeoutPolicy, resolve_timeout, validate_policy
+from deconvolute.detectors.base import BaseDetector, DetectionResult, DetectorSpec
+from deconvolute.detectors.content.signature.engine import SignatureDetector
+from deconvolute.errors import ConfigurationError, DeconvoluteError
+from deconvolute.utils.deadline import Deadline
+from deconvolute.utils.iterables import chunked
+from deconvolute.utils.logger import get_logger
+
+logger = get_logger()
+
+# Detectors built once per worker process by _init_worker().
+_worker_detectors: list[BaseDetector] = []
+
+
+def _init_worker(specs: list[DetectorSpec]) -> None:
+    """Pool initializer: compiles rules / loads models once per worker."""
+    global _worker_detectors
+    _worker_detectors = [spec.build() for spec in specs]
+
+
+def _scan_in_worker(chunk: list[str]) -> list[DetectionResult]:
+    """Scans one chunk with the worker's detectors (scan_many semantics)."""
+    return scan_many(
+        chunk, detectors=_worker_detectors, concurrency=1, chunk_size=len(chunk)
+    ).results
+
+
+def _scan_file_in_worker(
+    path: str, encoding: str, timeout: float | None, on_timeout: TimeoutPolicy
+) -> FileReport:
+    """Scans one file with the worker's detectors (scan_file semantics)."""
+    return scan_one_file(_worker_detectors, path, encoding, timeout, on_timeout)
+
+
+def scan_one_file(
+    detectors: list[BaseDetector],
+    path: str,
+    encoding: str = "utf-8",
+    timeout: float | None = None,
+    on_timeout: TimeoutPolicy = "fail_closed",
+) -> FileReport:
+    """
+    Scans one file and reports its verdict, size and per-detector time.
+
+    Files that cannot be read are reported with an error instead of raising,
+    so one bad file does not abort a corpus scan.
+
+    Args:
+        detectors: The detectors to run. Only those with `check()` are used.
+        path: The file to scan.
+        encoding: The file's text encoding, see `scan_file()`.
+        timeout: Resolved time budget in seconds for the file, or None if
+            unbounded.
+        on_timeout: 'fail_closed' or 'fail_open', see `scan()`.
+    """
+    scanners = [d for d in detectors if hasattr(d, "check")]
+    timings: dict[str, float] = {}
+    try:
+        size = os.path.getsize(path)
+        result = scan_path(
+            scanners,
+            path,
+            encoding,
+            DEFAULT_STREAM_WINDOW_SIZE,
+            DEFAULT_STREAM_OVERLAP,
+            Deadline(timeout),
+            on_timeout,
+            timings,
+        )
+    except (OSError, DeconvoluteError) as e:
+        return FileReport(path=path, error=f"{type(e).__name__}: {e}")
+
+    return FileReport(
+        path=path,
+        size_bytes=size,
+        result=result,
+        detector_ms={name: seconds * 1000 for name, seconds in timings.items()},
+    )
+
+
+class ProcessPoolEngine:
+    """
+    Scans documents across CPU cores using a pool of worker processes.
+
+    The thread pools used by the detectors do not give multi-core speedups for
+    Python-side work (result construction, tag extraction), since those hold
+    the GIL. This engine runs whole detector suites in separate processes
+    instead. Detectors are shipped to the workers as picklable `DetectorSpec`s,
+    and each worker compiles rules / loads language models once at startup.
+
+    Documents are sent to workers in chunks to amortize inter-process overhead.
+    Results keep the semantics of `scan()` / `scan_many()`.
+
+    Use it as a context manager, or call `close()` when done:
+
+        with ProcessPoolEngine([SignatureDetector()], max_workers=8) as engine:
+            batch = engine.scan_many(documents)
+
+    Note:
+        Workers are started with the 'spawn' method by default, so scripts that
+        create an engine must guard their entry point with
+        `if __name__ == "__main__":`.
+    """
+
+    def __init__(
+        self,
+        detectors: Sequence[BaseDetector | DetectorSpec] | None = None,
+        max_workers: int | None = None,
+        chunk_size: int = DEFAULT_PROCESS_CHUNK_SIZE,
+        mp_context: str = "spawn",
+    ):
+        """
+        Args:
+            detectors: Detectors or specs to run in each worker. Detector
+                instances are converted with `to_spec()`. If None, the standard
+                scan suite (SignatureDetector) is used.
+            max_workers: Number of worker processes. Defaults to the number of
+                CPUs.
+            chunk_size: Number of documents sent to a worker at once.
+            mp_context: Multiprocessing start method ('spawn', 'forkserver' or
+                'fork').
+
+        Raises:
+            ConfigurationError: If a detector cannot be described as a spec or
+                the options are invalid.
+        """
+        if chunk_size < 1:
+            raise ConfigurationError(f"chunk_size must be >= 1, got {chunk_size}.")
+
+        if detectors is None:
+            self.specs = [DetectorSpec.of(SignatureDetector)]
+        else:
+            self.specs = [
+                d if isinstance(d, DetectorSpec) else d.to_spec() for d in detectors
+            ]
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(mp_context),
+            initializer=_init_worker,
+            initargs=(self.specs,),
+        )
+        logger.debug(
+            f"Started process pool engine with {self.max_workers} workers "
+            f"and {len(self.specs)} detectors."
+        )
+
+    def scan(self, content: str) -> DetectionResult:
+        """Scans one document in a worker process. See `scan()`."""
+        return self._pool.submit(_scan_in_worker, [content]).result()[0]
+
+    async def a_scan(self, content: str) -> DetectionResult:
+        """Async version of scan. Does not block the event loop."""
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(self._pool, _scan_in_worker, [content])
+        return results[0]
+
+    def scan_many(self, contents: Iterable[str]) -> BatchResult:
+        """
+        Scans many documents, distributing chunks across the workers.
+
+        The input is consumed lazily with at most two chunks per worker in
+        flight. Exact duplicates are sent to the workers only once. Results
+        are returned in input order.
+        """
+        results: list[DetectionResult] = []
+        in_flight: deque[Future[list[DetectionResult]]] = deque()
+        dedup = batch_deduplicator(2 * self.max_workers * self.chunk_size)
+
+        for chunk in chunked(dedup.unique(contents), self.chunk_size):
+            in_flight.append(self._pool.submit(_scan_in_worker, chunk))
+            if len(in_flight) >= 2 * self.max_workers:
+                results.extend(in_flight.popleft().result())
+
+        while in_flight:
+            results.extend(in_flight.popleft().result())
+
+        return batch_result(dedup, results)
+
+    async def a_scan_many(self, contents: Iterable[str]) -> BatchResult:
+        """Async version of scan_many."""
+        loop = asyncio.get_running_loop()
+        results: list[DetectionResult] = []
+        in_flight: deque[asyncio.Future[list[DetectionResult]]] = deque()
+        dedup = batch_deduplicator(2 * self.max_workers * self.chunk_size)
+
+        try:
+            for chunk in chunked(dedup.unique(contents), self.chunk_size):
+                in_flight.append(
+                    loop.run_in_executor(self._pool, _scan_in_worker, chunk)
+                )
+                if len(in_flight) >= 2 * self.max_workers:
+                    results.extend(await in_flight.popleft())
+
+            while in_flight:
+                results.extend(await in_flight.popleft())
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+        return batch_result(dedup, results)
+
+    def scan_files(
+        self,
+        paths: Iterable[str],
+        encoding: str = "utf-8",
+        timeout: float | None = None,
+        on_timeout: TimeoutPolicy = "fail_closed",
+    ) -> Iterator[FileReport]:
+        """
+        Scans files in the worker processes, one file per task.
+
+        Workers scan with `scan_file()` semantics, so large files are memory-
+        mapped rather than sent between processes. Paths are consumed lazily
+        with at most two files per worker in flight, and reports are yielded in
+        input order as soon as they are ready.
+
+        Args:
+            paths: The files to scan.
+            encoding: The files' text encoding, see `scan_file()`.
+            timeout: Time budget in seconds per file, see `scan()`.
+            on_timeout: 'fail_closed' or 'fail_open', see `scan()`.
+
+        Yields:
+            FileReport: One report per path. Unreadable files are reported with
+            an error instead of raising.
+
+        Raises:
+            ConfigurationError: If the timeout options are invalid.
+        """
+        budget = resolve_timeout(timeout)
+        validate_policy(on_timeout)
+
+        in_flight: deque[Future[FileReport]] = deque()
+        try:
+            for path in paths:
+                in_flight.append(
+                    self._pool.submit(
+                        _scan_file_in_worker, path, encoding, budget, on_timeout
+                    )
+                )
+                if len(in_flight) >= 2 * self.max_workers:
+                    yield in_flight.popleft().result()
+
+            while in_flight:
+                yield in_flight.popleft().result()
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    def close(self) -> None:
+        """Shuts down the worker processes. Queued chunks are cancelled."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "ProcessPoolEngine":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        targets = [spec.target.rpartition(".")[2] for spec in self.specs]
+        return f"ProcessPoolEngine(workers={self.max_workers}, detectors={targets})"
@@ -0,0 +1,153 @@
+import codecs
+import mmap
+import os
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+from deconvolute.errors import ConfigurationError
+
+
+def validate_window(window_size: int, overlap: int) -> None:
+    """
+    Checks that a window configuration makes progress.
+
+    Raises:
+        ConfigurationError: If the window is empty or the overlap does not leave
+            room for new content in each window.
+    """
+    if window_size < 1:
+        raise ConfigurationError(f"window_size must be >= 1, got {window_size}.")
+    if not 0 <= overlap < window_size:
+        raise ConfigurationError(
+            f"overlap must be in [0, window_size), got {overlap} "
+            f"for window_size {window_size}."
+        )
+
+
+def iter_windows(
+    chunks: Iterable[str], window_size: int, overlap: int
+) -> Iterator[tuple[int, str]]:
+    """
+    Regroups a stream of text chunks into overlapping windows.
+
+    Each window holds at most `window_size` characters and repeats the last
+    `overlap` characters of the previous window. Any substring of up to
+    `overlap + 1` characters therefore appears whole in at least one window, no
+    matter how the input was split into chunks.
+
+    Memory is bounded by roughly `window_size` plus the size of one chunk.
+
+    Args:
+        chunks: The text stream, in any chunking.
+        window_size: Maximum window length in characters.
+        overlap: Number of characters shared by consecutive windows.
+
+    Yields:
+        tuple[int, str]: The character offset of the window in the stream and
+        the window text.
+    """
+    validate_window(window_size, overlap)
+
+    state = _WindowState(window_size, overlap)
+    for chunk in chunks:
+        yield from state.push(chunk)
+    yield from state.flush()
+
+
+async def aiter_windows(
+    chunks: Iterable[str] | AsyncIterable[str], window_size: int, overlap: int
+) -> AsyncIterator[tuple[int, str]]:
+    """
+    Async version of iter_windows. Accepts sync or async chunk sources.
+    """
+    validate_window(window_size, overlap)
+
+    state = _WindowState(window_size, overlap)
+    if isinstance(chunks, AsyncIterable):
+        async for chunk in chunks:
+            for window in state.push(chunk):
+                yield window
+    else:
+        for chunk in chunks:
+            for window in state.push(chunk):
+                yield window
+
+    for window in state.flush():
+        yield window
+
+
+def iter_file_text(
+    path: str | os.PathLike[str], encoding: str, chunk_size: int
+) -> Iterator[str]:
+    """
+    Decodes a file lazily through a memory map.
+
+    Only the bytes of the chunk being decoded are touched, so a caller that
+    stops early (e.g. at the first threat) never decodes the rest of the file.
+    Undecodable bytes are replaced rather than raising.
+
+    Args:
+        path: The file to read.
+        encoding: The file's text encoding.
+        chunk_size: Number of bytes decoded at once.
+
+    Yields:
+        str: Consecutive pieces of the file's text.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    with open(path, "rb") as f:
+        # mmap cannot map an empty file.
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            for start in range(0, len(view), chunk_size):
+                text = decoder.decode(view[start : start + chunk_size])
+                if text:
+                    yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+class _WindowState:
+    """Incremental buffer shared by the sync and async window iterators."""
+
+    def __init__(self, window_size: int, overlap: int):
+        self.window_size = window_size
+        self.step = window_size - overlap
+        self.overlap = overlap
+
+        # We collect parts and join lazily to avoid quadratic concatenation
+        # when the source yields many small chunks.
+        self._parts: list[str] = []
+        self._size = 0
+        # Offset of the first buffered character in the stream.
+        self._offset = 0
+        self._emitted = False
+
+    def push(self, chunk: str) -> Iterator[tuple[int, str]]:
+        if not chunk:
+            return
+        self._parts.append(chunk)
+        self._size += len(chunk)
+        if self._size < self.window_size:
+            return
+
+        buffer = "".join(self._parts)
+        start = 0
+        while len(buffer) - start >= self.window_size:
+            yield self._offset, buffer[start : start + self.window_size]
+            self._emitted = True
+            start += self.step
+            self._offset += self.step
+
+        rest = buffer[start:]
+        self._parts = [rest]
+        self._size = len(rest)
+
+    def flush(self) -> Iterator[tuple[int, str]]:
+        # After a full window, the first `overlap` buffered characters have
+        # already been scanned. Only emit a tail if it holds anything new.
+        if self._size and (not self._emitted or self._size > self.overlap):
+            yield self._offset, "".join(self._parts)
+        self._parts = []
+        self._size = 0
@@ -0,0 +1,142 @@
+import asyncio
+import math
+import os
+from collections.abc import Awaitable
+from typing import Literal, TypeVar, get_args
+
+from deconvolute.constants import DEFAULT_TIMEOUT_SEC
+from deconvolute.detectors.base import BaseDetector, DetectionResult
+from deconvolute.errors import ConfigurationError, ScanTimeoutError
+from deconvolute.utils.deadline import Deadline
+
+T = TypeVar("T")
+
+# What a scan returns when its deadline passes before every detector has run.
+# 'fail_closed' treats the content as a threat, 'fail_open' lets it through.
+TimeoutPolicy = Literal["fail_closed", "fail_open"]
+
+TIMEOUT_ENV_VAR = "DECONVOLUTE_TIMEOUT_SEC"
+
+
+def resolve_timeout(timeout: float | None) -> float | None:
+    """
+    Returns the effective time budget for a call.
+
+    Args:
+        timeout: The explicit budget in seconds, or None for the global default
+            (DECONVOLUTE_TIMEOUT_SEC, falling back to DEFAULT_TIMEOUT_SEC).
+            `math.inf` disables the deadline.
+
+    Returns:
+        float | None: The budget in seconds, or None if unbounded.
+
+    Raises:
+        ConfigurationError: If the budget is not positive or the environment
+            variable cannot be parsed.
+    """
+    if timeout is None:
+        raw = os.getenv(TIMEOUT_ENV_VAR)
+        if raw is None:
+            timeout = DEFAULT_TIMEOUT_SEC
+        else:
+            try:
+                timeout = float(raw)
+            except ValueError as e:
+                raise ConfigurationError(
+                    f"{TIMEOUT_ENV_VAR} must be a number of seconds, got '{raw}'."
+                ) from e
+
+    if not timeout > 0:
+        raise ConfigurationError(f"timeout must be > 0, got {timeout}.")
+
+    return None if math.isinf(timeout) else timeout
+
+
+def validate_policy(on_timeout: str) -> None:
+    """Raises ConfigurationError for an unknown timeout policy."""
+    if on_timeout not in get_args(TimeoutPolicy):
+        raise ConfigurationError(
+            f"on_timeout must be one of {get_args(TimeoutPolicy)}, got '{on_timeout}'."
+        )
+
+
+def timeout_result(
+    on_timeout: TimeoutPolicy,
+    timeout: float | None,
+    completed: list[BaseDetector],
+    timed_out: list[BaseDetector],
+) -> DetectionResult:
+    """
+    Builds the verdict for a scan whose deadline passed.
+
+    Every detector that finished before the deadline found the content clean
+    (otherwise the scan would have returned its threat), so the partial results
+    are recorded as the names of the detectors that did and did not finish.
+
+    Args:
+        on_timeout: The policy deciding the verdict.
+        timeout: The budget that was exceeded, in seconds.
+        completed: Detectors that finished in time.
+        timed_out: Detectors that were interrupted or never started.
+
+    Returns:
+        DetectionResult: A 'Scanner' result, flagged if the policy is
+        'fail_closed'.
+    """
+    return DetectionResult(
+        threat_detected=on_timeout == "fail_closed",
+        component="Scanner",
+        metadata={
+            "reason": "timeout",
+            "on_timeout": on_timeout,
+            "timeout_sec": timeout,
+            "completed": [type(d).__name__ for d in completed],
+            "timed_out": [type(d).__name__ for d in timed_out],
+        },
+    )
+
+
+def deadline_kwargs(deadline: Deadline | None) -> dict[str, float]:
+    """
+    Returns the keyword arguments that pass a deadline on to a detector.
+
+    Detectors with a native timeout (e.g. SignatureDetector, via YARA) read
+    `timeout` from their keyword arguments. Others ignore it.
+
+    Args:
+        deadline: The deadline of the current call, or None.
+
+    Returns:
+        dict[str, float]: `{'timeout': seconds_left}`, or an empty dict if the
+        call is unbounded.
+
+    Raises:
+        ScanTimeoutError: If the deadline has already passed.
+    """
+    if deadline is None:
+        return {}
+    remaining = deadline.remaining()
+    if remaining is None:
+        return {}
+    if remaining <= 0.0:
+        raise ScanTimeoutError("Scan deadline exceeded.")
+    return {"timeout": remaining}
+
+
+async def wait_within(call: Awaitable[T], timeout: float | None) -> T:
+    """
+    Awaits a detector call, cancelling it once `timeout` seconds have passed.
+
+    Cancelling an executor-backed check (e.g. SignatureDetector.a_check) stops
+    waiting for it immediately; the worker thread finishes on its own, bounded
+    by the detector's native timeout if it has one.
+
+    Raises:
+        ScanTimeoutError: If the call does not finish in time.
+    """
+    if timeout is None:
+        return await call
+    try:
+        return await asyncio.wait_for(call, timeout)
+    except TimeoutError as e:
+        raise ScanTimeoutError("Scan deadline exceeded.") from e
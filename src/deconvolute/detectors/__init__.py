@@ -1,4 +1,4 @@
-from .base import BaseDetector, DetectionResult
+from .base import BaseDetector, DetectionResult, DetectorSpec
 from .content.language.engine import LanguageDetector
 from .content.language.models import LanguageResult
 from .integrity.canary.engine import CanaryDetector
@@ -7,6 +7,7 @@ from .integrity.canary.models import CanaryResult
 __all__ = [
     "BaseDetector",
     "DetectionResult",
+    "DetectorSpec",
     "CanaryDetector",
     "CanaryResult",
     "LanguageDetector",
@@ -1,9 +1,42 @@
+import asyncio
+import importlib
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
 from datetime import UTC, datetime
-from typing import Any
+from types import TracebackType
+from typing import Any, Literal, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from deconvolute.errors import ConfigurationError
+from deconvolute.utils.executor import DetectorExecutor, current_executor
+
+T = TypeVar("T")
+D = TypeVar("D", bound="BaseDetector")
+
+# How expensive a detector's blocking work is. The async methods of 'cheap'
+# detectors run inline on the event loop, since handing a substring test to a
+# worker thread costs more than the test. 'expensive' work is offloaded.
+DetectorCost = Literal["cheap", "expensive"]
+
+# Raw document bytes, e.g. read from object storage. Detectors that set
+# `accepts_bytes` scan them as they are. All others receive them decoded as
+# UTF-8.
+BytesLike = bytes | bytearray | memoryview
+Content = str | BytesLike
+
+
+def as_text(content: Content) -> str:
+    """
+    Returns content as text, decoding bytes as UTF-8.
+
+    Undecodable bytes are replaced rather than raising, so malformed input is
+    still scanned.
+    """
+    if isinstance(content, str):
+        return content
+    return str(content, "utf-8", "replace")
+
 
 class DetectionResult(BaseModel):
     """
@@ -48,11 +81,82 @@ class DetectionResult(BaseModel):
         return not self.threat_detected
 
 
+class DetectorSpec(BaseModel):
+    """
+    Picklable description of a detector.
+
+    Specs let detectors be rebuilt in another process (e.g. a worker of
+    `ProcessPoolEngine`) without pickling compiled rules or language models.
+
+    Attributes:
+        target (str): Import path of the detector class
+            (e.g. 'deconvolute.detectors.content.signature.engine.SignatureDetector').
+        kwargs (dict[str, Any]): Keyword arguments for the constructor. Must be
+            picklable.
+    """
+
+    target: str = Field(..., description="Import path of the detector class.")
+    kwargs: dict[str, Any] = Field(
+        default_factory=dict, description="Constructor keyword arguments."
+    )
+
+    model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def of(cls, detector_cls: type["BaseDetector"], **kwargs: Any) -> "DetectorSpec":
+        """Creates a spec for `detector_cls(**kwargs)`."""
+        return cls(
+            target=f"{detector_cls.__module__}.{detector_cls.__qualname__}",
+            kwargs=kwargs,
+        )
+
+    def build(self) -> "BaseDetector":
+        """
+        Imports the target class and instantiates it.
+
+        Raises:
+            ConfigurationError: If the target cannot be imported or is not a
+                detector class.
+        """
+        module_name, _, class_name = self.target.rpartition(".")
+        try:
+            detector_cls = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError, ValueError) as e:
+            raise ConfigurationError(
+                f"Cannot import detector '{self.target}': {e}"
+            ) from e
+
+        if not (
+            isinstance(detector_cls, type) and issubclass(detector_cls, BaseDetector)
+        ):
+            raise ConfigurationError(f"'{self.target}' is not a BaseDetector subclass.")
+
+        return detector_cls(**self.kwargs)
+
+
 class BaseDetector(ABC):
     """
     Abstract Base Class for all security detectors.
+
+    Attributes:
+        executor (DetectorExecutor | None): Thread pool for blocking work in the
+            async methods. If None (the default), the executor of the enclosing
+            `executor_scope()` or the process-wide default is used.
+        cost (DetectorCost): 'cheap' detectors run their async work inline on
+            the event loop, 'expensive' ones (the default) on the executor.
+        inline_threshold (int): Inputs of at most this many characters run
+            inline even if the detector is 'expensive'. 0 (the default) always
+            offloads.
+        accepts_bytes (bool): Whether `check()` takes bytes-like content as
+            is. If False (the default), the scan functions decode bytes before
+            passing them to the detector.
     """
 
+    executor: DetectorExecutor | None = None
+    cost: DetectorCost = "expensive"
+    inline_threshold: int = 0
+    accepts_bytes: bool = False
+
     @abstractmethod
     def check(self, content: str, **kwargs: Any) -> DetectionResult:
         """
@@ -73,3 +177,106 @@ class BaseDetector(ABC):
         Async version of check.
         """
         pass
+
+    def fingerprint(self) -> str | None:
+        """
+        Returns a stable identifier of the detector's configuration.
+
+        Two detectors with the same fingerprint must return the same verdict for
+        the same content and keyword arguments. Result caches use it as part of
+        their key.
+
+        Returns:
+            str | None: The fingerprint, or None if results must not be cached
+            (the default, e.g. for detectors with per-call secrets).
+        """
+        return None
+
+    def to_spec(self) -> DetectorSpec:
+        """
+        Describes how to rebuild this detector in another process.
+
+        Raises:
+            ConfigurationError: If the detector does not support it (the default).
+                Custom detectors can override this or be passed to process-based
+                engines as an explicit DetectorSpec.
+        """
+        raise ConfigurationError(
+            f"{type(self).__name__} cannot be described as a DetectorSpec. "
+            "Override to_spec() or pass a DetectorSpec explicitly."
+        )
+
+    def check_batch(
+        self, contents: Sequence[str], **kwargs: Any
+    ) -> list[DetectionResult]:
+        """
+        Analyzes several documents in one call.
+
+        The default implementation calls `check()` for each document. Detectors
+        with a native batch API can override this to amortize per-call overhead.
+
+        Args:
+            contents: The texts to analyze.
+            **kwargs: Additional context, applied to every document.
+
+        Returns:
+            list[DetectionResult]: One result per document, in input order.
+        """
+        return [self.check(content, **kwargs) for content in contents]
+
+    async def a_check_batch(
+        self, contents: Sequence[str], **kwargs: Any
+    ) -> list[DetectionResult]:
+        """
+        Async version of check_batch.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.a_check(content, **kwargs) for content in contents)
+            )
+        )
+
+    async def _run_in_executor(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Runs blocking work on the detector's executor without blocking the loop.
+        """
+        executor = self.executor or current_executor()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, fn, *args)
+
+    async def _dispatch(self, size: int, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Runs blocking work inline if it is cheap enough, otherwise on the
+        executor.
+
+        Args:
+            size: Number of characters the work processes.
+            fn: The blocking callable.
+            *args: Positional arguments for `fn`.
+        """
+        if self._runs_inline(size):
+            return fn(*args)
+        return await self._run_in_executor(fn, *args)
+
+    def _runs_inline(self, size: int) -> bool:
+        return self.cost == "cheap" or size <= self.inline_threshold
+
+    def close(self) -> None:  # noqa: B027 - optional hook, not abstract
+        """
+        Releases resources held by the detector.
+
+        Built-in detectors share their executor and hold nothing that needs
+        closing, so the default does nothing. Executors passed in explicitly
+        belong to the caller and are not shut down.
+        """
+
+    def __enter__(self: "D") -> "D":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
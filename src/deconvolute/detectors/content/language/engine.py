@@ -1,9 +1,9 @@
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Sequence
 from typing import Any
 
-from deconvolute.detectors.base import BaseDetector
+from deconvolute.detectors.base import BaseDetector, DetectionResult, DetectorSpec
 from deconvolute.errors import ConfigurationError
+from deconvolute.utils.executor import DetectorExecutor
 from deconvolute.utils.logger import get_logger
 
 from .models import LanguageResult
@@ -34,6 +34,7 @@ class LanguageDetector(BaseDetector):
         self,
         allowed_languages: list[str] | None = None,
         languages_to_load: list[str] | None = None,
+        executor: DetectorExecutor | None = None,
     ):
         """
         Args:
@@ -47,6 +48,9 @@ class LanguageDetector(BaseDetector):
                                 Maximum accuracy.
                              - If provided: Only loads these models. Much lighter,
                                 but cannot detect languages outside this list.
+
+            executor: Optional executor for the async methods. If None, the
+                      shared executor is used.
         """
         if not HAS_LINGUA:
             raise ConfigurationError(
@@ -55,7 +59,8 @@ class LanguageDetector(BaseDetector):
             )
 
         self.allowed_codes = [code.lower() for code in (allowed_languages or [])]
-        self._executor = ThreadPoolExecutor()
+        self.loaded_codes = sorted(code.lower() for code in (languages_to_load or []))
+        self.executor = executor
 
         if languages_to_load:
             # Load only specific languages
@@ -89,6 +94,21 @@ class LanguageDetector(BaseDetector):
             # Necessary for robust anomaly detection
             self._detector = LanguageDetectorBuilder.from_all_languages().build()
 
+    def fingerprint(self) -> str | None:
+        """
+        Identifies the policy and the set of loaded language models.
+        """
+        allowed = ",".join(self.allowed_codes)
+        loaded = ",".join(self.loaded_codes) or "all"
+        return f"LanguageDetector:allowed={allowed};loaded={loaded}"
+
+    def to_spec(self) -> DetectorSpec:
+        return DetectorSpec.of(
+            LanguageDetector,
+            allowed_languages=self.allowed_codes or None,
+            languages_to_load=self.loaded_codes or None,
+        )
+
     def _detect(self, text: str) -> tuple[str | None, float]:
         """
         Helper to get (iso_code, confidence).
@@ -99,7 +119,12 @@ class LanguageDetector(BaseDetector):
 
         # Lingua returns the specific Language enum
         result: Language | None = self._detector.detect_language_of(text)
-        if not result:
+        return self._to_code(text, result)
+
+    @staticmethod
+    def _to_code(text: str, result: "Language | None") -> tuple[str | None, float]:
+        """Converts a lingua detection of `text` into (iso_code, confidence)."""
+        if not text or not text.strip() or not result:
             return None, 0.0
 
         # Convert Enum "Language.ENGLISH" -> "en"
@@ -121,13 +146,46 @@ class LanguageDetector(BaseDetector):
                                       of this text (usually User Input).
         """
         detected_code, confidence = self._detect(content)
+        return self._verdict(detected_code, confidence, self._reference_code(kwargs))
 
-        reference_text = kwargs.get("reference_text")
-        if reference_text:
-            ref_code, _ = self._detect(reference_text)
+    def check_batch(
+        self, contents: Sequence[str], **kwargs: Any
+    ) -> list[DetectionResult]:
+        """
+        Checks several documents with one call to lingua's parallel API.
 
+        Args:
+            contents: The texts to analyze.
+            **kwargs: See `check()`. A `reference_text` applies to every document
+                and is only detected once.
+
+        Returns:
+            list[DetectionResult]: One LanguageResult per document, in input order.
+        """
+        texts = list(contents)
+        detections: list[Language | None] = (
+            self._detector.detect_languages_in_parallel_of(texts)
+        )
+        ref_code = self._reference_code(kwargs)
+        return [
+            self._verdict(*self._to_code(text, detection), ref_code)
+            for text, detection in zip(texts, detections, strict=True)
+        ]
+
+    def _reference_code(self, kwargs: dict[str, Any]) -> str | None:
+        reference_text = kwargs.get("reference_text")
+        if not reference_text:
+            return None
+        ref_code, _ = self._detect(reference_text)
+        return ref_code
+
+    def _verdict(
+        self, detected_code: str | None, confidence: float, ref_code: str | None
+    ) -> LanguageResult:
+        """Applies the correspondence check and the allowlist policy."""
+        if ref_code is not None:
             # If we successfully detected both languages and they differ
-            if detected_code and ref_code and detected_code != ref_code:
+            if detected_code and detected_code != ref_code:
                 return LanguageResult(
                     threat_detected=True,
                     detected_language=detected_code,
@@ -162,7 +220,11 @@ class LanguageDetector(BaseDetector):
 
     async def a_check(self, content: str, **kwargs: Any) -> LanguageResult:
         """Async version of check() using a thread pool."""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            self._executor, lambda: self.check(content, **kwargs)
-        )
+        return await self._dispatch(len(content), lambda: self.check(content, **kwargs))
+
+    async def a_check_batch(
+        self, contents: Sequence[str], **kwargs: Any
+    ) -> list[DetectionResult]:
+        """Async version of check_batch() using a single thread pool task."""
+        size = sum(len(content) for content in contents)
+        return await self._dispatch(size, lambda: self.check_batch(contents, **kwargs))
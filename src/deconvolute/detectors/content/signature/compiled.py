@@ -0,0 +1,148 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import yara
+
+from deconvolute.errors import ConfigurationError
+from deconvolute.utils.logger import get_logger
+
+logger = get_logger()
+
+RULES_CACHE_ENV_VAR = "DECONVOLUTE_RULES_CACHE_DIR"
+
+# Suffix of compiled rule files in the cache directory.
+COMPILED_SUFFIX = ".yarc"
+
+
+def default_cache_dir() -> Path:
+    """
+    Returns the directory for compiled rules.
+
+    DECONVOLUTE_RULES_CACHE_DIR if set, otherwise 'deconvolute/rules' under
+    XDG_CACHE_HOME (falling back to ~/.cache).
+    """
+    configured = os.getenv(RULES_CACHE_ENV_VAR)
+    if configured:
+        return Path(configured)
+    base = os.getenv("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "deconvolute" / "rules"
+
+
+def cache_key(digests: dict[str, str]) -> str:
+    """
+    Identifies a compiled rule set.
+
+    Compiled rules are only valid for the YARA build that produced them, so the
+    key covers the yara-python and libyara versions besides every source file.
+
+    Args:
+        digests: Content hash of each source file and the files it includes,
+            by namespace.
+
+    Returns:
+        str: A SHA-256 hex digest.
+    """
+    key = hashlib.sha256(f"{yara.__version__}:{yara.YARA_VERSION}".encode())
+    for namespace, digest in sorted(digests.items()):
+        key.update(f"\n{namespace}={digest}".encode())
+    return key.hexdigest()
+
+
+def load_rules(
+    filepaths: dict[str, str], digests: dict[str, str], cache_dir: Path | None
+) -> yara.Rules:
+    """
+    Loads compiled rules from the cache, compiling and storing them on a miss.
+
+    A cache that cannot be read or written is never an error: the rules are
+    compiled from source instead. Storing a new entry removes the entries of
+    earlier versions of the same source files.
+
+    Args:
+        filepaths: Source file of each namespace, as passed to `yara.compile`.
+        digests: Content hash of each source file, by namespace.
+        cache_dir: Directory of compiled rules, or None to always compile.
+
+    Returns:
+        yara.Rules: The compiled rules.
+
+    Raises:
+        ConfigurationError: If the sources fail to compile.
+    """
+    if cache_dir is None:
+        return _compile(filepaths)
+
+    # Entries are grouped by where the sources live, so that a new version of
+    # a rule set replaces the entry of the previous one.
+    prefix = _source_id(filepaths)
+    path = cache_dir / f"{prefix}-{cache_key(digests)}{COMPILED_SUFFIX}"
+    if path.is_file():
+        try:
+            rules = yara.load(filepath=str(path))
+        except yara.Error as e:
+            logger.debug(f"Ignoring unreadable compiled rules {path}: {e}")
+        else:
+            logger.debug(f"Loaded {len(filepaths)} rule files from cache {path}.")
+            return rules
+
+    rules = _compile(filepaths)
+    if _save(rules, path):
+        _evict(cache_dir, prefix, keep=path)
+    return rules
+
+
+def _source_id(filepaths: dict[str, str]) -> str:
+    """Short hash of the locations of a rule set's source files."""
+    locations = "\n".join(
+        f"{namespace}={Path(path).resolve()}"
+        for namespace, path in sorted(filepaths.items())
+    )
+    return hashlib.sha256(locations.encode()).hexdigest()[:16]
+
+
+def _evict(cache_dir: Path, prefix: str, keep: Path) -> None:
+    """Removes entries compiled from earlier versions of the same sources."""
+    for stale in cache_dir.glob(f"{prefix}-*{COMPILED_SUFFIX}"):
+        if stale == keep:
+            continue
+        try:
+            stale.unlink()
+        except OSError as e:
+            logger.debug(f"Could not remove stale compiled rules {stale}: {e}")
+        else:
+            logger.debug(f"Removed stale compiled rules {stale}.")
+
+
+def _compile(filepaths: dict[str, str]) -> yara.Rules:
+    try:
+        rules = yara.compile(filepaths=filepaths)
+    except yara.Error as e:
+        raise ConfigurationError(f"Failed to compile local rules: {e}") from e
+    logger.debug(f"Compiled {len(filepaths)} local rule files.")
+    return rules
+
+
+def _save(rules: yara.Rules, path: Path) -> bool:
+    """Stores compiled rules via a temporary file, so that concurrent loaders
+    never see a partial one. Returns whether they were stored."""
+    tmp = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        os.close(fd)
+        rules.save(filepath=tmp)
+        os.replace(tmp, path)
+        tmp = None
+        logger.debug(f"Saved compiled rules to cache {path}.")
+        return True
+    except (OSError, yara.Error) as e:
+        logger.debug(f"Could not cache compiled rules in {path.parent}: {e}")
+        return False
+    finally:
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
@@ -1,12 +1,44 @@
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import math
+import os
+import threading
+from collections.abc import Iterable, Sequence
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import as_completed
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, NamedTuple, get_args
 
 import yara
 
-from deconvolute.detectors.base import BaseDetector, DetectionResult
-from deconvolute.errors import ConfigurationError
+from deconvolute.constants import (
+    DEFAULT_RULES_WATCH_INTERVAL_SEC,
+    DEFAULT_SIGNATURE_INLINE_THRESHOLD,
+)
+from deconvolute.detectors.base import (
+    BaseDetector,
+    Content,
+    DetectionResult,
+    DetectorSpec,
+)
+from deconvolute.detectors.content.signature.compiled import (
+    default_cache_dir,
+    load_rules,
+)
+from deconvolute.detectors.content.signature.models import RuleProfileReport
+from deconvolute.detectors.content.signature.profiling import profile_rules
+from deconvolute.detectors.content.signature.source import (
+    included_files,
+    rule_files,
+    source_digest,
+)
+from deconvolute.detectors.content.signature.splitting import (
+    SplitLayout,
+    split_layout,
+)
+from deconvolute.errors import ConfigurationError, ScanTimeoutError
+from deconvolute.utils.deadline import Deadline
+from deconvolute.utils.executor import DetectorExecutor
 from deconvolute.utils.logger import get_logger
 
 logger = get_logger()
@@ -14,6 +46,22 @@ logger = get_logger()
 
 DEFAULT_RULES_DIR = Path(__file__).parent / "rules"
 
+# 'full' reports every matching rule with its tags. 'verdict' stops matching
+# at the first rule that decides the verdict and reports only that rule.
+SignatureMode = Literal["full", "verdict"]
+
+
+class _RuleSet(NamedTuple):
+    """One compiled version of the rules, swapped in as a whole on reload."""
+
+    rules: yara.Rules | None
+    digest: str | None
+    version: str | None
+    loaded_at: datetime
+    # How large inputs can be split, if `split_size` is set and the rules
+    # allow it.
+    layout: SplitLayout | None = None
+
 
 class SignatureDetector(BaseDetector):
     """
@@ -30,13 +78,34 @@ class SignatureDetector(BaseDetector):
     Attributes:
         local_rules_path (Path): The file path to the compiled or source YARA rules.
         _rules (yara.Rules): The compiled YARA rules object (C-extension).
-        _executor (ThreadPoolExecutor): Thread pool for offloading blocking match
-            operations.
+        executor (DetectorExecutor | None): Thread pool for offloading blocking
+            match operations. Defaults to the shared executor.
+        inline_threshold (int): Async scans of inputs up to this many characters
+            run inline on the event loop instead of the executor.
+        cache_dir (Path | None): Directory of compiled rules, or None if the
+            rules are compiled on every construction.
+        mode (SignatureMode): 'full' or 'verdict', see `__init__`.
+        min_score (float | None): Matches of rules scored below this are
+            ignored, or None to count every match.
+        split_size (int | None): Inputs longer than this are scanned in
+            parallel chunks of this size, or None to always scan in one pass.
+        split_workers (int): Threads scanning the chunks of one input.
     """
 
+    # YARA matches bytes, bytearray and memoryview buffers without a copy.
+    accepts_bytes: bool = True
+
     def __init__(
         self,
         rules_path: str | Path | None = None,
+        executor: DetectorExecutor | None = None,
+        inline_threshold: int = DEFAULT_SIGNATURE_INLINE_THRESHOLD,
+        cache_rules: bool = True,
+        cache_dir: str | Path | None = None,
+        mode: SignatureMode = "full",
+        min_score: float | None = None,
+        split_size: int | None = None,
+        split_workers: int | None = None,
     ):
         """
         Initialize the SignatureDetector with a specific rule set.
@@ -45,53 +114,314 @@ class SignatureDetector(BaseDetector):
         blocking operation designed to fail fast if the rule file is missing or
         malformed.
 
+        Compiled rules are cached on disk, keyed by the content hashes of the
+        source files (and any files they include) and the YARA version, so
+        later constructions (worker boots, cold starts) load them instead of
+        compiling again. A new version of the rules replaces the cached entry
+        of the previous one. Anyone who
+        can write to the cache directory controls the rules, so it must not be
+        shared with untrusted users.
+
         Args:
             rules_path: Optional path to a file (.yar) OR a directory of files.
                 If None, loads the SDK's internal 'rules/' directory.
+            executor: Optional executor for the async methods. If None, the
+                shared executor is used.
+            inline_threshold: Inputs of at most this many characters are matched
+                inline by the async methods, where a thread handoff would cost
+                more than the match. 0 always offloads.
+            cache_rules: Whether to cache compiled rules on disk.
+            cache_dir: Directory for compiled rules. If None, uses
+                DECONVOLUTE_RULES_CACHE_DIR or the user cache directory
+                (~/.cache/deconvolute/rules).
+            mode: 'full' (the default) collects every matching rule, for audits.
+                'verdict' aborts matching at the first qualifying rule and
+                reports only that one, which is enough to block or allow.
+                Both modes reach the same verdict.
+            min_score: Only rules whose 'score' meta value is at least this
+                count as a match. Rules without a score always count.
+            split_size: Enables the large-input mode: content longer than this
+                many bytes is split into chunks of this size, overlapping by
+                the longest possible match, and the chunks are matched in
+                parallel. The merged matches equal a single-pass scan. This
+                only applies if every rule matches on any one of its strings
+                (e.g. 'any of them') and no string is a regular expression;
+                other rule sets are always scanned in one pass. In 'verdict'
+                mode, the first chunk with a match settles the scan.
+            split_workers: Threads matching the chunks. Defaults to the number
+                of CPUs.
 
         Raises:
             ConfigurationError: If the rule file does not exist or contains syntax
-                errors that prevent compilation.
+                errors that prevent compilation, if inline_threshold is
+                negative, if mode is unknown, or if split_size or
+                split_workers are less than 1.
         """
-        self._executor = ThreadPoolExecutor()
+        if inline_threshold < 0:
+            raise ConfigurationError(
+                f"inline_threshold must be >= 0, got {inline_threshold}."
+            )
+        if mode not in get_args(SignatureMode):
+            raise ConfigurationError(
+                f"mode must be one of {get_args(SignatureMode)}, got {mode!r}."
+            )
+        self.mode: SignatureMode = mode
+        self.min_score = min_score
+        if split_size is not None and split_size < 1:
+            raise ConfigurationError(f"split_size must be >= 1, got {split_size}.")
+        if split_workers is not None and split_workers < 1:
+            raise ConfigurationError(
+                f"split_workers must be >= 1, got {split_workers}."
+            )
+        self.split_size = split_size
+        self.split_workers = split_workers or os.cpu_count() or 1
+        self._split_pool: DetectorExecutor | None = None
+        self._split_lock = threading.Lock()
+        self.executor = executor
+        self.inline_threshold = inline_threshold
+        self.cache_dir: Path | None = None
+        if cache_rules:
+            self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
 
         self.local_path = Path(rules_path) if rules_path else DEFAULT_RULES_DIR
-        self._local_rules = None
-        self._load_local_rules()
+        # Reloads replace the whole rule set with one assignment, so a check
+        # always sees rules and fingerprint from the same version.
+        self._ruleset = self._load_local_rules()
+        self._reload_lock = threading.Lock()
+        self._watch_lock = threading.Lock()
+        self._watcher: tuple[threading.Thread, threading.Event] | None = None
+
+    def _load_local_rules(self) -> "_RuleSet":
+        """
+        Compiles the local signature rules from disk, or loads them from the
+        compiled rules cache.
 
-    def _load_local_rules(self) -> None:
+        Raises:
+            ConfigurationError: If the rule path does not exist, or wraps
+                yara.Error if compilation fails.
         """
-        Compiles the local signature rules from disk.
+        filepaths = self._rule_files()
+        if not filepaths:
+            logger.warning(f"No .yar files found in {self.local_path}")
+            return _RuleSet(None, None, None, datetime.now(UTC))
+
+        # Includes are part of a file's digest, so edits to them are noticed.
+        digests = {
+            namespace: source_digest(path) for namespace, path in filepaths.items()
+        }
+        rules = load_rules(filepaths, digests, self.cache_dir)
+
+        # Identify the rule set by content, not by path, so edited files produce
+        # a new fingerprint.
+        digest = ",".join(
+            f"{namespace}={digest}" for namespace, digest in sorted(digests.items())
+        )
+        version = hashlib.sha256(digest.encode()).hexdigest()[:12]
+        layout = None
+        if self.split_size is not None:
+            layout = split_layout(filepaths)
+            if layout is None:
+                logger.info(
+                    "Deconvolute: The signature rules cannot be matched in chunks, "
+                    "large inputs are scanned in a single pass."
+                )
+        return _RuleSet(rules, digest, version, datetime.now(UTC), layout)
+
+    def _rule_files(self) -> dict[str, str]:
+        """Maps each rule namespace (the file name) to its source file."""
+        return rule_files(self.local_path)
+
+    @property
+    def _local_rules(self) -> yara.Rules | None:
+        return self._ruleset.rules
+
+    @_local_rules.setter
+    def _local_rules(self, rules: yara.Rules | None) -> None:
+        self._ruleset = self._ruleset._replace(rules=rules)
+
+    @property
+    def rules_version(self) -> str | None:
+        """Short content hash of the active rule set, or None without rules."""
+        return self._ruleset.version
+
+    @property
+    def rules_loaded_at(self) -> datetime:
+        """UTC time at which the active rule set was loaded."""
+        return self._ruleset.loaded_at
+
+    def reload(self) -> bool:
+        """
+        Recompiles the rules from `local_path` and swaps them in atomically.
+
+        Scanning continues on the old rules while the new ones compile, and
+        checks already running finish on the rules they started with. If the
+        new rules fail to compile, the old ones stay active.
+
+        Returns:
+            bool: True if the rule set changed, False if the sources hold the
+            same rules as the active set.
 
         Raises:
-            ConfigurationError: Wraps yara.Error if compilation fails.
+            ConfigurationError: If the rule path is gone, holds no rule files,
+                or the new rules do not compile.
         """
-        if not self.local_path.exists():
-            raise ConfigurationError(f"Rule path not found: {self.local_path}")
+        # Serialize reloads so a slow compile cannot overwrite a newer one.
+        with self._reload_lock:
+            ruleset = self._load_local_rules()
+            if ruleset.rules is None:
+                # Never swap in an empty set: content would pass unscanned.
+                raise ConfigurationError(
+                    f"No .yar files found in {self.local_path}, keeping the "
+                    "active rules."
+                )
+            if ruleset.digest == self._ruleset.digest:
+                return False
+            previous = self._ruleset.version
+            self._ruleset = ruleset
+
+        logger.info(
+            f"Deconvolute: Reloaded signature rules from {self.local_path} "
+            f"(version {previous} -> {ruleset.version})."
+        )
+        return True
 
-        # Build the dictionary { namespace: file_path }
-        filepaths = {}
+    async def a_reload(self) -> bool:
+        """Async version of reload. Compiles on the executor."""
+        return await self._run_in_executor(self.reload)
 
-        if self.local_path.is_file():
-            # Single file mode (namespace is filename)
-            filepaths[self.local_path.name] = str(self.local_path)
+    def watch(self, interval: float = DEFAULT_RULES_WATCH_INTERVAL_SEC) -> None:
+        """
+        Reloads the rules in a background thread whenever `local_path` changes.
+
+        The sources, and the files they include, are polled for changed
+        modification times, sizes and file names every `interval` seconds.
+        Rules that fail to compile are logged and skipped, and the active rules
+        keep serving. Stop watching with `unwatch()` or `close()`. Calling it
+        again while watching has no effect.
 
-        elif self.local_path.is_dir():
-            # Directory mode: Scan for all .yar files
-            for rule_file in self.local_path.glob("*.yar"):
-                filepaths[rule_file.name] = str(rule_file)
+        Args:
+            interval: Seconds between polls.
 
-            if not filepaths:
-                logger.warning(f"No .yar files found in {self.local_path}")
+        Raises:
+            ConfigurationError: If interval is not positive.
+        """
+        if interval <= 0:
+            raise ConfigurationError(f"interval must be > 0, got {interval}.")
+        with self._watch_lock:
+            if self._watcher is not None:
                 return
 
+            stop = threading.Event()
+            thread = threading.Thread(
+                target=self._watch_loop,
+                args=(interval, stop, self._sources_stamp()),
+                name="deconvolute-rules-watch",
+                daemon=True,
+            )
+            self._watcher = (thread, stop)
+            thread.start()
+
+    def unwatch(self) -> None:
+        """Stops watching `local_path` and waits for the watcher to exit."""
+        with self._watch_lock:
+            if self._watcher is None:
+                return
+            thread, stop = self._watcher
+            self._watcher = None
+        stop.set()
+        if thread is not threading.current_thread():
+            thread.join()
+
+    def close(self) -> None:
+        """Stops the rule watcher and the chunk scanning threads, if any."""
+        self.unwatch()
+        with self._split_lock:
+            pool, self._split_pool = self._split_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _watch_loop(
+        self,
+        interval: float,
+        stop: threading.Event,
+        stamp: tuple[tuple[str, int, int], ...] | None,
+    ) -> None:
+        while not stop.wait(interval):
+            current = self._sources_stamp()
+            if current == stamp:
+                continue
+            stamp = current
+            try:
+                self.reload()
+            except ConfigurationError as e:
+                logger.warning(f"Deconvolute: Keeping the active rules: {e}")
+
+    def _sources_stamp(self) -> tuple[tuple[str, int, int], ...] | None:
+        """
+        Cheap summary of the rule sources and the files they include, used to
+        detect changes.
+        """
+        stamp = []
         try:
-            self._local_rules = yara.compile(filepaths=filepaths)
-            logger.debug(f"Compiled {len(filepaths)} local rule files.")
-        except yara.Error as e:
-            raise ConfigurationError(f"Failed to compile local rules: {e}") from e
+            for path in self._rule_files().values():
+                for source in (path, *included_files(path)):
+                    stat = os.stat(source)
+                    stamp.append((source, stat.st_mtime_ns, stat.st_size))
+        except (ConfigurationError, OSError):
+            return None
+        return tuple(stamp)
+
+    def profile(
+        self, documents: Iterable[Content], repeat: int = 1
+    ) -> RuleProfileReport:
+        """
+        Profiles the rules on a corpus to find the ones that slow scans down.
+
+        Records how often each rule and string matched and how long the
+        corpus takes to scan with each rule on its own, and collects YARA's
+        warnings about strings with weak atoms. Meant for rule authors, e.g. to
+        check custom rules before they are deployed next to the bundled ones:
 
-    def check(self, content: str, **kwargs: Any) -> DetectionResult:
+            report = SignatureDetector(rules_path="rules/").profile(samples)
+            print(report.format(top=10))
+
+        Every rule is compiled and run separately, so profiling takes much
+        longer than a scan. `mode` and `min_score` do not apply.
+
+        Args:
+            documents: A representative corpus.
+            repeat: Times each timing is repeated. The fastest run counts.
+
+        Returns:
+            RuleProfileReport: Every rule, most expensive first.
+
+        Raises:
+            ConfigurationError: If no rules are loaded.
+        """
+        rules = self._local_rules
+        if rules is None:
+            raise ConfigurationError(f"No rules loaded from {self.local_path}.")
+        return profile_rules(rules, self._rule_files(), list(documents), repeat)
+
+    def fingerprint(self) -> str | None:
+        """
+        Identifies the loaded rule set by the content hashes of its files.
+        """
+        return f"SignatureDetector:{self._ruleset.digest}:{self.mode}:{self.min_score}"
+
+    def to_spec(self) -> DetectorSpec:
+        return DetectorSpec.of(
+            SignatureDetector,
+            rules_path=str(self.local_path),
+            cache_rules=self.cache_dir is not None,
+            cache_dir=str(self.cache_dir) if self.cache_dir is not None else None,
+            mode=self.mode,
+            min_score=self.min_score,
+            split_size=self.split_size,
+            split_workers=self.split_workers,
+        )
+
+    def check(self, content: Content, **kwargs: Any) -> DetectionResult:
         """
         Synchronously scans the provided content against the loaded singature rules.
 
@@ -99,23 +429,211 @@ class SignatureDetector(BaseDetector):
         scanning very large documents may block the execution thread briefly.
 
         Args:
-            content: The string content to scan.
-            **kwargs: Additional arguments (unused, kept for interface compatibility).
+            content: The content to scan. Text, or its UTF-8 encoding as bytes,
+                bytearray or memoryview, which YARA reads in place.
+            **kwargs: Additional arguments. `timeout` (float, seconds) bounds the
+                match using YARA's native timeout, which has a resolution of
+                whole seconds.
 
         Returns:
             DetectionResult: A structured result containing:
                 - threat_detected (bool): True if any rule matched.
                 - metadata (dict): specific matches, tags, and match count.
+
+        Raises:
+            ScanTimeoutError: If matching exceeds `timeout`.
         """
-        matches: list[yara.rule | yara.tags | yara.meta] = []
+        matches: list[yara.Match] = []
+        # Read once: a concurrent reload must not swap the rules mid-check.
+        ruleset = self._ruleset
 
         # Scan Local Layer
-        if self._local_rules:
-            matches.extend(self._local_rules.match(data=content))
+        if ruleset.rules:
+            matches.extend(
+                self._match_content(ruleset, content, Deadline(kwargs.get("timeout")))
+            )
+
+        if not matches:
+            return DetectionResult(threat_detected=False, component="SignatureDetector")
+
+        return self._build_threat_result(matches)
+
+    def check_file(
+        self, path: str | os.PathLike[str], **kwargs: Any
+    ) -> DetectionResult:
+        """
+        Scans a file on disk without loading it into a Python string.
+
+        YARA opens and memory-maps the file itself, so peak memory does not grow
+        with the file size. Matches are the same as `check()` on the file's
+        text, provided the file is UTF-8 (YARA sees `str` content as UTF-8).
+
+        Args:
+            path: The file to scan.
+            **kwargs: Additional arguments. `timeout` (float, seconds) bounds the
+                match, see `check()`.
+
+        Returns:
+            DetectionResult: The same result `check()` would return.
+
+        Raises:
+            FileNotFoundError: If the path is not a file.
+            ScanTimeoutError: If matching exceeds `timeout`.
+        """
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"No such file: {path}")
+
+        matches: list[yara.Match] = []
+        rules = self._local_rules
+        if rules:
+            matches.extend(
+                self._matches(
+                    rules, Deadline(kwargs.get("timeout")), filepath=os.fspath(path)
+                )
+            )
 
         if not matches:
             return DetectionResult(threat_detected=False, component="SignatureDetector")
 
+        return self._build_threat_result(matches)
+
+    async def a_check_file(
+        self, path: str | os.PathLike[str], **kwargs: Any
+    ) -> DetectionResult:
+        """
+        Async version of check_file. Runs on the executor, since files are
+        usually larger than the inline threshold.
+        """
+        return await self._dispatch(
+            os.path.getsize(path), lambda: self.check_file(path, **kwargs)
+        )
+
+    def check_batch(
+        self, contents: Sequence[Content], **kwargs: Any
+    ) -> list[DetectionResult]:
+        """
+        Scans several documents against the loaded rules in one call.
+
+        Produces the same verdicts as calling `check()` per document, but all clean
+        documents in the batch share a single result instance.
+
+        Args:
+            contents: The documents to scan.
+            **kwargs: Additional arguments. `timeout` (float, seconds) bounds the
+                whole batch.
+
+        Returns:
+            list[DetectionResult]: One result per document, in input order.
+
+        Raises:
+            ScanTimeoutError: If the batch exceeds `timeout`.
+        """
+        clean = DetectionResult(threat_detected=False, component="SignatureDetector")
+        ruleset = self._ruleset
+        if not ruleset.rules:
+            return [clean] * len(contents)
+
+        deadline = Deadline(kwargs.get("timeout"))
+        results: list[DetectionResult] = []
+        for content in contents:
+            matches = self._match_content(ruleset, content, deadline)
+            results.append(self._build_threat_result(matches) if matches else clean)
+        return results
+
+    def _match_content(
+        self, ruleset: _RuleSet, content: Content, deadline: Deadline
+    ) -> list[yara.Match]:
+        """Matches in-memory content, in chunks if it is large enough."""
+        step = self.split_size
+        if step is None or ruleset.layout is None:
+            return self._matches(ruleset.rules, deadline, data=content)
+        # split_size is in bytes, which for text is its UTF-8 encoding.
+        data = _byte_view(content)
+        if len(data) > step:
+            return self._match_split(ruleset, ruleset.layout, data, step, deadline)
+        return self._matches(ruleset.rules, deadline, data=data)
+
+    def _match_split(
+        self,
+        ruleset: _RuleSet,
+        layout: SplitLayout,
+        data: memoryview,
+        step: int,
+        deadline: Deadline,
+    ) -> list[yara.Match]:
+        """
+        Matches overlapping chunks of the bytes on the split pool and merges
+        the matches per rule, in rule set order.
+        """
+        pool = self._split_executor()
+        futures = [
+            pool.submit(
+                self._matches,
+                ruleset.rules,
+                deadline,
+                data=data[start : start + step + layout.overlap],
+            )
+            for start in range(0, len(data), step)
+        ]
+
+        found: dict[tuple[str, str], yara.Match] = {}
+        try:
+            for future in as_completed(futures, timeout=deadline.remaining()):
+                for match in future.result():
+                    found.setdefault((match.namespace, match.rule), match)
+                if found and self.mode == "verdict":
+                    break
+        except FutureTimeoutError as e:
+            raise ScanTimeoutError("Signature scan exceeded its time budget.") from e
+        finally:
+            for future in futures:
+                future.cancel()
+
+        unknown = len(layout.order)
+        matches = sorted(
+            found.values(),
+            key=lambda m: layout.order.get((m.namespace, m.rule), unknown),
+        )
+        return matches[:1] if self.mode == "verdict" else matches
+
+    def _split_executor(self) -> DetectorExecutor:
+        with self._split_lock:
+            if self._split_pool is None:
+                self._split_pool = DetectorExecutor(
+                    self.split_workers, thread_name_prefix="deconvolute-split"
+                )
+            return self._split_pool
+
+    def _matches(
+        self, rules: yara.Rules, deadline: Deadline, **target: Any
+    ) -> list[yara.Match]:
+        """
+        Runs the rules according to `mode` and `min_score`.
+
+        In 'verdict' mode, YARA calls back on each matching rule and the first
+        qualifying one aborts the scan, so the remaining rules are neither
+        evaluated nor turned into match objects.
+        """
+        if self.mode == "verdict":
+            target.update(
+                callback=self._stop_at_verdict,
+                which_callbacks=yara.CALLBACK_MATCHES,
+            )
+        matches = _run_rules(rules, deadline, **target)
+        if self.min_score is not None:
+            matches = [m for m in matches if self._qualifies(m.meta)]
+        return matches[:1] if self.mode == "verdict" else matches
+
+    def _stop_at_verdict(self, data: dict[str, Any]) -> int:
+        if self._qualifies(data["meta"]):
+            return int(yara.CALLBACK_ABORT)
+        return int(yara.CALLBACK_CONTINUE)
+
+    def _qualifies(self, meta: dict[str, Any]) -> bool:
+        return self.min_score is None or _rule_score(meta) >= self.min_score
+
+    def _build_threat_result(self, matches: list[yara.Match]) -> DetectionResult:
+        """Builds a threat result from a non-empty list of YARA matches."""
         # Extract metadata from matches
         match_names = [m.rule for m in matches]
         tags = []
@@ -134,11 +652,65 @@ class SignatureDetector(BaseDetector):
             metadata={"matches": match_names, "tags": tags, "count": len(matches)},
         )
 
-    async def a_check(self, content: str, **kwargs: Any) -> DetectionResult:
+    async def a_check(self, content: Content, **kwargs: Any) -> DetectionResult:
         """
         Async version.
         """
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            self._executor, lambda: self.check(content, **kwargs)
-        )
+        return await self._dispatch(len(content), lambda: self.check(content, **kwargs))
+
+    async def a_check_batch(
+        self, contents: Sequence[Content], **kwargs: Any
+    ) -> list[DetectionResult]:
+        """
+        Async version of check_batch. The whole batch runs in one executor task,
+        or inline if its total size is within the inline threshold.
+        """
+        size = sum(len(content) for content in contents)
+        return await self._dispatch(size, lambda: self.check_batch(contents, **kwargs))
+
+
+def _run_rules(
+    rules: yara.Rules, deadline: Deadline, **target: Any
+) -> list[yara.Match]:
+    """
+    Runs YARA with the time left on the deadline.
+
+    YARA's timeout is in whole seconds, so the remaining budget is rounded up
+    and the deadline is re-checked before each call.
+
+    Args:
+        rules: The compiled rules.
+        deadline: The call's deadline.
+        **target: What to scan, `data=` or `filepath=`, and any further
+            `match()` options.
+    """
+    remaining = deadline.remaining()
+    if remaining is None:
+        matches: list[yara.Match] = rules.match(**target)
+        return matches
+    if remaining <= 0.0:
+        raise ScanTimeoutError("Signature scan exceeded its time budget.")
+
+    try:
+        matches = rules.match(**target, timeout=max(1, math.ceil(remaining)))
+    except yara.TimeoutError as e:
+        raise ScanTimeoutError("Signature scan exceeded its time budget.") from e
+    return matches
+
+
+def _rule_score(meta: dict[str, Any]) -> float:
+    """A rule's 'score' meta value. Unscored rules rank above any threshold."""
+    try:
+        return float(meta["score"])
+    except (KeyError, TypeError, ValueError):
+        return math.inf
+
+
+def _byte_view(content: Content) -> memoryview:
+    """A flat byte view of the content, as YARA sees it."""
+    if isinstance(content, str):
+        return memoryview(content.encode("utf-8"))
+    view = memoryview(content)
+    if view.ndim == 1 and view.itemsize == 1 and view.c_contiguous:
+        return view
+    return memoryview(view.tobytes())
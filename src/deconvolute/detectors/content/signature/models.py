@@ -0,0 +1,166 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class StringProfile(BaseModel):
+    """
+    How one string of a rule behaved across a profiled corpus.
+
+    Attributes:
+        identifier (str): The string's identifier, e.g. '$s1'.
+        hits (int): Occurrences found across all documents.
+        documents (int): Documents in which the string occurred.
+        slow (bool): Whether YARA warned that the string's atoms are weak, so
+            it triggers many candidate matches that must be verified.
+    """
+
+    identifier: str
+    hits: int = 0
+    documents: int = 0
+    slow: bool = False
+
+    model_config = ConfigDict(frozen=True)
+
+
+class RuleProfile(BaseModel):
+    """
+    Match counts and cost of one rule across a profiled corpus.
+
+    Attributes:
+        namespace (str): The rule file the rule was loaded from.
+        rule (str): The rule's identifier.
+        documents (int): Documents the rule matched.
+        scan_ms (float | None): Time to scan the corpus with this rule alone,
+            above the fixed cost of a scan, in milliseconds. None if the rule
+            cannot be compiled on its own (e.g. it references other rules).
+        strings (list[StringProfile]): The rule's strings, in source order.
+        warnings (list[str]): Warnings YARA raised while compiling the rule.
+    """
+
+    namespace: str
+    rule: str
+    documents: int = 0
+    scan_ms: float | None = None
+    strings: list[StringProfile] = Field(default_factory=list)
+    warnings: list[str] = Field(default_factory=list)
+
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def name(self) -> str:
+        """The rule qualified by its namespace, e.g. 'base.yar:MyRule'."""
+        return f"{self.namespace}:{self.rule}"
+
+    @property
+    def hits(self) -> int:
+        """Occurrences of all the rule's strings."""
+        return sum(s.hits for s in self.strings)
+
+
+class RuleProfileReport(BaseModel):
+    """
+    Result of `SignatureDetector.profile()`.
+
+    Attributes:
+        documents (int): Documents in the corpus.
+        bytes (int): Total size of the corpus in bytes.
+        scan_ms (float): Time to scan the corpus with the whole rule set, in
+            milliseconds.
+        rules (list[RuleProfile]): Every rule, most expensive first. Rules
+            that could not be timed come last, by number of hits.
+    """
+
+    documents: int
+    bytes: int
+    scan_ms: float
+    rules: list[RuleProfile]
+
+    model_config = ConfigDict(frozen=True)
+
+    def weak_strings(self) -> list[tuple[RuleProfile, StringProfile]]:
+        """Strings YARA flagged as slow, most frequently hit first."""
+        weak = [(r, s) for r in self.rules for s in r.strings if s.slow]
+        return sorted(weak, key=lambda pair: -pair[1].hits)
+
+    def format(self, top: int = 10) -> str:
+        """
+        Renders the report as a plain-text table.
+
+        Args:
+            top: Number of rules to list.
+
+        Returns:
+            str: The most expensive rules followed by the weak strings.
+        """
+        megabytes = self.bytes / 1_000_000
+        lines = [
+            f"Profiled {len(self.rules)} rules on {self.documents} documents "
+            f"({megabytes:.1f} MB): {self.scan_ms:.1f} ms for the full set",
+            "",
+            f"{'rule':<48} {'scan ms':>9} {'docs':>7} {'hits':>8}",
+        ]
+        for rule in self.rules[:top]:
+            cost = f"{rule.scan_ms:.1f}" if rule.scan_ms is not None else "n/a"
+            lines.append(
+                f"{rule.name:<48} {cost:>9} {rule.documents:>7} {rule.hits:>8}"
+            )
+
+        weak = self.weak_strings()
+        if weak:
+            lines += ["", "Strings with weak atoms:"]
+            for rule, string in weak:
+                lines.append(
+                    f"  {rule.name}:{string.identifier:<16} {string.hits:>8} hits"
+                )
+        return "\n".join(lines)
+
+
+class OptimizationReport(BaseModel):
+    """
+    Result of `optimize_rules()`: the rule set before and after.
+
+    Attributes:
+        output (str): Directory the optimized rule files were written to.
+        rules_before (int): Rules in the source set.
+        rules_after (int): Rules in the optimized set.
+        strings_before (int): Strings in the source set.
+        strings_after (int): Strings in the optimized set.
+        compiled_bytes_before (int): Size of the compiled source set.
+        compiled_bytes_after (int): Size of the compiled optimized set.
+        scan_ms_before (float | None): Time to scan the sample corpus with the
+            source set, in milliseconds. None without a corpus.
+        scan_ms_after (float | None): The same for the optimized set.
+        mismatches (int | None): Sample documents whose verdict differs
+            between the two sets. None without a corpus.
+    """
+
+    output: str
+    rules_before: int
+    rules_after: int
+    strings_before: int
+    strings_after: int
+    compiled_bytes_before: int
+    compiled_bytes_after: int
+    scan_ms_before: float | None = None
+    scan_ms_after: float | None = None
+    mismatches: int | None = None
+
+    model_config = ConfigDict(frozen=True)
+
+    def format(self) -> str:
+        """Renders the before/after comparison as plain text."""
+        lines = [
+            f"{'':<16} {'before':>12} {'after':>12}",
+            f"{'rules':<16} {self.rules_before:>12} {self.rules_after:>12}",
+            f"{'strings':<16} {self.strings_before:>12} {self.strings_after:>12}",
+            f"{'compiled bytes':<16} {self.compiled_bytes_before:>12} "
+            f"{self.compiled_bytes_after:>12}",
+        ]
+        if self.scan_ms_before is not None and self.scan_ms_after is not None:
+            lines.append(
+                f"{'scan ms':<16} {self.scan_ms_before:>12.1f} "
+                f"{self.scan_ms_after:>12.1f}"
+            )
+        if self.mismatches is not None:
+            lines.append(f"Verdicts changed on {self.mismatches} sample documents.")
+        lines.append(f"Optimized rules written to {self.output}")
+        return "\n".join(lines)
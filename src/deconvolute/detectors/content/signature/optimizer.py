@@ -0,0 +1,301 @@
+import io
+import re
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+
+import yara
+
+from deconvolute.detectors.base import Content
+from deconvolute.detectors.content.signature.models import OptimizationReport
+from deconvolute.detectors.content.signature.profiling import time_scans
+from deconvolute.detectors.content.signature.source import (
+    RuleSource,
+    StringDef,
+    imports,
+    rule_files,
+    split_rules,
+)
+from deconvolute.errors import ConfigurationError
+
+# Meta values that identify what a rule detects. Rules are only merged if all
+# of them (and the tags) agree, so merged rules report the same tags.
+_MERGE_META = ("category", "confidence", "tag")
+
+# Identifiers in a condition that may name a rule: not strings ($a, #a, @a,
+# !a), and not module members (pe.sections) or function calls.
+_CONDITION_WORD = re.compile(r"(?<![$#@!.\w])[A-Za-z_]\w*(?![\w(.])")
+_CONDITION_WILDCARD = re.compile(r"(?<![$#@!.\w])([A-Za-z_]\w*)\*")
+_LITERAL = re.compile(r'"(?:[^"\\]|\\.)*"')
+
+
+def optimize_rules(
+    rules_path: str | Path,
+    output: str | Path,
+    documents: Sequence[Content] | None = None,
+    drop_wide: bool = True,
+    merge: bool = True,
+    repeat: int = 3,
+) -> OptimizationReport:
+    """
+    Writes a compacted copy of a rule set that `SignatureDetector` can load.
+
+    Generated bundles (e.g. from yara-gen) hold many single-string rules with
+    `nocase wide ascii` strings and repeated meta blocks. For rules that match
+    on any one of their strings (`any of them`), the optimizer:
+
+    - drops `wide ascii` from strings when `drop_wide` is set. UTF-16 variants
+      never occur in UTF-8 text, but double the strings YARA has to match.
+      A lone `ascii` is always dropped, since it is the default.
+    - merges rules of one file that share their tags and 'category',
+      'confidence' and 'tag' meta values into one rule when `merge` is set.
+      The merged rule keeps those values and the lowest 'score'.
+    - removes duplicate strings within a rule. `nocase` strings that differ
+      only in case count as duplicates.
+
+    Rules with other conditions are copied unchanged, and rules that another
+    condition refers to by name are never merged. Each source file is written
+    under the same name into `output`, which must lie outside `rules_path`.
+    The source set is compiled and timed before anything is written.
+
+    Merged rules report their new name ('merged_<category>_<n>') instead of
+    the original rule names, and their lowest score applies to all of their
+    strings under `min_score`. Pass merge=False to keep rule identities.
+
+    Args:
+        rules_path: A .yar file or a directory of them.
+        output: Directory for the optimized files. Created if missing.
+        documents: Optional sample corpus. If given, both sets are timed on it
+            and verdicts are compared document by document.
+        drop_wide: Whether to drop UTF-16 ('wide') string variants.
+        merge: Whether to merge rules that detect the same thing.
+        repeat: Times each timing is repeated. The fastest run counts.
+
+    Returns:
+        OptimizationReport: Sizes and timings before and after.
+
+    Raises:
+        ConfigurationError: If there are no rule files, `output` could
+            overwrite them, or the source or optimized rules fail to compile.
+    """
+    source_path = Path(rules_path)
+    sources = rule_files(source_path)
+    if not sources:
+        raise ConfigurationError(f"No .yar files found in {rules_path}")
+    destination = Path(output)
+    _check_destination(source_path, destination, sources)
+
+    # Everything about the source set is measured before a file is written.
+    before = _compile(sources)
+    texts = {ns: Path(path).read_text(encoding="utf-8") for ns, path in sources.items()}
+    parsed = {ns: split_rules(text) for ns, text in texts.items()}
+    referenced = _referenced_rules(r for rules in parsed.values() for r in rules)
+    scan_ms_before = (
+        time_scans(before, documents, repeat) if documents is not None else None
+    )
+
+    destination.mkdir(parents=True, exist_ok=True)
+    optimized: dict[str, str] = {}
+    rules_before = strings_before = rules_after = strings_after = 0
+    for namespace, rules in parsed.items():
+        rewritten = _optimize_file(rules, referenced, drop_wide, merge)
+        header = "".join(f"{line.strip()}\n" for line in imports(texts[namespace]))
+        target = destination / namespace
+        target.write_text(header + "\n\n".join(rewritten) + "\n", encoding="utf-8")
+        optimized[namespace] = str(target)
+
+        written = split_rules(target.read_text(encoding="utf-8"))
+        rules_before += len(rules)
+        strings_before += sum(len(r.string_identifiers()) for r in rules)
+        rules_after += len(written)
+        strings_after += sum(len(r.string_identifiers()) for r in written)
+
+    after = _compile(optimized)
+    report = OptimizationReport(
+        output=str(destination),
+        rules_before=rules_before,
+        strings_before=strings_before,
+        rules_after=rules_after,
+        strings_after=strings_after,
+        compiled_bytes_before=_compiled_size(before),
+        compiled_bytes_after=_compiled_size(after),
+    )
+    if documents is None:
+        return report
+
+    mismatches = sum(
+        bool(before.match(data=doc)) != bool(after.match(data=doc)) for doc in documents
+    )
+    return report.model_copy(
+        update={
+            "scan_ms_before": scan_ms_before,
+            "scan_ms_after": time_scans(after, documents, repeat),
+            "mismatches": mismatches,
+        }
+    )
+
+
+def _check_destination(
+    source: Path, destination: Path, sources: dict[str, str]
+) -> None:
+    """Refuses output locations where optimized files could replace sources."""
+    resolved = destination.resolve()
+    if resolved.is_relative_to(source.resolve()):
+        raise ConfigurationError(
+            f"Output {destination} must not be {source} or inside it"
+        )
+    for namespace, path in sources.items():
+        if (resolved / namespace) == Path(path).resolve():
+            raise ConfigurationError(
+                f"Output {destination} would overwrite the source file {path}"
+            )
+
+
+def _referenced_rules(rules: Iterable[RuleSource]) -> Callable[[str], bool]:
+    """
+    Returns a test for rule names that some condition refers to, directly or
+    through a rule set wildcard such as '1 of (auto_*)'.
+    """
+    names: set[str] = set()
+    prefixes: set[str] = set()
+    for rule in rules:
+        condition = _LITERAL.sub(" ", rule.section("condition") or "")
+        names.update(_CONDITION_WORD.findall(condition))
+        prefixes.update(_CONDITION_WILDCARD.findall(condition))
+    return lambda name: name in names or name.startswith(tuple(prefixes))
+
+
+def _optimize_file(
+    rules: list[RuleSource],
+    referenced: Callable[[str], bool],
+    drop_wide: bool,
+    merge: bool,
+) -> list[str]:
+    """Returns the source of each rule of the optimized file, in order."""
+    taken = {rule.identifier for rule in rules}
+    groups: dict[tuple[object, ...], list[tuple[RuleSource, list[StringDef]]]] = {}
+    output: list[str | tuple[object, ...]] = []
+
+    for rule in rules:
+        strings = _mergeable_strings(rule)
+        if strings is None:
+            output.append(rule.text.strip())
+            continue
+        strings = [_compact(s, drop_wide) for s in strings]
+        meta = rule.meta()
+        # Rules other conditions refer to keep their name.
+        if merge and "category" in meta and not referenced(rule.identifier):
+            key: tuple[object, ...] = (rule.tags(),) + tuple(
+                meta.get(name) for name in _MERGE_META
+            )
+        else:
+            key = (rule.identifier,)
+        if key not in groups:
+            groups[key] = []
+            output.append(key)
+        groups[key].append((rule, strings))
+
+    merged = 0
+    texts = []
+    for entry in output:
+        if isinstance(entry, str):
+            texts.append(entry)
+            continue
+        group = groups[entry]
+        if len(group) == 1:
+            rule, strings = group[0]
+            texts.append(_render(rule.identifier, rule.tags(), rule.meta(), strings))
+            continue
+        merged += 1
+        texts.append(_render_merged(group, taken, merged))
+    return texts
+
+
+def _mergeable_strings(rule: RuleSource) -> list[StringDef] | None:
+    """The rule's strings if it matches on any one of them, otherwise None."""
+    if rule.modifiers:
+        return None
+    condition = " ".join((rule.section("condition") or "").split())
+    if condition not in ("any of them", "1 of them"):
+        return None
+    return rule.strings() or None
+
+
+def _compact(string: StringDef, drop_wide: bool) -> StringDef:
+    modifiers = set(string.modifiers)
+    if drop_wide and {"wide", "ascii"} <= modifiers:
+        modifiers -= {"wide", "ascii"}
+    if "ascii" in modifiers and "wide" not in modifiers:
+        modifiers.discard("ascii")
+    kept = tuple(m for m in string.modifiers if m in modifiers)
+    return string._replace(modifiers=kept)
+
+
+def _unique(strings: list[StringDef]) -> list[StringDef]:
+    seen = set()
+    unique = []
+    for string in strings:
+        value = string.value
+        if "nocase" in string.modifiers and value.startswith('"'):
+            value = value.lower()
+        key = (value, frozenset(string.modifiers))
+        if key not in seen:
+            seen.add(key)
+            unique.append(string)
+    return unique
+
+
+def _render_merged(
+    group: list[tuple[RuleSource, list[StringDef]]], taken: set[str], number: int
+) -> str:
+    first, _ = group[0]
+    meta = {k: v for k, v in first.meta().items() if k in _MERGE_META}
+    scores = [_score(rule.meta()) for rule, _ in group]
+    if all(score is not None for score in scores):
+        meta["score"] = f'"{min(s for s in scores if s is not None)}"'
+    meta["merged_rules"] = str(len(group))
+
+    category = re.sub(r"\W+", "_", first.meta()["category"].strip('"')).strip("_")
+    name = f"merged_{category or 'rules'}_{number}"
+    while name in taken:
+        name += "_"
+    taken.add(name)
+
+    strings = [s for _, rule_strings in group for s in rule_strings]
+    return _render(name, first.tags(), meta, strings)
+
+
+def _render(
+    name: str, tags: tuple[str, ...], meta: dict[str, str], strings: list[StringDef]
+) -> str:
+    strings = _unique(strings)
+    header = f"rule {name} : {' '.join(tags)}" if tags else f"rule {name}"
+    lines = [header, "{"]
+    if meta:
+        lines.append("    meta:")
+        lines += [f"        {key} = {value}" for key, value in meta.items()]
+    lines.append("    strings:")
+    for index, string in enumerate(strings, start=1):
+        modifiers = "".join(f" {m}" for m in string.modifiers)
+        lines.append(f"        $s{index} = {string.value}{modifiers}")
+    lines += ["    condition:", "        any of them", "}"]
+    return "\n".join(lines)
+
+
+def _score(meta: dict[str, str]) -> float | None:
+    try:
+        return float(meta["score"].strip('"'))
+    except (KeyError, ValueError):
+        return None
+
+
+def _compile(filepaths: dict[str, str]) -> yara.Rules:
+    try:
+        return yara.compile(filepaths=filepaths)
+    except yara.Error as e:
+        raise ConfigurationError(f"Failed to compile rules: {e}") from e
+
+
+def _compiled_size(rules: yara.Rules) -> int:
+    buffer = io.BytesIO()
+    rules.save(file=buffer)
+    return len(buffer.getvalue())
@@ -0,0 +1,172 @@
+import math
+import re
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+import yara
+
+from deconvolute.detectors.base import Content
+from deconvolute.detectors.content.signature.models import (
+    RuleProfile,
+    RuleProfileReport,
+    StringProfile,
+)
+from deconvolute.detectors.content.signature.source import (
+    RuleSource,
+    imports,
+    split_rules,
+)
+from deconvolute.utils.logger import get_logger
+
+logger = get_logger()
+
+_SLOW_STRING = re.compile(r'string "(\$\w*)"')
+
+# Scanned once per measurement to subtract the fixed cost of a match call.
+_BASELINE_RULE = "rule baseline { condition: false }"
+
+# Per rule: string identifier -> [hits, documents].
+_StringCounts = dict[str, list[int]]
+
+
+def profile_rules(
+    rules: yara.Rules,
+    filepaths: dict[str, str],
+    documents: Sequence[Content],
+    repeat: int = 1,
+) -> RuleProfileReport:
+    """
+    Measures which rules and strings make scans of a corpus slow.
+
+    YARA matches all rules in one pass, so the cost of a single rule cannot be
+    read off a normal scan. Each rule is compiled on its own instead and the
+    corpus is scanned with it alone, which also collects YARA's warnings about
+    strings whose atoms are too weak to filter candidates efficiently.
+
+    Args:
+        rules: The compiled rule set, used for the match counts.
+        filepaths: Source file of each namespace, as passed to `yara.compile`.
+        documents: The corpus.
+        repeat: Times each measurement is repeated. The fastest run counts.
+
+    Returns:
+        RuleProfileReport: Every rule, most expensive first.
+    """
+    scan_ms = time_scans(rules, documents, repeat)
+    counts, matched = _count_matches(rules, documents)
+    baseline_ms = time_scans(yara.compile(source=_BASELINE_RULE), documents, repeat)
+
+    profiles = []
+    for namespace, path in filepaths.items():
+        source = Path(path).read_text(encoding="utf-8")
+        header = "\n".join(imports(source))
+        for rule in split_rules(source):
+            key = (namespace, rule.identifier)
+            profiles.append(
+                _profile_rule(
+                    namespace,
+                    rule,
+                    header,
+                    documents,
+                    repeat,
+                    baseline_ms,
+                    counts.get(key, {}),
+                    matched.get(key, 0),
+                )
+            )
+
+    profiles.sort(key=lambda p: (p.scan_ms is None, -(p.scan_ms or 0.0), -p.hits))
+    return RuleProfileReport(
+        documents=len(documents),
+        bytes=sum(_size(doc) for doc in documents),
+        scan_ms=scan_ms,
+        rules=profiles,
+    )
+
+
+def _profile_rule(
+    namespace: str,
+    rule: RuleSource,
+    header: str,
+    documents: Sequence[Content],
+    repeat: int,
+    baseline_ms: float,
+    counts: _StringCounts,
+    matched: int,
+) -> RuleProfile:
+    try:
+        alone = yara.compile(source=f"{header}\n{rule.text}")
+    except yara.Error as e:
+        logger.debug(f"Cannot time rule {namespace}:{rule.identifier} alone: {e}")
+        scan_ms = None
+        warnings: list[str] = []
+    else:
+        scan_ms = max(time_scans(alone, documents, repeat) - baseline_ms, 0.0)
+        warnings = list(alone.warnings)
+
+    slow = {m.group(1) for w in warnings if (m := _SLOW_STRING.search(w))}
+    identifiers = rule.string_identifiers()
+    identifiers += [i for i in counts if i not in identifiers]
+    strings = [
+        StringProfile(
+            identifier=i,
+            hits=counts.get(i, [0, 0])[0],
+            documents=counts.get(i, [0, 0])[1],
+            slow=i in slow,
+        )
+        for i in identifiers
+    ]
+    return RuleProfile(
+        namespace=namespace,
+        rule=rule.identifier,
+        documents=matched,
+        scan_ms=scan_ms,
+        strings=strings,
+        warnings=warnings,
+    )
+
+
+def time_scans(rules: yara.Rules, documents: Sequence[Content], repeat: int) -> float:
+    """
+    Times scans of a corpus with a compiled rule set.
+
+    Args:
+        rules: The compiled rule set.
+        documents: The corpus.
+        repeat: Times the corpus is scanned. The fastest run counts.
+
+    Returns:
+        float: The fastest scan of the whole corpus, in milliseconds.
+    """
+    best = math.inf
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        for document in documents:
+            rules.match(data=document)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000 if documents else 0.0
+
+
+def _count_matches(
+    rules: yara.Rules, documents: Sequence[Content]
+) -> tuple[dict[tuple[str, str], _StringCounts], dict[tuple[str, str], int]]:
+    """String hits and matched documents per (namespace, rule)."""
+    counts: dict[tuple[str, str], _StringCounts] = {}
+    matched: dict[tuple[str, str], int] = {}
+    for document in documents:
+        for match in rules.match(data=document):
+            key = (match.namespace, match.rule)
+            matched[key] = matched.get(key, 0) + 1
+            strings = counts.setdefault(key, {})
+            for string in match.strings:
+                entry = strings.setdefault(string.identifier, [0, 0])
+                entry[0] += len(string.instances)
+                entry[1] += 1
+    return counts, matched
+
+
+def _size(document: Content) -> int:
+    if isinstance(document, str):
+        return len(document.encode("utf-8"))
+    return memoryview(document).nbytes
@@ -0,0 +1,225 @@
+"""
+Lightweight parsing of YARA rule sources.
+
+Only the structure needed by the profiler, the chunked scanner and the
+optimizer is recognised: includes, rule boundaries, tags, sections, meta
+values and string definitions. Anything this module cannot make sense of is reported as
+unknown, never guessed.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+from deconvolute.errors import ConfigurationError
+from deconvolute.utils.hashing import file_digest
+
+_RULE_HEADER = re.compile(
+    r"^[ \t]*((?:(?:private|global)\s+)*)rule\s+(\w+)", re.MULTILINE
+)
+_SECTION = re.compile(r"\b(meta|strings|condition)\s*:")
+_STRING_DEF = re.compile(r"(\$\w*)\s*=")
+_META_VALUE = re.compile(r'(\w+)\s*=\s*("(?:[^"\\\n]|\\.)*"|-?\d+|true|false)')
+_STRING_VALUE = re.compile(
+    r'(\$\w*)\s*=\s*("(?:[^"\\\n]|\\.)*"|\{[^}]*\}|/(?:[^/\\\n]|\\.)+/[is]*)'
+    r'((?:[ \t]+(?:xor\([^)]*\)|base64(?:wide)?\("(?:[^"\\]|\\.)*"\)|\w+))*)'
+)
+_INCLUDE = re.compile(r'^[ \t]*include\s+"((?:[^"\\\n]|\\.)*)"', re.MULTILINE)
+_COMMENT = re.compile(r'//[^\n]*|/\*.*?\*/|("(?:[^"\\\n]|\\.)*")', re.DOTALL)
+
+
+class StringDef(NamedTuple):
+    """One entry of a rule's 'strings' section."""
+
+    identifier: str
+    # As written: a quoted text string, a {hex} string or a /regex/.
+    value: str
+    modifiers: tuple[str, ...]
+
+
+class RuleSource:
+    """The source text of one rule."""
+
+    __slots__ = ("identifier", "modifiers", "text")
+
+    def __init__(self, identifier: str, modifiers: frozenset[str], text: str):
+        self.identifier = identifier
+        # 'private' and/or 'global'.
+        self.modifiers = modifiers
+        self.text = text
+
+    def section(self, name: str) -> str | None:
+        """The body of the 'meta', 'strings' or 'condition' section, if any."""
+        opening, closing = self.text.find("{"), self.text.rfind("}")
+        body = strip_comments(self.text[opening + 1 : closing])
+        sections = list(_SECTION.finditer(body))
+        for position, section in enumerate(sections):
+            if section.group(1) == name:
+                end = (
+                    sections[position + 1].start()
+                    if position + 1 < len(sections)
+                    else len(body)
+                )
+                return body[section.end() : end]
+        return None
+
+    def string_identifiers(self) -> list[str]:
+        """Identifiers defined in the 'strings' section, in order."""
+        return _STRING_DEF.findall(self.section("strings") or "")
+
+    def tags(self) -> tuple[str, ...]:
+        """The tags after the rule's name."""
+        header = self.text[: self.text.find("{")]
+        _, colon, tags = header.partition(":")
+        return tuple(tags.split()) if colon else ()
+
+    def meta(self) -> dict[str, str]:
+        """The 'meta' values, as written (strings keep their quotes)."""
+        return dict(_META_VALUE.findall(self.section("meta") or ""))
+
+    def strings(self) -> list[StringDef] | None:
+        """The string definitions, or None if some cannot be parsed."""
+        section = self.section("strings") or ""
+        found = [
+            StringDef(m.group(1), m.group(2), tuple(m.group(3).split()))
+            for m in _STRING_VALUE.finditer(section)
+        ]
+        if len(found) != len(_STRING_DEF.findall(section)):
+            return None
+        return found
+
+
+def rule_files(path: Path) -> dict[str, str]:
+    """
+    Maps each rule namespace (the file name) to its source file.
+
+    Args:
+        path: A .yar file, or a directory whose .yar files are all loaded.
+
+    Raises:
+        ConfigurationError: If the path does not exist.
+    """
+    if not path.exists():
+        raise ConfigurationError(f"Rule path not found: {path}")
+
+    if path.is_file():
+        # Single file mode (namespace is filename)
+        return {path.name: str(path)}
+
+    # Directory mode: Scan for all .yar files
+    return {f.name: str(f) for f in sorted(path.glob("*.yar"))}
+
+
+def included_files(path: str | Path) -> list[str]:
+    """
+    Files a rule file pulls in through `include` directives, recursively.
+
+    Relative includes are resolved against the directory of the including
+    file, as YARA does. Files that cannot be read are listed but not followed;
+    compiling the rules reports them.
+
+    Args:
+        path: The rule file.
+
+    Returns:
+        list[str]: Every included file once, in the order YARA reads them.
+    """
+    found: list[str] = []
+    seen = {str(Path(path).resolve())}
+    pending = [Path(path)]
+    while pending:
+        current = pending.pop(0)
+        try:
+            text = current.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        for name in _INCLUDE.findall(strip_comments(text)):
+            included = (current.parent / name).resolve()
+            if str(included) not in seen:
+                seen.add(str(included))
+                found.append(str(included))
+                pending.append(included)
+    return found
+
+
+def source_digest(path: str | Path) -> str:
+    """
+    Content hash of a rule file and every file it includes.
+
+    Args:
+        path: The rule file.
+
+    Returns:
+        str: The SHA-256 hex digest of the file alone if it includes nothing,
+        so the digest only changes for files that use includes.
+    """
+    digest = file_digest(str(path))
+    included = included_files(path)
+    if not included:
+        return digest
+    combined = hashlib.sha256(digest.encode())
+    for name in included:
+        try:
+            combined.update(f"\n{name}={file_digest(name)}".encode())
+        except OSError:
+            combined.update(f"\n{name}=missing".encode())
+    return combined.hexdigest()
+
+
+def split_rules(source: str) -> list[RuleSource]:
+    """Returns each rule of a rule file, in order."""
+    found = []
+    for header in _RULE_HEADER.finditer(source):
+        start = source.find("{", header.end())
+        end = _block_end(source, start) if start >= 0 else None
+        if end is None:
+            continue
+        found.append(
+            RuleSource(
+                header.group(2),
+                frozenset(header.group(1).split()),
+                source[header.start() : end],
+            )
+        )
+    return found
+
+
+def imports(source: str) -> list[str]:
+    """The `import "module"` statements of a rule file."""
+    return re.findall(r'^[ \t]*import\s+"[^"]*"', source, re.MULTILINE)
+
+
+def strip_comments(text: str) -> str:
+    """Removes // and /* */ comments, leaving string literals intact."""
+    return _COMMENT.sub(lambda m: m.group(1) or " ", text)
+
+
+def _block_end(source: str, start: int) -> int | None:
+    """Index after the brace closing the one at `start`. Skips strings and
+    comments."""
+    depth = 0
+    i = start
+    while i < len(source):
+        char = source[i]
+        if char == '"':
+            i += 1
+            while i < len(source) and source[i] != '"':
+                i += 2 if source[i] == "\\" else 1
+        elif source.startswith("//", i):
+            i = source.find("\n", i)
+            if i < 0:
+                return None
+        elif source.startswith("/*", i):
+            i = source.find("*/", i)
+            if i < 0:
+                return None
+            i += 1
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return None
@@ -0,0 +1,114 @@
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+from deconvolute.detectors.content.signature.source import (
+    RuleSource,
+    included_files,
+    split_rules,
+)
+
+# Conditions satisfied by a single occurrence of any one string. Only rule
+# sets made of these can be scanned in chunks with unchanged results.
+_SINGLE_OCCURRENCE = re.compile(
+    r"(?:any|1) of (?:them|\( ?\$\w*\*?(?: ?, ?\$\w*\*?)* ?\))"
+    r"|\$\w+(?: or \$\w+)*"
+)
+_TEXT_STRING = re.compile(r'\$\w*\s*=\s*"((?:[^"\\]|\\.)*)"([^\n$]*)')
+_HEX_STRING = re.compile(r"\$\w*\s*=\s*\{([^}]*)\}")
+_REGEX_STRING = re.compile(r"\$\w*\s*=\s*/")
+_TEXT_ESCAPE = re.compile(r"\\x[0-9A-Fa-f]{2}|\\.")
+_HEX_TOKEN = re.compile(r"\[\s*(\d*)\s*(-?)\s*(\d*)\s*\]|~?[0-9A-Fa-f?]{2}|[()|]")
+
+# Modifiers that make a match longer than its string, or that depend on the
+# bytes around it.
+_UNSPLITTABLE_MODIFIERS = frozenset({"fullword", "base64", "base64wide"})
+
+
+class SplitLayout(NamedTuple):
+    """How a rule set can be scanned in chunks."""
+
+    # Bytes each chunk shares with the next, so that every match lies wholly
+    # inside at least one chunk.
+    overlap: int
+    # (namespace, rule) -> position in the rule set, to restore YARA's order.
+    order: dict[tuple[str, str], int]
+
+
+def split_layout(filepaths: dict[str, str]) -> SplitLayout | None:
+    """
+    Works out whether chunked scans of the rule set give single-pass results.
+
+    That holds if every rule matches as soon as any one of its strings occurs
+    (e.g. 'any of them') and every string has a bounded match length: a rule
+    then matches the document exactly if it matches a chunk that is at least
+    the longest match wide.
+
+    Args:
+        filepaths: Source file of each namespace, as passed to `yara.compile`.
+
+    Returns:
+        SplitLayout | None: The layout, or None if any rule depends on more
+        than a single occurrence (counts, offsets, filesize, other rules,
+        modules), uses regular expressions or unbounded jumps, cannot be
+        parsed, or a source file includes other files.
+    """
+    longest = 1
+    order: dict[tuple[str, str], int] = {}
+    for namespace, path in filepaths.items():
+        # Rules pulled in with 'include' are not parsed, so they cannot be
+        # vouched for.
+        if included_files(path):
+            return None
+        for rule in split_rules(Path(path).read_text(encoding="utf-8")):
+            length = _longest_match(rule)
+            if length is None:
+                return None
+            longest = max(longest, length)
+            order[(namespace, rule.identifier)] = len(order)
+    return SplitLayout(overlap=longest - 1, order=order)
+
+
+def _longest_match(rule: RuleSource) -> int | None:
+    if "global" in rule.modifiers:
+        return None
+    condition = " ".join((rule.section("condition") or "").split())
+    if not _SINGLE_OCCURRENCE.fullmatch(condition):
+        return None
+
+    strings = rule.section("strings") or ""
+    if _REGEX_STRING.search(strings):
+        return None
+    lengths = [
+        _text_length(m.group(1), m.group(2)) for m in _TEXT_STRING.finditer(strings)
+    ]
+    lengths += [_hex_length(m.group(1)) for m in _HEX_STRING.finditer(strings)]
+    if not lengths or len(lengths) != len(rule.string_identifiers()):
+        return None
+    if any(length is None for length in lengths):
+        return None
+    return max(length for length in lengths if length is not None)
+
+
+def _text_length(literal: str, modifiers: str) -> int | None:
+    words = set(re.findall(r"\w+", modifiers))
+    if words & _UNSPLITTABLE_MODIFIERS:
+        return None
+    escaped = _TEXT_ESCAPE.findall(literal)
+    plain = _TEXT_ESCAPE.sub("", literal)
+    length = len(escaped) + len(plain.encode("utf-8"))
+    return length * 2 if "wide" in words else length
+
+
+def _hex_length(body: str) -> int | None:
+    """Upper bound of a hex string's match length (alternatives are summed)."""
+    length = 0
+    for token in _HEX_TOKEN.finditer(body):
+        if token.group(0).startswith("["):
+            low, dash, high = token.groups()
+            if dash and not high:
+                return None
+            length += int(high or low or 0)
+        elif token.group(0) not in "()|":
+            length += 1
+    return length
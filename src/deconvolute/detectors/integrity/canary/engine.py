@@ -1,9 +1,8 @@
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from deconvolute.constants import CANARY_INTEGRITY_INSTRUCTION, CANARY_TEMPLATE_FORMAT
-from deconvolute.detectors.base import BaseDetector
+from deconvolute.detectors.base import BaseDetector, DetectorCost, DetectorSpec
+from deconvolute.utils.executor import DetectorExecutor
 from deconvolute.utils.logger import get_logger
 
 from .generator import generate_raw_token
@@ -21,11 +20,21 @@ class CanaryDetector(BaseDetector):
 
     Attributes:
         token_length: The length of the canary token. Defaults to 16.
+        executor: Optional executor for the async methods. Defaults to the
+            shared executor.
     """
 
-    def __init__(self, token_length: int = 16):
+    # A substring test and a str.replace are cheaper than a thread handoff.
+    cost: DetectorCost = "cheap"
+
+    def __init__(
+        self, token_length: int = 16, executor: DetectorExecutor | None = None
+    ):
         self.token_length = token_length
-        self._executor = ThreadPoolExecutor()
+        self.executor = executor
+
+    def to_spec(self) -> DetectorSpec:
+        return DetectorSpec.of(CanaryDetector, token_length=self.token_length)
 
     def inject(self, prompt: str) -> tuple[str, str]:
         """
@@ -104,13 +113,9 @@ class CanaryDetector(BaseDetector):
         return content.replace(token, "").rstrip()
 
     async def a_check(self, content: str, **kwargs: Any) -> CanaryResult:
-        """Async version of check() using a thread pool."""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            self._executor, lambda: self.check(content, **kwargs)
-        )
+        """Async version of check(). Runs inline on the event loop."""
+        return await self._dispatch(len(content), lambda: self.check(content, **kwargs))
 
     async def a_clean(self, content: str, token: str) -> str:
-        """Async version of clean() using a thread pool."""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, self.clean, content, token)
+        """Async version of clean(). Runs inline on the event loop."""
+        return await self._dispatch(len(content), self.clean, content, token)
@@ -19,6 +19,18 @@ class ConfigurationError(DeconvoluteError):
     pass
 
 
+class ScanTimeoutError(DeconvoluteError):
+    """
+    Raised by a detector when a check exceeds its time budget.
+
+    The scan entry points (scan, a_scan, scan_many, guard) catch this and apply
+    their timeout policy instead of propagating it. It is raised directly only
+    when calling a detector with an explicit `timeout`.
+    """
+
+    pass
+
+
 class ThreatDetectedError(DeconvoluteError):
     """
     Raised when a security threat is detected.
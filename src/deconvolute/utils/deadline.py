@@ -0,0 +1,35 @@
+import math
+import time
+
+
+class Deadline:
+    """
+    A time budget measured on the monotonic clock.
+
+    Created once per call and consulted before each unit of work, so every
+    step sees the time that is actually left rather than the original budget.
+    """
+
+    __slots__ = ("timeout", "_expires_at")
+
+    def __init__(self, timeout: float | None):
+        """
+        Args:
+            timeout: Budget in seconds. None or infinity means unbounded.
+        """
+        self.timeout = None if timeout is None or math.isinf(timeout) else timeout
+        self._expires_at = (
+            None if self.timeout is None else time.monotonic() + self.timeout
+        )
+
+    def remaining(self) -> float | None:
+        """Returns the seconds left (never negative), or None if unbounded."""
+        if self._expires_at is None:
+            return None
+        return max(0.0, self._expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """True once the budget is used up."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0.0
@@ -0,0 +1,198 @@
+import os
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, ParamSpec, TypeVar
+
+from pydantic import BaseModel, ConfigDict
+
+from deconvolute.errors import ConfigurationError
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+EXECUTOR_WORKERS_ENV_VAR = "DECONVOLUTE_EXECUTOR_WORKERS"
+
+
+class ExecutorStats(BaseModel):
+    """
+    Snapshot of a DetectorExecutor's load.
+
+    Attributes:
+        max_workers (int): Size of the thread pool.
+        active (int): Tasks currently running on a worker thread.
+        queued (int): Tasks submitted but not started yet (queue depth).
+        completed (int): Tasks that finished, successfully or not.
+    """
+
+    max_workers: int
+    active: int
+    queued: int
+    completed: int
+
+    model_config = ConfigDict(frozen=True)
+
+
+class DetectorExecutor(Executor):
+    """
+    A bounded thread pool for the blocking work behind detectors' async methods.
+
+    All built-in detectors share one process-wide instance by default (see
+    `get_default_executor()`), so creating many detectors does not create many
+    idle threads. Pass an instance to a detector's `executor` argument or to
+    `Pipeline(executor=...)` to isolate workloads.
+
+    It tracks queue depth and active workers, see `stats()`.
+    """
+
+    def __init__(
+        self, max_workers: int | None = None, thread_name_prefix: str = "deconvolute"
+    ):
+        """
+        Args:
+            max_workers: Number of worker threads. Defaults to
+                DECONVOLUTE_EXECUTOR_WORKERS, or min(32, CPUs + 4) like the
+                standard library.
+            thread_name_prefix: Prefix for worker thread names.
+
+        Raises:
+            ConfigurationError: If max_workers is less than 1.
+        """
+        if max_workers is None:
+            max_workers = _default_worker_count()
+        if max_workers < 1:
+            raise ConfigurationError(f"max_workers must be >= 1, got {max_workers}.")
+
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+
+    def submit(
+        self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs
+    ) -> Future[T]:
+        with self._lock:
+            self._queued += 1
+        try:
+            future = self._pool.submit(self._run, fn, *args, **kwargs)
+        except BaseException:
+            # E.g. after shutdown(): the task was never queued.
+            with self._lock:
+                self._queued -= 1
+            raise
+        future.add_done_callback(self._on_done)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def stats(self) -> ExecutorStats:
+        """Returns the current queue depth, active workers and completed tasks."""
+        with self._lock:
+            return ExecutorStats(
+                max_workers=self.max_workers,
+                active=self._active,
+                queued=self._queued,
+                completed=self._completed,
+            )
+
+    def _run(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+
+    def _on_done(self, future: Future[Any]) -> None:
+        # Tasks cancelled before they started never reach _run().
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    def __repr__(self) -> str:
+        stats = self.stats()
+        return (
+            f"DetectorExecutor(max_workers={stats.max_workers}, "
+            f"active={stats.active}, queued={stats.queued})"
+        )
+
+
+_default_executor: DetectorExecutor | None = None
+_default_lock = threading.Lock()
+
+# Executor selected by the innermost executor_scope() of the current context.
+_scoped_executor: ContextVar[DetectorExecutor | None] = ContextVar(
+    "deconvolute_executor", default=None
+)
+
+
+def get_default_executor() -> DetectorExecutor:
+    """
+    Returns the process-wide executor, creating it on first use.
+    """
+    global _default_executor
+    executor = _default_executor
+    if executor is None:
+        with _default_lock:
+            if _default_executor is None:
+                _default_executor = DetectorExecutor()
+            executor = _default_executor
+    return executor
+
+
+def set_default_executor(executor: DetectorExecutor | None) -> None:
+    """
+    Replaces the process-wide executor.
+
+    The previous executor is not shut down, since tasks may still be running on
+    it. Pass None to create a fresh default on next use.
+    """
+    global _default_executor
+    with _default_lock:
+        _default_executor = executor
+
+
+def current_executor() -> DetectorExecutor:
+    """Returns the executor of the enclosing executor_scope(), or the default."""
+    return _scoped_executor.get() or get_default_executor()
+
+
+@contextmanager
+def executor_scope(executor: DetectorExecutor | None) -> Iterator[None]:
+    """
+    Routes detectors without an executor of their own to `executor` for the
+    duration of the block, including tasks created inside it.
+
+    Args:
+        executor: The executor to use, or None to leave the routing unchanged.
+    """
+    if executor is None:
+        yield
+        return
+    token = _scoped_executor.set(executor)
+    try:
+        yield
+    finally:
+        _scoped_executor.reset(token)
+
+
+def _default_worker_count() -> int:
+    raw = os.getenv(EXECUTOR_WORKERS_ENV_VAR)
+    if raw is None:
+        return min(32, (os.cpu_count() or 1) + 4)
+    try:
+        return int(raw)
+    except ValueError as e:
+        raise ConfigurationError(
+            f"{EXECUTOR_WORKERS_ENV_VAR} must be an integer, got '{raw}'."
+        ) from e
@@ -0,0 +1,38 @@
+import hashlib
+
+# 128-bit digests: collisions are negligible for any realistic corpus, and the
+# keys stay small enough to hold millions of them in memory.
+DIGEST_SIZE = 16
+
+
+def content_digest(content: str | bytes | bytearray | memoryview) -> bytes:
+    """
+    Returns a fast, stable digest of a text.
+
+    Uses BLAKE2b, which is faster than SHA-256 on 64-bit CPUs and, unlike the
+    built-in `hash()`, is stable across processes.
+
+    Args:
+        content: The text to hash, or its UTF-8 bytes. A text and its encoding
+            have the same digest.
+
+    Returns:
+        bytes: A 16-byte digest.
+    """
+    if not isinstance(content, str):
+        return hashlib.blake2b(content, digest_size=DIGEST_SIZE).digest()
+    # 'surrogatepass' keeps lone surrogates (e.g. from broken decoders) hashable.
+    return hashlib.blake2b(
+        content.encode("utf-8", "surrogatepass"), digest_size=DIGEST_SIZE
+    ).digest()
+
+
+def file_digest(path: str) -> str:
+    """
+    Returns the SHA-256 hex digest of a file's contents.
+
+    Args:
+        path: The file to hash.
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
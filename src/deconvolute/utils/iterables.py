@@ -0,0 +1,121 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from itertools import islice
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Yields successive lists of up to `size` items, consuming `items` lazily.
+
+    Args:
+        items: Any iterable, including generators.
+        size: Maximum chunk length (must be >= 1).
+    """
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class Deduplicator(Generic[K]):
+    """
+    Filters repeated items out of a stream and restores them afterwards.
+
+        dedup = Deduplicator[str](
+            key=lambda s: (len(s), hash(s)), digest=content_digest, window=64
+        )
+        unique_results = [work(x) for x in dedup.unique(items)]
+        results = dedup.expand(unique_results)
+
+    Items are first compared by a cheap `key`, such as length and `hash()`.
+    Only when two keys are equal is the repeat verified: by equality while the
+    earlier item is among the last `window` unique items, otherwise by
+    `digest`. A stream without repeats therefore never computes a digest.
+
+    Memory holds one key per unique item, the last `window` unique items, and
+    the digests of verified repeats. The first repeat of an item seen more
+    than `window` unique items earlier cannot be verified and is passed on
+    again; later repeats of it are recognized by its digest. Items whose key
+    is None are never treated as duplicates.
+    """
+
+    def __init__(
+        self,
+        key: Callable[[K], Hashable | None],
+        digest: Callable[[K], Hashable],
+        window: int,
+    ) -> None:
+        """
+        Args:
+            key: Cheap value that equal items share, e.g. length and hash.
+            digest: Collision-resistant value used to verify a repeat of an
+                item that is no longer held, e.g. a content digest.
+            window: Unique items held to verify repeats by equality.
+        """
+        self._key = key
+        self._digest = digest
+        self._window = window
+        # key -> index of the first unique item with that key.
+        self._first: dict[Hashable, int] = {}
+        # The last `window` unique items with a key, by index.
+        self._recent: OrderedDict[int, K] = OrderedDict()
+        # digest -> index, for items whose digest was computed.
+        self._digests: dict[Hashable, int] = {}
+        self._unique = 0
+        # For every input position, the index of its first occurrence.
+        self._positions: list[int] = []
+
+    def unique(self, items: Iterable[K]) -> Iterator[K]:
+        """Yields the first occurrence of each item, consuming `items` lazily."""
+        for item in items:
+            seen = self._unique
+            index = self._find(item, seen)
+            self._positions.append(index)
+            if index == seen:
+                self._unique += 1
+                yield item
+
+    def _find(self, item: K, seen: int) -> int:
+        """Index of an earlier equal item, or `seen` if it is new."""
+        key = self._key(item)
+        if key is None:
+            return seen
+        first = self._first.setdefault(key, seen)
+        if first != seen:
+            earlier = self._recent.get(first)
+            if earlier is not None and earlier == item:
+                return first
+            digest = self._digest(item)
+            if digest in self._digests:
+                return self._digests[digest]
+            self._digests[digest] = seen
+            if earlier is not None:
+                self._digests.setdefault(self._digest(earlier), first)
+
+        self._recent[seen] = item
+        if len(self._recent) > self._window:
+            self._recent.popitem(last=False)
+        return seen
+
+    @property
+    def duplicates(self) -> int:
+        """Number of items skipped so far because they were seen before."""
+        return len(self._positions) - self._unique
+
+    def expand(self, unique_results: list[T]) -> list[T]:
+        """
+        Maps results of the unique items back to every input position.
+
+        Args:
+            unique_results: One result per item yielded by `unique()`, in order.
+
+        Returns:
+            list[T]: One result per input item, in input order. Repeated items
+            share the result of their first occurrence.
+        """
+        if not self.duplicates:
+            return unique_results
+        return [unique_results[i] for i in self._positions]
@@ -0,0 +1,18 @@
+import os
+
+import pytest
+
+from deconvolute.detectors.content.signature.compiled import RULES_CACHE_ENV_VAR
+
+
+@pytest.fixture(autouse=True, scope="session")
+def rules_cache_dir(tmp_path_factory):
+    """Keeps compiled signature rules out of the user's cache directory."""
+    path = tmp_path_factory.mktemp("rules-cache")
+    previous = os.environ.get(RULES_CACHE_ENV_VAR)
+    os.environ[RULES_CACHE_ENV_VAR] = str(path)
+    yield path
+    if previous is None:
+        del os.environ[RULES_CACHE_ENV_VAR]
+    else:
+        os.environ[RULES_CACHE_ENV_VAR] = previous
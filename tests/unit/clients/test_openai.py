@@ -1,3 +1,6 @@
+import asyncio
+import math
+import time
 from typing import Any
 from unittest.mock import AsyncMock, Mock
 
@@ -7,6 +10,9 @@ from deconvolute.clients.openai import (
     AsyncOpenAIProxy,
     OpenAIProxy,
 )
+from deconvolute.core.conversation import ConversationScanner
+from deconvolute.core.limiter import ConcurrencyLimiter
+from deconvolute.core.pipeline import Pipeline
 from deconvolute.detectors.base import BaseDetector, DetectionResult
 from deconvolute.errors import ThreatDetectedError
 
@@ -194,3 +200,136 @@ async def test_async_proxy_threat_detected(mock_async_openai_client):
 
     with pytest.raises(ThreatDetectedError):
         await proxy.chat.completions.create(messages=messages)
+
+
+class SlowScanner(BaseDetector):
+    """Scanner that sleeps longer than any test budget."""
+
+    def check(self, content: str, **kwargs: Any) -> DetectionResult:
+        time.sleep(0.1)
+        return DetectionResult(threat_detected=False, component="SlowScanner")
+
+    async def a_check(self, content: str, **kwargs: Any) -> DetectionResult:
+        await asyncio.sleep(5.0)
+        return DetectionResult(threat_detected=False, component="SlowScanner")
+
+
+def _response(content: str) -> Mock:
+    response = Mock()
+    response.choices = [Mock(index=0, message=Mock(content=content))]
+    return response
+
+
+def test_proxy_validation_timeout_fails_closed(mock_openai_client):
+    proxy = OpenAIProxy(
+        client=mock_openai_client,
+        detectors=[SlowScanner(), MockScanner()],
+        timeout=0.05,
+    )
+    mock_openai_client.chat.completions.create.return_value = _response("text")
+
+    with pytest.raises(ThreatDetectedError) as excinfo:
+        proxy.chat.completions.create(messages=[])
+
+    assert excinfo.value.result.metadata["reason"] == "timeout"
+    assert excinfo.value.result.metadata["timed_out"] == ["MockScanner"]
+
+
+def test_proxy_validation_timeout_fail_open_returns_response(mock_openai_client):
+    proxy = OpenAIProxy(
+        client=mock_openai_client,
+        detectors=[SlowScanner(), MockScanner()],
+        timeout=0.05,
+        on_timeout="fail_open",
+    )
+    mock_openai_client.chat.completions.create.return_value = _response("BAD_CONTENT")
+
+    response = proxy.chat.completions.create(messages=[])
+
+    # MockScanner never ran, so the response passes through unchecked.
+    assert response.choices[0].message.content == "BAD_CONTENT"
+
+
+@pytest.mark.asyncio
+async def test_async_proxy_validation_cancels_late_checks(mock_async_openai_client):
+    proxy = AsyncOpenAIProxy(
+        client=mock_async_openai_client, detectors=[SlowScanner()], timeout=0.05
+    )
+    mock_async_openai_client.chat.completions.create.return_value = _response("x")
+
+    start = time.perf_counter()
+    with pytest.raises(ThreatDetectedError):
+        await proxy.chat.completions.create(messages=[])
+    assert time.perf_counter() - start < 1.0
+
+
+def test_proxy_context_manager_closes_client(mock_openai_client):
+    with OpenAIProxy(client=mock_openai_client, detectors=[]) as proxy:
+        assert proxy.chat is not None
+    mock_openai_client.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_proxy_context_manager_closes_client(mock_async_openai_client):
+    mock_async_openai_client.close = AsyncMock()
+    async with AsyncOpenAIProxy(client=mock_async_openai_client, detectors=[]):
+        pass
+    mock_async_openai_client.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_proxy_sheds_validation_under_overload(mock_async_openai_client):
+    limiter = ConcurrencyLimiter(max_concurrency=1, on_overload="fail_closed")
+    proxy = AsyncOpenAIProxy(
+        client=mock_async_openai_client,
+        detectors=[SlowScanner()],
+        timeout=0.2,
+        limiter=limiter,
+    )
+    mock_async_openai_client.chat.completions.create.return_value = _response("x")
+
+    results = await asyncio.gather(
+        proxy.chat.completions.create(messages=[]),
+        proxy.chat.completions.create(messages=[]),
+        return_exceptions=True,
+    )
+
+    reasons = sorted(r.result.metadata["reason"] for r in results)  # type: ignore[union-attr]
+    assert reasons == ["overload", "timeout"]
+    assert limiter.stats().shed == 1
+    assert limiter.stats().active == 0
+
+
+def test_proxy_scans_only_new_input_messages(mock_openai_client):
+    scanner = MockScanner()
+    conversations = ConversationScanner(Pipeline([scanner], timeout=math.inf))
+    proxy = OpenAIProxy(
+        client=mock_openai_client, detectors=[], conversations=conversations
+    )
+    messages = [{"role": "user", "content": "hello"}]
+
+    proxy.chat.completions.create(messages=messages, deconvolute_session_id="s1")
+    messages.append({"role": "user", "content": "BAD_CONTENT"})
+    with pytest.raises(ThreatDetectedError, match="message index 1"):
+        proxy.chat.completions.create(messages=messages, deconvolute_session_id="s1")
+
+    # The session id is not forwarded and a flagged request is never sent.
+    mock_openai_client.chat.completions.create.assert_called_once_with(
+        messages=messages
+    )
+    assert conversations.stats().skipped == 1
+
+
+@pytest.mark.asyncio
+async def test_async_proxy_scans_input_messages(mock_async_openai_client):
+    conversations = ConversationScanner(Pipeline([MockScanner()], timeout=math.inf))
+    proxy = AsyncOpenAIProxy(
+        client=mock_async_openai_client, detectors=[], conversations=conversations
+    )
+
+    with pytest.raises(ThreatDetectedError):
+        await proxy.chat.completions.create(
+            messages=[{"role": "user", "content": "BAD_CONTENT"}]
+        )
+
+    mock_async_openai_client.chat.completions.create.assert_not_called()
@@ -0,0 +1,109 @@
+import asyncio
+import math
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+
+from deconvolute import MicroBatcher, Pipeline
+from deconvolute.detectors.base import BaseDetector, DetectionResult
+from deconvolute.errors import ConfigurationError
+
+
+class BatchRecordingDetector(BaseDetector):
+    """Flags content containing its keyword and records each batch it sees."""
+
+    def __init__(self, keyword: str):
+        self.keyword = keyword
+        self.batches: list[list[str]] = []
+
+    def check(self, content: str, **kwargs: Any) -> DetectionResult:
+        return DetectionResult(
+            threat_detected=self.keyword in content, component=self.keyword
+        )
+
+    async def a_check(self, content: str, **kwargs: Any) -> DetectionResult:
+        return self.check(content, **kwargs)
+
+    async def a_check_batch(
+        self, contents: Sequence[str], **kwargs: Any
+    ) -> list[DetectionResult]:
+        self.batches.append(list(contents))
+        return self.check_batch(contents, **kwargs)
+
+
+def _batcher(*detectors: BaseDetector, **kwargs: Any) -> MicroBatcher:
+    return MicroBatcher(Pipeline(list(detectors), timeout=math.inf), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_scans_share_one_batch_per_detector():
+    first = BatchRecordingDetector("bad")
+    second = BatchRecordingDetector("evil")
+    batcher = _batcher(first, second, max_delay=0.01)
+
+    results = await asyncio.gather(
+        batcher.scan("fine"), batcher.scan("bad text"), batcher.scan("evil text")
+    )
+
+    assert [r.threat_detected for r in results] == [False, True, True]
+    assert results[1].component == "bad"
+    assert results[2].component == "evil"
+    assert first.batches == [["fine", "bad text", "evil text"]]
+    # First threat wins: flagged documents are not sent to later detectors.
+    assert second.batches == [["fine", "evil text"]]
+    assert batcher.stats().batches == 1
+    assert batcher.stats().mean_batch_size == 3.0
+
+
+@pytest.mark.asyncio
+async def test_full_batches_dispatch_without_waiting():
+    detector = BatchRecordingDetector("bad")
+    batcher = _batcher(detector, max_batch_size=2, max_delay=60)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.scan(f"doc {i}") for i in range(4))), timeout=5
+    )
+
+    assert len(results) == 4
+    assert detector.batches == [["doc 0", "doc 1"], ["doc 2", "doc 3"]]
+
+
+@pytest.mark.asyncio
+async def test_detector_errors_reach_every_caller():
+    class FailingDetector(BatchRecordingDetector):
+        async def a_check_batch(
+            self, contents: Sequence[str], **kwargs: Any
+        ) -> list[DetectionResult]:
+            raise RuntimeError("boom")
+
+    batcher = _batcher(FailingDetector("bad"))
+    results = await asyncio.gather(
+        batcher.scan("a"), batcher.scan("b"), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_callers_are_skipped():
+    detector = BatchRecordingDetector("bad")
+    batcher = _batcher(detector, max_delay=60)
+
+    cancelled = asyncio.create_task(batcher.scan("gone"))
+    kept = asyncio.create_task(batcher.scan("kept"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+
+    await batcher.flush()
+
+    assert (await kept).safe
+    assert detector.batches == [["kept"]]
+
+
+def test_invalid_options_raise():
+    with pytest.raises(ConfigurationError):
+        _batcher(BatchRecordingDetector("bad"), max_batch_size=0)
+    with pytest.raises(ConfigurationError):
+        _batcher(BatchRecordingDetector("bad"), max_delay=-1)
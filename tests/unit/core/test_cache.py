@@ -0,0 +1,233 @@
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from deconvolute import CanaryDetector
+from deconvolute.core.cache import CachedDetector, ResultCache
+from deconvolute.core.orchestrator import a_scan, scan, scan_many
+from deconvolute.detectors.base import BaseDetector, DetectionResult
+from deconvolute.errors import ConfigurationError
+
+
+class CountingDetector(BaseDetector):
+    """Flags content containing 'bad' and counts how often it really ran."""
+
+    def __init__(self, fingerprint: str | None = "counting:v1"):
+        self._fingerprint = fingerprint
+        self.calls = 0
+
+    def fingerprint(self) -> str | None:
+        return self._fingerprint
+
+    def check(self, content: str, **kwargs: Any) -> DetectionResult:
+        self.calls += 1
+        return DetectionResult(
+            threat_detected="bad" in content,
+            component="Counting",
+            metadata={"kwargs": sorted(kwargs)},
+        )
+
+    async def a_check(self, content: str, **kwargs: Any) -> DetectionResult:
+        return self.check(content, **kwargs)
+
+
+def test_repeated_content_is_served_from_cache():
+    cache = ResultCache()
+    detector = CountingDetector()
+
+    first = cache.check(detector, "hello")
+    second = cache.check(detector, "hello")
+
+    assert detector.calls == 1
+    assert second is first
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_fingerprint_separates_detector_configurations():
+    cache = ResultCache()
+    v1, v2 = CountingDetector("counting:v1"), CountingDetector("counting:v2")
+
+    cache.check(v1, "hello")
+    cache.check(v2, "hello")
+
+    assert (v1.calls, v2.calls) == (1, 1)
+
+
+def test_kwargs_are_part_of_the_key():
+    cache = ResultCache()
+    detector = CountingDetector()
+
+    cache.check(detector, "hello", reference_text="en text")
+    cache.check(detector, "hello", reference_text="texte fr")
+    cache.check(detector, "hello", reference_text="en text")
+
+    assert detector.calls == 2
+
+
+def test_timeout_is_not_part_of_the_key():
+    cache = ResultCache()
+    detector = CountingDetector()
+
+    cache.check(detector, "hello", timeout=4.9)
+    cache.check(detector, "hello", timeout=1.2)
+
+    assert detector.calls == 1
+
+
+def test_uncacheable_detectors_always_run():
+    cache = ResultCache()
+    detector = CountingDetector(fingerprint=None)
+
+    cache.check(detector, "hello")
+    cache.check(detector, "hello")
+
+    assert detector.calls == 2
+    assert cache.stats().size == 0
+
+
+def test_canary_detector_is_never_cached():
+    canary = CanaryDetector()
+    _, token_a = canary.inject("sys")
+    _, token_b = canary.inject("sys")
+    cache = ResultCache()
+
+    assert canary.fingerprint() is None
+    assert cache.check(canary, f"ok {token_a}", token=token_a).safe
+    assert cache.check(canary, f"ok {token_a}", token=token_b).threat_detected
+
+
+def test_lru_eviction():
+    cache = ResultCache(max_size=2)
+    detector = CountingDetector()
+
+    cache.check(detector, "a")
+    cache.check(detector, "b")
+    cache.check(detector, "a")  # refresh 'a'
+    cache.check(detector, "c")  # evicts 'b'
+    cache.check(detector, "a")
+    cache.check(detector, "b")
+
+    assert detector.calls == 4
+    assert cache.stats().evictions == 2
+
+
+def test_ttl_expiry():
+    cache = ResultCache(ttl=10)
+    detector = CountingDetector()
+
+    with patch("deconvolute.core.cache.time.monotonic", return_value=100.0):
+        cache.check(detector, "a")
+    with patch("deconvolute.core.cache.time.monotonic", return_value=105.0):
+        cache.check(detector, "a")
+    with patch("deconvolute.core.cache.time.monotonic", return_value=111.0):
+        cache.check(detector, "a")
+
+    assert detector.calls == 2
+    assert cache.stats().expirations == 1
+
+
+def test_clear_keeps_counters():
+    cache = ResultCache()
+    detector = CountingDetector()
+    cache.check(detector, "a")
+
+    cache.clear()
+
+    assert cache.stats().size == 0
+    assert cache.stats().misses == 1
+
+
+@pytest.mark.parametrize("kwargs", [{"max_size": 0}, {"ttl": 0}, {"ttl": -1}])
+def test_invalid_configuration(kwargs):
+    with pytest.raises(ConfigurationError):
+        ResultCache(**kwargs)
+
+
+def test_check_batch_only_scans_misses():
+    cache = ResultCache()
+    detector = CountingDetector()
+    cache.check(detector, "seen")
+
+    results = cache.check_batch(detector, ["seen", "new bad", "new"])
+
+    assert detector.calls == 3  # 1 warmup + 2 misses
+    assert [r.threat_detected for r in results] == [False, True, False]
+
+
+def test_cached_detector_wraps_and_delegates():
+    canary = CanaryDetector()
+    wrapped = CachedDetector(canary)
+
+    # Capability checks used by proxies still see the wrapped methods
+    assert hasattr(wrapped, "inject")
+    assert wrapped.token_length == canary.token_length
+
+
+def test_cached_detector_caches_checks():
+    inner = CountingDetector()
+    detector = CachedDetector(inner, ResultCache())
+
+    detector.check("x")
+    detector.check("x")
+    detector.check_batch(["x", "y"])
+
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_detector_async():
+    inner = CountingDetector()
+    detector = CachedDetector(inner)
+
+    await detector.a_check("x")
+    await detector.a_check("x")
+    await detector.a_check_batch(["x", "z"])
+
+    assert inner.calls == 2
+
+
+def test_scan_uses_cache():
+    cache = ResultCache()
+    detector = CountingDetector()
+
+    scan("bad input", detectors=[detector], cache=cache)
+    result = scan("bad input", detectors=[detector], cache=cache)
+
+    assert result.threat_detected is True
+    assert detector.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_a_scan_uses_cache():
+    cache = ResultCache()
+    detector = CountingDetector()
+
+    await a_scan("text", detectors=[detector], cache=cache)
+    await a_scan("text", detectors=[detector], cache=cache, concurrent=True)
+
+    assert detector.calls == 1
+
+
+def test_bytes_and_text_share_cache_entries():
+    cache = ResultCache()
+    detector = CountingDetector()
+
+    scan("bad input", detectors=[detector], cache=cache)
+    result = scan(memoryview(b"bad input"), detectors=[detector], cache=cache)
+
+    assert result.threat_detected is True
+    assert detector.calls == 1
+
+
+def test_scan_many_uses_cache_across_batches():
+    cache = ResultCache()
+    detector = CountingDetector()
+
+    scan_many(["a", "b"], detectors=[detector], cache=cache)
+    batch = scan_many(["a", "b", "bad"], detectors=[detector], cache=cache)
+
+    assert detector.calls == 3
+    assert [r.threat_detected for r in batch.results] == [False, False, True]
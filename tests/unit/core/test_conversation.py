@@ -0,0 +1,212 @@
+import math
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from deconvolute import ConversationScanner, Pipeline
+from deconvolute.detectors.base import BaseDetector, DetectionResult
+from deconvolute.detectors.content.signature.engine import SignatureDetector
+from deconvolute.errors import ConfigurationError
+
+
+class RecordingDetector(BaseDetector):
+    """Flags content containing 'attack' and records everything it checks."""
+
+    def __init__(self) -> None:
+        self.seen: list[str] = []
+
+    def check(self, content: str, **kwargs: Any) -> DetectionResult:
+        self.seen.append(content)
+        return DetectionResult(
+            threat_detected="attack" in content, component="Recording"
+        )
+
+    async def a_check(self, content: str, **kwargs: Any) -> DetectionResult:
+        return self.check(content, **kwargs)
+
+
+def _scanner(detector: BaseDetector, **kwargs: Any) -> ConversationScanner:
+    return ConversationScanner(Pipeline([detector], timeout=math.inf), **kwargs)
+
+
+def _turns(*texts: str) -> list[dict[str, str]]:
+    return [{"role": "system", "content": "Be helpful."}] + [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": t}
+        for i, t in enumerate(texts)
+    ]
+
+
+def test_only_new_messages_are_scanned():
+    detector = RecordingDetector()
+    conversations = _scanner(detector)
+
+    conversations.scan(_turns("hi"), session_id="s1")
+    conversations.scan(_turns("hi", "hello", "how are you"), session_id="s1")
+
+    assert detector.seen == ["Be helpful.", "hi", "hello", "how are you"]
+    stats = conversations.stats()
+    assert (stats.scanned, stats.skipped, stats.sessions) == (4, 2, 1)
+    assert stats.skip_rate == pytest.approx(2 / 6)
+
+
+def test_modified_messages_are_scanned_again():
+    detector = RecordingDetector()
+    conversations = _scanner(detector)
+
+    conversations.scan(_turns("hi"), session_id="s1")
+    conversations.scan(_turns("hi, edited"), session_id="s1")
+
+    assert detector.seen[-1] == "hi, edited"
+
+
+def test_messages_are_scanned_again_after_a_rules_reload(tmp_path):
+    rule_file = tmp_path / "rules.yar"
+    rule_file.write_text('rule Old { strings: $a = "alpha" condition: $a }')
+    detector = SignatureDetector(rules_path=rule_file)
+    conversations = _scanner(detector)
+
+    assert not conversations.scan(_turns("beta"), session_id="s1").threat_detected
+
+    rule_file.write_text('rule New { strings: $a = "beta" condition: $a }')
+    assert detector.reload() is True
+    result = conversations.scan(_turns("beta", "ok"), session_id="s1")
+
+    assert result.threat_detected is True
+    assert result.metadata["message_index"] == 1
+    assert conversations.stats().skipped == 0
+
+
+def test_flagged_messages_are_reported_and_not_remembered():
+    detector = RecordingDetector()
+    conversations = _scanner(detector)
+    messages = _turns("hi", "sure", "an attack")
+
+    first = conversations.scan(messages, session_id="s1")
+    second = conversations.scan(messages, session_id="s1")
+
+    assert first.threat_detected is True
+    assert first.metadata["message_index"] == 3
+    assert second.threat_detected is True
+    assert detector.seen.count("an attack") == 2
+
+
+def test_session_is_derived_from_the_first_non_system_message():
+    detector = RecordingDetector()
+    conversations = _scanner(detector)
+
+    conversations.scan(_turns("first chat"))
+    conversations.scan(_turns("first chat", "reply"))
+    conversations.scan(_turns("second chat"))
+
+    assert conversations.stats().sessions == 2
+    assert detector.seen.count("Be helpful.") == 2
+
+
+def test_message_formats():
+    detector = RecordingDetector()
+    conversations = _scanner(detector)
+
+    class Message:
+        role = "assistant"
+        content = "from an object"
+
+    conversations.scan(
+        [
+            "plain text",
+            {"role": "user", "content": [{"type": "text", "text": "a part"}]},
+            {"role": "assistant", "content": None, "tool_calls": []},
+            Message(),
+        ],
+        session_id="s1",
+    )
+
+    assert detector.seen == ["plain text", "a part", "from an object"]
+
+
+def test_message_memory_is_bounded_per_session():
+    detector = RecordingDetector()
+    conversations = _scanner(detector, max_messages=2)
+
+    conversations.scan(["a", "b", "c"], session_id="s1")
+    conversations.scan(["a", "b", "c"], session_id="s1")
+
+    # Only the two most recent fingerprints were kept.
+    assert detector.seen == ["a", "b", "c", "a"]
+
+
+def test_least_recently_used_session_is_evicted():
+    conversations = _scanner(RecordingDetector(), max_sessions=2)
+
+    for session_id in ["s1", "s2", "s3"]:
+        conversations.scan(["hi"], session_id=session_id)
+
+    stats = conversations.stats()
+    assert (stats.sessions, stats.evictions) == (2, 1)
+
+
+def test_idle_sessions_expire():
+    conversations = _scanner(RecordingDetector(), idle_ttl=10.0)
+
+    with patch("deconvolute.core.conversation.time.monotonic", return_value=100.0):
+        conversations.scan(["hi"], session_id="old")
+    with patch("deconvolute.core.conversation.time.monotonic", return_value=111.0):
+        conversations.scan(["hi"], session_id="new")
+
+    stats = conversations.stats()
+    assert (stats.sessions, stats.expirations) == (1, 1)
+
+
+def test_forget_and_clear():
+    detector = RecordingDetector()
+    conversations = _scanner(detector)
+    conversations.scan(["hi"], session_id="s1")
+    conversations.scan(["hi"], session_id="s2")
+
+    conversations.forget("s1")
+    conversations.scan(["hi"], session_id="s1")
+    assert detector.seen == ["hi", "hi", "hi"]
+
+    conversations.clear()
+    assert conversations.stats().sessions == 0
+
+
+def test_unscanned_messages_are_not_remembered(monkeypatch):
+    detector = RecordingDetector()
+    conversations = _scanner(detector)
+    timed_out = DetectionResult(
+        threat_detected=False, component="Scanner", metadata={"reason": "timeout"}
+    )
+
+    monkeypatch.setattr(
+        conversations.pipeline,
+        "scan_chunk",
+        lambda chunk: [timed_out] * len(chunk),
+    )
+    result = conversations.scan(["hi"], session_id="s1")
+    monkeypatch.undo()
+    conversations.scan(["hi"], session_id="s1")
+
+    assert result.metadata["reason"] == "timeout"
+    assert detector.seen == ["hi"]
+
+
+@pytest.mark.asyncio
+async def test_a_scan_skips_verified_messages():
+    detector = RecordingDetector()
+    conversations = _scanner(detector)
+
+    await conversations.a_scan(_turns("hi"), session_id="s1")
+    result = await conversations.a_scan(_turns("hi", "ok", "attack"), "s1")
+
+    assert result.threat_detected is True
+    assert detector.seen == ["Be helpful.", "hi", "ok", "attack"]
+
+
+def test_rejects_invalid_options():
+    with pytest.raises(ConfigurationError):
+        _scanner(RecordingDetector(), max_sessions=0)
+    with pytest.raises(ConfigurationError):
+        _scanner(RecordingDetector(), max_messages=0)
+    with pytest.raises(ConfigurationError):
+        _scanner(RecordingDetector(), idle_ttl=0)
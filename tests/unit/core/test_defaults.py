@@ -1,9 +1,18 @@
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from types import ModuleType
 from typing import cast
 from unittest.mock import MagicMock, patch
 
-from deconvolute.core.defaults import get_guard_defaults, get_scan_defaults
+import pytest
+
+from deconvolute.core.defaults import (
+    get_default_suite,
+    get_guard_defaults,
+    get_scan_defaults,
+    invalidate_default_suites,
+)
 from deconvolute.detectors.content.language.engine import LanguageDetector
 from deconvolute.detectors.content.signature.engine import SignatureDetector
 from deconvolute.detectors.integrity.canary.engine import CanaryDetector
@@ -68,3 +77,81 @@ def test_get_scan_defaults_returns_scanning_suite():
     assert any(isinstance(d, SignatureDetector) for d in detectors)
     assert not any(isinstance(d, LanguageDetector) for d in detectors)
     assert not any(isinstance(d, CanaryDetector) for d in detectors)
+
+
+@pytest.fixture
+def clean_registry():
+    """Ensures each test starts and ends with an empty suite registry."""
+    invalidate_default_suites()
+    yield
+    invalidate_default_suites()
+
+
+def test_default_suite_is_built_once(clean_registry):
+    with patch("deconvolute.core.defaults.get_scan_defaults") as factory:
+        factory.side_effect = lambda rules_path=None: [MagicMock()]
+
+        first = get_default_suite("scan")
+        second = get_default_suite("scan")
+
+        factory.assert_called_once()
+        assert first[0] is second[0]
+        # Callers get their own list, never the registry's
+        assert first is not second
+
+
+def test_default_suite_keys_are_independent(clean_registry):
+    with patch("deconvolute.core.defaults.get_scan_defaults") as factory:
+        factory.side_effect = lambda rules_path=None: [MagicMock()]
+
+        default = get_default_suite("scan")
+        keyed = get_default_suite("scan", api_key="sk-123")
+
+        assert factory.call_count == 2
+        assert default[0] is not keyed[0]
+
+
+def test_default_suite_passes_resolved_rules_path(clean_registry, tmp_path):
+    with patch("deconvolute.core.defaults.get_scan_defaults") as factory:
+        factory.return_value = []
+
+        get_default_suite("scan", rules_path=tmp_path)
+
+        assert factory.call_args.kwargs["rules_path"] == str(tmp_path.resolve())
+
+
+def test_default_suite_guard_kind(clean_registry):
+    with patch("deconvolute.core.defaults.get_guard_defaults") as factory:
+        factory.return_value = [MagicMock(), MagicMock()]
+
+        suite = get_default_suite("guard")
+
+        factory.assert_called_once()
+        assert len(suite) == 2
+
+
+def test_invalidate_default_suites_forces_rebuild(clean_registry):
+    with patch("deconvolute.core.defaults.get_scan_defaults") as factory:
+        factory.side_effect = lambda rules_path=None: [MagicMock()]
+
+        first = get_default_suite("scan")
+        invalidate_default_suites()
+        second = get_default_suite("scan")
+
+        assert factory.call_count == 2
+        assert first[0] is not second[0]
+
+
+def test_default_suite_concurrent_callers_share_one_build(clean_registry):
+    def slow_factory(rules_path=None):
+        time.sleep(0.05)
+        return [MagicMock()]
+
+    with patch(
+        "deconvolute.core.defaults.get_scan_defaults", side_effect=slow_factory
+    ) as factory:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            suites = list(pool.map(lambda _: get_default_suite("scan"), range(8)))
+
+        factory.assert_called_once()
+        assert all(s[0] is suites[0][0] for s in suites)
@@ -0,0 +1,157 @@
+import asyncio
+import math
+import threading
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from deconvolute import Pipeline
+from deconvolute.detectors.base import BaseDetector, DetectionResult
+from deconvolute.errors import ConfigurationError
+from deconvolute.utils.executor import (
+    DetectorExecutor,
+    current_executor,
+    executor_scope,
+    get_default_executor,
+)
+
+
+class ThreadRecordingDetector(BaseDetector):
+    """Records the name of the thread each blocking check runs on."""
+
+    def __init__(self, executor: DetectorExecutor | None = None):
+        self.executor = executor
+        self.threads: list[str] = []
+        self.closed = False
+
+    def check(self, content: str, **kwargs: Any) -> DetectionResult:
+        self.threads.append(threading.current_thread().name)
+        return DetectionResult(threat_detected=False, component="Recorder")
+
+    async def a_check(self, content: str, **kwargs: Any) -> DetectionResult:
+        return await self._run_in_executor(lambda: self.check(content, **kwargs))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_executor_rejects_invalid_worker_counts(monkeypatch):
+    with pytest.raises(ConfigurationError):
+        DetectorExecutor(max_workers=0)
+
+    monkeypatch.setenv("DECONVOLUTE_EXECUTOR_WORKERS", "many")
+    with pytest.raises(ConfigurationError):
+        DetectorExecutor()
+
+    monkeypatch.setenv("DECONVOLUTE_EXECUTOR_WORKERS", "3")
+    executor = DetectorExecutor()
+    assert executor.max_workers == 3
+    executor.shutdown()
+
+
+def test_executor_stats_track_queue_depth_and_active_workers():
+    executor = DetectorExecutor(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def block() -> None:
+        started.set()
+        release.wait(timeout=5)
+
+    first = executor.submit(block)
+    second = executor.submit(block)
+    assert started.wait(timeout=5)
+
+    stats = executor.stats()
+    assert stats.active == 1
+    assert stats.queued == 1
+    assert stats.completed == 0
+
+    release.set()
+    first.result(timeout=5)
+    second.result(timeout=5)
+    executor.shutdown()
+
+    stats = executor.stats()
+    assert (stats.active, stats.queued, stats.completed) == (0, 0, 2)
+
+
+def test_cancelled_tasks_leave_the_queue():
+    executor = DetectorExecutor(max_workers=1)
+    release = threading.Event()
+    executor.submit(release.wait, 5)
+    pending = executor.submit(lambda: None)
+
+    assert pending.cancel()
+    assert executor.stats().queued == 0
+
+    release.set()
+    executor.shutdown()
+
+
+def test_rejected_submissions_do_not_count_as_queued():
+    executor = DetectorExecutor(max_workers=1)
+    executor.shutdown()
+
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+
+    assert executor.stats().queued == 0
+
+
+def test_executor_scope_is_restored():
+    executor = DetectorExecutor(max_workers=1)
+    with executor_scope(executor):
+        assert current_executor() is executor
+    assert current_executor() is get_default_executor()
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_detectors_share_the_default_executor():
+    detectors = [ThreadRecordingDetector(), ThreadRecordingDetector()]
+    await asyncio.gather(*(d.a_check("text") for d in detectors))
+
+    default = get_default_executor()
+    assert default.stats().completed >= 2
+    for detector in detectors:
+        assert detector.threads[0].startswith("deconvolute")
+
+
+@pytest.mark.asyncio
+async def test_detector_executor_takes_precedence_over_pipeline():
+    own = DetectorExecutor(max_workers=1, thread_name_prefix="own")
+    scoped = DetectorExecutor(max_workers=1, thread_name_prefix="scoped")
+    pinned = ThreadRecordingDetector(executor=own)
+    routed = ThreadRecordingDetector()
+
+    pipeline = Pipeline([pinned, routed], executor=scoped, timeout=math.inf)
+    await pipeline.a_scan("text")
+
+    assert pinned.threads[0].startswith("own")
+    assert routed.threads[0].startswith("scoped")
+    # The detector is routed per call, not modified.
+    assert routed.executor is None
+
+    own.shutdown()
+    scoped.shutdown()
+
+
+def test_pipeline_leaves_detectors_open():
+    detector = ThreadRecordingDetector()
+    with Pipeline([detector]):
+        pass
+    assert not detector.closed
+
+    shared = ThreadRecordingDetector()
+    with patch("deconvolute.core.pipeline.get_default_suite", return_value=[shared]):
+        with Pipeline():
+            pass
+    assert not shared.closed
+
+
+def test_detector_context_manager_closes():
+    with ThreadRecordingDetector() as detector:
+        assert not detector.closed
+    assert detector.closed
@@ -0,0 +1,131 @@
+import asyncio
+import math
+from typing import Any
+
+import pytest
+
+from deconvolute import ConcurrencyLimiter, Pipeline, a_scan
+from deconvolute.detectors.base import BaseDetector, DetectionResult
+from deconvolute.errors import ConfigurationError
+
+
+class GatedDetector(BaseDetector):
+    """Blocks each check until the test opens the gate."""
+
+    def __init__(self) -> None:
+        self.gate = asyncio.Event()
+        self.running = 0
+        self.peak = 0
+
+    def check(self, content: str, **kwargs: Any) -> DetectionResult:
+        return DetectionResult(threat_detected=False, component="GatedDetector")
+
+    async def a_check(self, content: str, **kwargs: Any) -> DetectionResult:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await self.gate.wait()
+        finally:
+            self.running -= 1
+        return self.check(content)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_limiter_bounds_concurrent_scans_and_reports_queue_depth():
+    detector = GatedDetector()
+    limiter = ConcurrencyLimiter(max_concurrency=2)
+
+    tasks = [
+        asyncio.create_task(
+            a_scan("text", detectors=[detector], timeout=math.inf, limiter=limiter)
+        )
+        for _ in range(5)
+    ]
+    await _settle()
+
+    stats = limiter.stats()
+    assert (stats.active, stats.queued) == (2, 3)
+
+    detector.gate.set()
+    results = await asyncio.gather(*tasks)
+
+    assert all(r.safe for r in results)
+    assert detector.peak == 2
+    stats = limiter.stats()
+    assert (stats.active, stats.queued, stats.admitted) == (0, 0, 5)
+    assert stats.max_wait_ms > 0
+
+
+@pytest.mark.parametrize("policy", ["fail_open", "fail_closed"])
+@pytest.mark.asyncio
+async def test_full_queue_sheds_with_policy(policy):
+    detector = GatedDetector()
+    limiter = ConcurrencyLimiter(max_concurrency=1, max_queue=1, on_overload=policy)
+    pipeline = Pipeline([detector], timeout=math.inf, limiter=limiter)
+
+    running = asyncio.create_task(pipeline.a_scan("a"))
+    queued = asyncio.create_task(pipeline.a_scan("b"))
+    await _settle()
+
+    shed = await pipeline.a_scan("c")
+    assert shed.threat_detected is (policy == "fail_closed")
+    assert shed.metadata["reason"] == "overload"
+    assert limiter.stats().shed == 1
+
+    detector.gate.set()
+    assert (await running).safe and (await queued).safe
+
+
+@pytest.mark.asyncio
+async def test_queue_time_counts_against_the_timeout():
+    detector = GatedDetector()
+    limiter = ConcurrencyLimiter(max_concurrency=1)
+
+    blocker = asyncio.create_task(
+        a_scan("a", detectors=[detector], timeout=math.inf, limiter=limiter)
+    )
+    await _settle()
+
+    result = await a_scan("b", detectors=[detector], timeout=0.05, limiter=limiter)
+
+    assert result.threat_detected is True
+    assert result.metadata["reason"] == "timeout"
+    assert result.metadata["timed_out"] == ["GatedDetector"]
+    assert limiter.stats().timed_out == 1
+    assert limiter.stats().queued == 0
+
+    detector.gate.set()
+    await blocker
+    assert limiter.stats().active == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    detector = GatedDetector()
+    limiter = ConcurrencyLimiter(max_concurrency=1)
+    pipeline = Pipeline([detector], timeout=math.inf, limiter=limiter)
+
+    first = asyncio.create_task(pipeline.a_scan("a"))
+    second = asyncio.create_task(pipeline.a_scan("b"))
+    await _settle()
+    second.cancel()
+    await asyncio.gather(second, return_exceptions=True)
+
+    detector.gate.set()
+    await first
+    assert (await pipeline.a_scan("c")).safe
+    assert limiter.stats().active == 0
+
+
+def test_invalid_options_raise():
+    with pytest.raises(ConfigurationError):
+        ConcurrencyLimiter(max_concurrency=0)
+    with pytest.raises(ConfigurationError):
+        ConcurrencyLimiter(max_concurrency=1, on_overload="drop")  # type: ignore[arg-type]
+    with pytest.raises(ConfigurationError, match="shedding policy"):
+        ConcurrencyLimiter(max_concurrency=1, max_queue=10)
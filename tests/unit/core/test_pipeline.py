@@ -0,0 +1,137 @@
+import math
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from deconvolute import Pipeline, ResultCache
+from deconvolute.detectors.base import BaseDetector, DetectionResult
+from deconvolute.errors import ConfigurationError
+
+
+class KeywordDetector(BaseDetector):
+    """Flags any content containing its keyword and records call kwargs."""
+
+    def __init__(self, keyword: str):
+        self.keyword = keyword
+        self.api_key: str | None = None
+        self.calls: list[dict[str, Any]] = []
+
+    def fingerprint(self) -> str | None:
+        return f"keyword:{self.keyword}"
+
+    def check(self, content: str, **kwargs: Any) -> DetectionResult:
+        self.calls.append(kwargs)
+        return DetectionResult(
+            threat_detected=self.keyword in content, component="KeywordDetector"
+        )
+
+    async def a_check(self, content: str, **kwargs: Any) -> DetectionResult:
+        return self.check(content, **kwargs)
+
+
+class Injector(KeywordDetector):
+    def inject(self, content: str) -> tuple[str, str]:
+        return content, "token"
+
+
+def test_pipeline_resolves_configuration_once(monkeypatch):
+    monkeypatch.setenv("DECONVOLUTE_API_KEY", "env-key")
+    detector = KeywordDetector("bad")
+
+    pipeline = Pipeline([detector])
+    assert detector.api_key == "env-key"
+
+    with patch("deconvolute.core.configuration.os.getenv") as getenv:
+        pipeline.scan("fine")
+        pipeline.scan("bad")
+    getenv.assert_not_called()
+
+
+def test_pipeline_sorts_capabilities():
+    scanner = KeywordDetector("bad")
+    injector = Injector("bad")
+
+    pipeline = Pipeline([scanner, injector])
+
+    assert pipeline.scanners == (scanner, injector)
+    assert pipeline.injectors == (injector,)
+
+
+def test_pipeline_uses_shared_default_suite():
+    with patch("deconvolute.core.pipeline.get_default_suite") as suite:
+        suite.return_value = [KeywordDetector("bad")]
+        pipeline = Pipeline()
+
+    assert suite.call_args.args[0] == "scan"
+    assert pipeline.scan("bad").threat_detected is True
+
+
+def test_pipeline_scan_matches_module_semantics():
+    pipeline = Pipeline([KeywordDetector("bad")])
+
+    assert pipeline.scan("fine").component == "Scanner"
+    assert pipeline.scan("bad").component == "KeywordDetector"
+    assert [r.threat_detected for r in pipeline.scan_many(["bad", "ok"]).results] == [
+        True,
+        False,
+    ]
+    assert pipeline.scan_report("bad").threat_detected is True
+    assert [r.threat_detected for r in pipeline.scan_chunk(["ok", "bad"])] == [
+        False,
+        True,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_async_methods():
+    pipeline = Pipeline([KeywordDetector("bad"), KeywordDetector("worse")])
+
+    assert (await pipeline.a_scan("bad")).threat_detected is True
+    assert (await pipeline.a_scan("worse", concurrent=True)).threat_detected is True
+    batch = await pipeline.a_scan_many(["ok", "bad"])
+    assert [r.threat_detected for r in batch.results] == [False, True]
+    report = await pipeline.a_scan_report("bad worse")
+    assert len(report.threats) == 2
+    chunk = await pipeline.a_scan_chunk(["worse", "ok"])
+    assert [r.component for r in chunk] == ["KeywordDetector", "Scanner"]
+
+
+def test_pipeline_freezes_timeout(monkeypatch):
+    monkeypatch.setenv("DECONVOLUTE_TIMEOUT_SEC", "3")
+    detector = KeywordDetector("bad")
+    pipeline = Pipeline([detector])
+    monkeypatch.setenv("DECONVOLUTE_TIMEOUT_SEC", "60")
+
+    pipeline.scan("x")
+
+    assert pipeline.timeout == 3.0
+    assert detector.calls[0]["timeout"] <= 3.0
+
+
+def test_pipeline_shares_cache():
+    cache = ResultCache()
+    detector = KeywordDetector("bad")
+    pipeline = Pipeline([detector], cache=cache)
+
+    pipeline.scan("same")
+    pipeline.scan("same")
+
+    assert len(detector.calls) == 1
+
+
+def test_pipeline_rejects_invalid_policy():
+    with pytest.raises(ConfigurationError):
+        Pipeline([], on_timeout="later")  # type: ignore[arg-type]
+
+
+def test_pipeline_guard_keeps_unbounded_timeout():
+    client = MagicMock()
+    client.__class__.__name__ = "OpenAI"
+    client.__class__.__module__ = "openai"
+    pipeline = Pipeline([KeywordDetector("bad")], timeout=math.inf)
+
+    proxy = pipeline.guard(client)
+
+    assert proxy._timeout is None
+    assert proxy._scanners == list(pipeline.scanners)
@@ -0,0 +1,131 @@
+from typing import Any
+
+import pytest
+
+from deconvolute import CanaryDetector, LanguageDetector, SignatureDetector
+from deconvolute.core.process import ProcessPoolEngine
+from deconvolute.detectors.base import BaseDetector, DetectionResult, DetectorSpec
+from deconvolute.errors import ConfigurationError
+
+RULE = """
+rule ProcessPoolRule {
+    strings:
+        $a = "forbidden_phrase"
+    condition:
+        $a
+}
+"""
+
+
+class LocalOnlyDetector(BaseDetector):
+    """A custom detector that does not describe itself as a spec."""
+
+    def check(self, content: str, **kwargs: Any) -> DetectionResult:
+        return DetectionResult(threat_detected=False, component="LocalOnly")
+
+    async def a_check(self, content: str, **kwargs: Any) -> DetectionResult:
+        return self.check(content)
+
+
+@pytest.fixture(scope="module")
+def rules_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp("rules") / "pool.yar"
+    path.write_text(RULE)
+    return path
+
+
+@pytest.fixture(scope="module")
+def engine(rules_file):
+    with ProcessPoolEngine(
+        [SignatureDetector(rules_path=rules_file)], max_workers=2, chunk_size=3
+    ) as engine:
+        yield engine
+
+
+def test_scan_many_matches_in_process_results(engine, rules_file):
+    docs = [
+        f"doc {i} forbidden_phrase" if i % 4 == 0 else f"doc {i}" for i in range(25)
+    ]
+    local = SignatureDetector(rules_path=rules_file)
+
+    batch = engine.scan_many(docs)
+
+    assert [r.threat_detected for r in batch.results] == [
+        local.check(d).threat_detected for d in docs
+    ]
+    assert batch.results[0].metadata["matches"] == ["ProcessPoolRule"]
+
+
+def test_scan_many_sends_duplicates_once(engine):
+    docs = ["a forbidden_phrase", "clean"] * 5
+
+    batch = engine.scan_many(docs)
+
+    assert batch.duplicates == 8
+    assert [r.threat_detected for r in batch.results] == [True, False] * 5
+
+
+def test_scan_single_document(engine):
+    assert engine.scan("a forbidden_phrase here").threat_detected is True
+    assert engine.scan("harmless").component == "Scanner"
+
+
+@pytest.mark.asyncio
+async def test_async_scanning(engine):
+    result = await engine.a_scan("forbidden_phrase")
+    batch = await engine.a_scan_many(["ok", "forbidden_phrase", "ok"])
+
+    assert result.threat_detected is True
+    assert [r.threat_detected for r in batch.results] == [False, True, False]
+
+
+def test_scan_files_reports_each_file_in_order(engine, tmp_path):
+    paths = []
+    for i, text in enumerate(["clean", "has forbidden_phrase", "also clean"]):
+        path = tmp_path / f"doc{i}.txt"
+        path.write_text(text)
+        paths.append(str(path))
+    paths.append(str(tmp_path / "missing.txt"))
+
+    reports = list(engine.scan_files(paths))
+
+    assert [r.path for r in reports] == paths
+    assert [r.threat_detected for r in reports] == [False, True, False, False]
+    assert reports[1].size_bytes == len("has forbidden_phrase")
+    assert "SignatureDetector" in reports[0].detector_ms
+    assert reports[3].error is not None and "FileNotFoundError" in reports[3].error
+
+
+def test_engine_rejects_detectors_without_spec():
+    with pytest.raises(ConfigurationError, match="DetectorSpec"):
+        ProcessPoolEngine([LocalOnlyDetector()], max_workers=1)
+
+
+def test_engine_rejects_invalid_chunk_size():
+    with pytest.raises(ConfigurationError):
+        ProcessPoolEngine([], max_workers=1, chunk_size=0)
+
+
+def test_builtin_detectors_round_trip_through_specs(rules_file, mocker):
+    signature = SignatureDetector(rules_path=rules_file)
+    rebuilt = signature.to_spec().build()
+    assert isinstance(rebuilt, SignatureDetector)
+    assert rebuilt.fingerprint() == signature.fingerprint()
+
+    canary = CanaryDetector(token_length=24).to_spec().build()
+    assert isinstance(canary, CanaryDetector)
+    assert canary.token_length == 24
+
+    mocker.patch(
+        "deconvolute.detectors.content.language.engine.LanguageDetectorBuilder"
+    )
+    language = LanguageDetector(allowed_languages=["de"])
+    assert language.to_spec().build().fingerprint() == language.fingerprint()
+
+
+def test_spec_build_errors():
+    with pytest.raises(ConfigurationError, match="Cannot import"):
+        DetectorSpec(target="deconvolute.nope.Missing").build()
+
+    with pytest.raises(ConfigurationError, match="not a BaseDetector"):
+        DetectorSpec(target="deconvolute.errors.DeconvoluteError").build()
@@ -0,0 +1,178 @@
+import gc
+import weakref
+from typing import Any
+
+import pytest
+
+from deconvolute.core.orchestrator import a_scan, scan, scan_many
+from deconvolute.core.scheduler import AdaptiveScheduler
+from deconvolute.detectors.base import BaseDetector, DetectionResult
+from deconvolute.errors import ConfigurationError
+
+
+class RecordingDetector(BaseDetector):
+    """Flags content containing `keyword` and logs the order of calls."""
+
+    def __init__(self, keyword: str, log: list[str], name: str):
+        self.keyword = keyword
+        self.log = log
+        self.name = name
+
+    def check(self, content: str, **kwargs: Any) -> DetectionResult:
+        self.log.append(self.name)
+        return DetectionResult(
+            threat_detected=self.keyword in content, component=self.name
+        )
+
+    async def a_check(self, content: str, **kwargs: Any) -> DetectionResult:
+        return self.check(content, **kwargs)
+
+
+def _train(
+    scheduler: AdaptiveScheduler,
+    detector: BaseDetector,
+    latency_sec: float,
+    hit_rate: float,
+    n: int = 100,
+) -> None:
+    threats = round(hit_rate * n)
+    scheduler.record(detector, latency_sec * n, threats=threats, documents=n)
+
+
+def test_order_keeps_caller_order_during_warmup():
+    scheduler = AdaptiveScheduler(warmup=10)
+    a, b = RecordingDetector("x", [], "A"), RecordingDetector("y", [], "B")
+    scheduler.record(b, 0.001, threats=1)
+
+    assert scheduler.order([a, b]) == [a, b]
+
+
+def test_order_puts_unmeasured_detectors_first():
+    scheduler = AdaptiveScheduler(warmup=5)
+    a, b = RecordingDetector("x", [], "A"), RecordingDetector("y", [], "B")
+    _train(scheduler, a, latency_sec=0.001, hit_rate=0.9)
+
+    # B has never run (e.g. A flags everything), so it gets explored first.
+    assert scheduler.order([a, b]) == [b, a]
+
+
+def test_order_prefers_cheap_detectors_with_high_hit_rate():
+    scheduler = AdaptiveScheduler(warmup=5)
+    heavy = RecordingDetector("x", [], "Heavy")
+    cheap = RecordingDetector("y", [], "Cheap")
+    _train(scheduler, heavy, latency_sec=0.050, hit_rate=0.2)
+    _train(scheduler, cheap, latency_sec=0.001, hit_rate=0.8)
+
+    assert scheduler.order([heavy, cheap]) == [cheap, heavy]
+
+
+def test_order_ranks_silent_detectors_by_latency():
+    scheduler = AdaptiveScheduler(warmup=5)
+    slow = RecordingDetector("x", [], "Slow")
+    fast = RecordingDetector("y", [], "Fast")
+    _train(scheduler, slow, latency_sec=0.010, hit_rate=0.0)
+    _train(scheduler, fast, latency_sec=0.001, hit_rate=0.0)
+
+    assert scheduler.order([slow, fast]) == [fast, slow]
+
+
+def test_record_decays_old_observations():
+    scheduler = AdaptiveScheduler(decay=0.5, warmup=0)
+    detector = RecordingDetector("x", [], "A")
+
+    scheduler.record(detector, 0.010, threats=1)
+    scheduler.record(detector, 0.002, threats=0)
+
+    stats = scheduler.stats()[0]
+    assert stats.calls == 2
+    assert stats.threats == 1
+    assert stats.latency_ms == pytest.approx(6.0)
+    assert stats.hit_rate == pytest.approx(0.5)
+
+
+def test_stats_positions_follow_learned_order():
+    scheduler = AdaptiveScheduler(warmup=1)
+    heavy = RecordingDetector("x", [], "Heavy")
+    cheap = RecordingDetector("y", [], "Cheap")
+    _train(scheduler, heavy, latency_sec=0.050, hit_rate=0.5)
+    _train(scheduler, cheap, latency_sec=0.001, hit_rate=0.5)
+
+    stats = scheduler.stats()
+
+    assert [s.component for s in stats] == ["RecordingDetector"] * 2
+    assert [s.position for s in stats] == [0, 1]
+    assert stats[0].latency_ms < stats[1].latency_ms
+
+
+def test_reset_forgets_observations():
+    scheduler = AdaptiveScheduler()
+    detector = RecordingDetector("x", [], "A")
+    scheduler.record(detector, 0.01, threats=0)
+    assert len(scheduler.stats()) == 1
+
+    scheduler.reset()
+
+    assert scheduler.stats() == []
+
+
+def test_dropped_detectors_are_forgotten():
+    scheduler = AdaptiveScheduler()
+    kept = RecordingDetector("x", [], "Kept")
+    dropped = RecordingDetector("x", [], "Dropped")
+    scheduler.record(kept, 0.01, threats=0)
+    scheduler.record(dropped, 0.01, threats=0)
+    ref = weakref.ref(dropped)
+
+    del dropped
+    gc.collect()
+
+    assert ref() is None
+    assert len(scheduler.stats()) == 1
+
+
+@pytest.mark.parametrize("kwargs", [{"decay": 0.0}, {"decay": 1.5}, {"warmup": -1}])
+def test_invalid_configuration(kwargs):
+    with pytest.raises(ConfigurationError):
+        AdaptiveScheduler(**kwargs)
+
+
+def test_scan_runs_detectors_in_learned_order():
+    log: list[str] = []
+    heavy = RecordingDetector("attack", log, "Heavy")
+    cheap = RecordingDetector("attack", log, "Cheap")
+    scheduler = AdaptiveScheduler(warmup=5)
+    _train(scheduler, heavy, latency_sec=0.050, hit_rate=0.5)
+    _train(scheduler, cheap, latency_sec=0.001, hit_rate=0.5)
+
+    result = scan("attack", detectors=[heavy, cheap], scheduler=scheduler)
+
+    assert result.component == "Cheap"
+    assert log == ["Cheap"]
+    assert scheduler.stats()[0].calls == 101
+
+
+@pytest.mark.asyncio
+async def test_a_scan_feeds_scheduler():
+    scheduler = AdaptiveScheduler()
+    detector = RecordingDetector("attack", [], "A")
+
+    await a_scan("an attack", detectors=[detector], scheduler=scheduler)
+
+    assert scheduler.stats()[0].threats == 1
+
+
+def test_scan_many_feeds_scheduler_per_document():
+    scheduler = AdaptiveScheduler()
+    detector = RecordingDetector("bad", [], "A")
+
+    scan_many(
+        ["bad 1", "ok 1", "ok 2", "bad 2"],
+        detectors=[detector],
+        chunk_size=2,
+        concurrency=1,
+        scheduler=scheduler,
+    )
+
+    stats = scheduler.stats()[0]
+    assert stats.calls == 4
+    assert stats.threats == 2
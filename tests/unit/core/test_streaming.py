@@ -0,0 +1,94 @@
+from collections.abc import AsyncIterator
+
+import pytest
+
+from deconvolute.core.streaming import aiter_windows, iter_file_text, iter_windows
+from deconvolute.errors import ConfigurationError
+
+
+def _split(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def test_windows_cover_every_substring_of_overlap_plus_one():
+    text = "".join(chr(ord("a") + i % 26) for i in range(500))
+    window_size, overlap = 40, 9
+
+    windows = list(iter_windows(_split(text, 7), window_size, overlap))
+
+    for start in range(len(text) - overlap):
+        needle = text[start : start + overlap + 1]
+        assert any(needle in w for _, w in windows), f"missed substring at {start}"
+
+
+def test_windows_report_stream_offsets():
+    text = "0123456789" * 10
+
+    for offset, window in iter_windows(_split(text, 3), 25, 5):
+        assert text[offset : offset + len(window)] == window
+
+
+def test_windows_are_bounded():
+    windows = list(iter_windows(["x" * 1000], 100, 10))
+
+    assert all(len(w) <= 100 for _, w in windows)
+    assert windows[0][0] == 0
+    assert windows[1][0] == 90
+
+
+def test_short_stream_yields_single_window():
+    assert list(iter_windows(["ab", "cd"], 100, 10)) == [(0, "abcd")]
+
+
+def test_empty_stream_yields_nothing():
+    assert list(iter_windows([], 100, 10)) == []
+    assert list(iter_windows(["", ""], 100, 10)) == []
+
+
+def test_no_redundant_tail_window():
+    # 100 chars with window 50 / overlap 10: windows at 0 and 40 cover up to 90,
+    # the tail 80..100 contains 10 new characters and must be emitted.
+    offsets = [o for o, _ in iter_windows(["y" * 100], 50, 10)]
+    assert offsets == [0, 40, 80]
+
+    # Exactly one full window: nothing left to scan afterwards.
+    assert [o for o, _ in iter_windows(["y" * 50], 50, 10)] == [0]
+
+
+@pytest.mark.parametrize("window_size, overlap", [(0, 0), (10, 10), (10, -1)])
+def test_invalid_window_configuration(window_size, overlap):
+    with pytest.raises(ConfigurationError):
+        list(iter_windows(["abc"], window_size, overlap))
+
+
+@pytest.mark.asyncio
+async def test_async_windows_match_sync_windows():
+    text = "abcdefghij" * 20
+    chunks = _split(text, 6)
+
+    async def source() -> AsyncIterator[str]:
+        for chunk in chunks:
+            yield chunk
+
+    expected = list(iter_windows(chunks, 30, 4))
+    from_async = [w async for w in aiter_windows(source(), 30, 4)]
+    from_sync = [w async for w in aiter_windows(chunks, 30, 4)]
+
+    assert from_async == expected
+    assert from_sync == expected
+
+
+def test_file_text_decodes_multibyte_characters_across_chunks(tmp_path):
+    text = "Grüße aus Köln. " * 50
+    path = tmp_path / "doc.txt"
+    path.write_text(text, encoding="utf-8")
+
+    # A chunk size of 7 bytes splits many of the two-byte characters.
+    assert "".join(iter_file_text(path, "utf-8", 7)) == text
+
+
+def test_file_text_handles_empty_files(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+
+    assert list(iter_file_text(path, "utf-8", 64)) == []
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from deconvolute import CanaryDetector
@@ -213,3 +215,23 @@ async def test_async_clean_flow() -> None:
 
     cleaned = await canary.a_clean(response, token)
     assert cleaned == "Text"
+
+
+def test_canary_results_are_not_cacheable() -> None:
+    """Verdicts depend on the per-request token, so there is no fingerprint."""
+    assert CanaryDetector().fingerprint() is None
+
+
+@pytest.mark.asyncio
+async def test_async_methods_skip_the_executor() -> None:
+    """Cheap canary checks should run inline on the event loop."""
+    canary = CanaryDetector()
+    _, token = canary.inject("sys")
+
+    with patch.object(canary, "_run_in_executor") as offload:
+        result = await canary.a_check(f"Safe. {token}", token=token)
+        cleaned = await canary.a_clean(f"Text {token}", token)
+
+    offload.assert_not_called()
+    assert result.safe is True
+    assert cleaned == "Text"
@@ -26,7 +26,7 @@ def mock_lingua(mocker):
     )
 
     # 3. Setup the side effect for detection logic
-    def side_effect_detect(text):
+    def side_effect_detect(text: str) -> object:
         if "french" in text.lower() or "bonjour" in text.lower():
             # Simulate French detection
             mock_res = mocker.MagicMock()
@@ -41,6 +41,9 @@ def mock_lingua(mocker):
         return None  # Simulate unknown
 
     mock_detector_instance.detect_language_of.side_effect = side_effect_detect
+    mock_detector_instance.detect_languages_in_parallel_of.side_effect = lambda texts: [
+        side_effect_detect(text) for text in texts
+    ]
 
     # Return the builder mock so tests can check calls if needed
     return mock_builder
@@ -238,3 +241,40 @@ async def test_a_check_works_async(mock_lingua):
 
     assert result.detected_language == "en"
     assert result.threat_detected is False
+
+
+def test_check_batch_uses_parallel_detection(mock_lingua):
+    detector = LanguageDetector(allowed_languages=["en"])
+    contents = ["Hello (english)", "Bonjour (french)", "   "]
+
+    results = detector.check_batch(contents)
+
+    instance = mock_lingua.from_all_languages.return_value.build.return_value
+    instance.detect_languages_in_parallel_of.assert_called_once_with(contents)
+    assert [r.threat_detected for r in results] == [False, True, False]
+    for batched, content in zip(results, contents, strict=True):
+        single = detector.check(content)
+        assert batched.model_dump(exclude={"timestamp"}) == single.model_dump(
+            exclude={"timestamp"}
+        )
+
+
+def test_check_batch_detects_reference_once(mock_lingua):
+    detector = LanguageDetector()
+    instance = mock_lingua.from_all_languages.return_value.build.return_value
+
+    results = detector.check_batch(
+        ["Hello (english)", "Bonjour (french)"], reference_text="Hi (english)"
+    )
+
+    assert instance.detect_language_of.call_count == 1
+    assert [r.threat_detected for r in results] == [False, True]
+    assert results[1].metadata["reason"] == "correspondence_mismatch"
+
+
+def test_fingerprint_reflects_policy(mock_lingua):
+    en = LanguageDetector(allowed_languages=["en"])
+    fr = LanguageDetector(allowed_languages=["fr"])
+
+    assert en.fingerprint() == LanguageDetector(allowed_languages=["EN"]).fingerprint()
+    assert en.fingerprint() != fr.fingerprint()
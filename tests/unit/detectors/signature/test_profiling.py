@@ -0,0 +1,97 @@
+import pytest
+
+from deconvolute.detectors.content.signature.engine import SignatureDetector
+from deconvolute.detectors.content.signature.source import split_rules
+from deconvolute.errors import ConfigurationError
+
+RULES = """
+import "math"
+
+rule Specific : tag_one {
+    meta:
+        description = "braces { in strings } are skipped"
+    strings:
+        $kw = "keyword_one"
+        $alt = "keyword_alt"
+    condition:
+        any of them
+}
+
+// rule Commented { condition: true }
+
+rule Weak {
+    strings:
+        $a = "a"
+    condition:
+        $a
+}
+
+rule Dependent {
+    condition:
+        Specific and math.entropy(0, filesize) >= 0
+}
+"""
+
+CORPUS = [
+    "keyword_one and keyword_one again",
+    b"a banana",
+    "nothing to see",
+]
+
+
+@pytest.fixture
+def detector(tmp_path):
+    rule_file = tmp_path / "custom.yar"
+    rule_file.write_text(RULES)
+    return SignatureDetector(rules_path=rule_file)
+
+
+def test_profile_counts_matches_per_rule_and_string(detector):
+    report = detector.profile(CORPUS)
+
+    assert report.documents == 3
+    assert report.bytes == sum(len(d) for d in CORPUS)
+    rules = {r.rule: r for r in report.rules}
+    assert set(rules) == {"Specific", "Weak", "Dependent"}
+
+    specific = rules["Specific"]
+    assert specific.name == "custom.yar:Specific"
+    assert specific.documents == 1
+    assert [(s.identifier, s.hits, s.documents) for s in specific.strings] == [
+        ("$kw", 2, 1),
+        ("$alt", 0, 0),
+    ]
+    assert (rules["Weak"].documents, rules["Weak"].hits) == (2, 7)
+
+
+def test_profile_flags_weak_strings_and_untimeable_rules(detector):
+    report = detector.profile(CORPUS, repeat=2)
+
+    weak = report.weak_strings()
+    assert [(r.rule, s.identifier) for r, s in weak] == [("Weak", "$a")]
+    assert any("slow down scanning" in w for w in weak[0][0].warnings)
+
+    # References another rule, so it cannot be compiled on its own.
+    assert report.rules[-1].rule == "Dependent"
+    assert report.rules[-1].scan_ms is None
+    assert all(r.scan_ms is not None and r.scan_ms >= 0 for r in report.rules[:-1])
+
+    text = report.format(top=2)
+    assert "custom.yar:Dependent" not in text
+    assert "custom.yar:Weak:$a" in text
+
+
+def test_profile_without_rules_raises(tmp_path):
+    detector = SignatureDetector(rules_path=tmp_path)
+
+    with pytest.raises(ConfigurationError, match="No rules"):
+        detector.profile(["text"])
+
+
+def test_split_rules_skips_comments_and_strings():
+    rules = split_rules(RULES)
+
+    assert [r.identifier for r in rules] == ["Specific", "Weak", "Dependent"]
+    assert rules[0].text.rstrip().endswith("any of them\n}")
+    assert rules[0].string_identifiers() == ["$kw", "$alt"]
+    assert (rules[0].section("condition") or "").strip() == "any of them"